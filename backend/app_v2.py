@@ -4,14 +4,15 @@ Phase 1: Core structure with JWT auth and scoped storage.
 Phase 4: Added lazy loading support for resource optimization.
 """
 
+import json
 import os
 from pathlib import Path
-from typing import List
+from typing import List, Literal, Optional, AsyncIterator
 from datetime import datetime
 
-from fastapi import FastAPI, Depends, UploadFile, File, HTTPException, status
+from fastapi import FastAPI, Depends, UploadFile, File, Header, HTTPException, Query, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 from backend.core.logging_config import get_logger
 from backend.core.security_config import security_config
@@ -23,16 +24,28 @@ from backend.core.auth import (
     TokenData
 )
 from backend.core.scoped_storage import ScopedStorage, ScopedPathBuilder
+from backend.core.async_storage import AsyncScopedStorage
+from backend.core.resumable_uploads import ResumableUploadManager, UploadSession
+from backend.core.downloads import build_download_response
+from backend.core.rate_limiter import RateLimiter, RateLimitMiddleware
+from backend.core.compression import measure_stored_file
+from backend.core.transcription_jobs import TranscriptionJob, TranscriptionJobQueue, STATUS_COMPLETED
 from backend.core.scoped_rag import scoped_rag
+from backend.core.semantic_cache import semantic_cache
+from backend.core.context_assembler import context_assembler, AssembledContext
 from backend.core.async_operations import llm_runner, transcription_runner
 from backend.core.exceptions import (
     StorageError,
+    FileTooLargeError,
+    UploadOffsetError,
+    UploadSessionNotFoundError,
     RAGError,
     TranscriptionError,
+    TranscriptionJobNotFoundError,
     raise_not_found,
     raise_bad_request
 )
-from backend.core.llm import run_inference
+from backend.core.llm import run_inference, inference_scheduler
 from backend.core.llm.model_registry import list_models, DEFAULT_MODEL
 
 # Lazy loading support - when heavy modules are added, import like:
@@ -45,11 +58,16 @@ from backend.schemas_v2 import (
     TokenResponse,
     ChatRequest,
     ChatResponse,
+    OwnerChatResponse,
     TranscribeRequest,
     TranscribeResponse,
+    TranscriptionJobResponse,
+    TranscriptionJobListResponse,
     TrainRequest,
     TrainResponse,
     UploadResponse,
+    UploadSessionRequest,
+    UploadSessionResponse,
     FileListResponse,
     FileInfoResponse,
     DeleteResponse,
@@ -57,6 +75,7 @@ from backend.schemas_v2 import (
     SystemStatus,
     LLMStatus,
     TranscriptionStatus,
+    InferenceQueueStatus,
     RefreshTokenRequest,
     ModelsResponse,
     ModelInfo
@@ -72,6 +91,10 @@ app = FastAPI(
     version="0.1.0"
 )
 
+# Rate limiting (added first so CORS headers also reach 429 responses)
+rate_limiter = RateLimiter()
+app.add_middleware(RateLimitMiddleware, limiter=rate_limiter)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -81,8 +104,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize storage
-storage = ScopedStorage()
+# Initialize storage (file I/O runs on a bounded thread pool, off the event loop)
+storage = AsyncScopedStorage(ScopedStorage())
+resumable_uploads = ResumableUploadManager(storage)
+# Transcriptions run as persisted jobs on the runner's worker processes
+transcription_jobs = TranscriptionJobQueue(storage, transcription_runner)
 
 logger.info(f"CyberSeed Backend starting in {security_config.environment} mode")
 
@@ -123,6 +149,186 @@ def sanitize_text(text: str, max_length: int = 50000) -> str:
     return text
 
 
+def build_rag_prompt(query: str, context: Optional[AssembledContext] = None) -> str:
+    """
+    Build an LLM prompt from a user query and assembled context.
+    
+    Chunk text is normalized when the index is built and the context is
+    already bounded by the assembler's token budget, so only the query
+    is sanitized here.
+    
+    Args:
+        query: Raw user query
+        context: Context assembled from retrieved chunks
+    
+    Returns:
+        Prompt with context and sanitized question
+    """
+    # Sanitize user query to prevent prompt injection
+    sanitized_query = sanitize_text(query, max_length=10000)
+    
+    if context is None or not context.sections:
+        return sanitized_query
+    
+    context_text = "\n\n".join([
+        f"Context {i+1}:\n{section.text}"
+        for i, section in enumerate(context.sections)
+    ])
+    return f"Context information:\n{context_text}\n\nQuestion: {sanitized_query}\n\nAnswer based on the context provided:"
+
+
+async def iter_upload_file(file: UploadFile, chunk_size: int) -> AsyncIterator[bytes]:
+    """
+    Read an uploaded file in fixed-size chunks.
+    
+    Args:
+        file: Uploaded file
+        chunk_size: Bytes per chunk
+    
+    Yields:
+        File content chunks
+    """
+    while True:
+        chunk = await file.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+
+def file_info_response(file_info) -> FileInfoResponse:
+    """
+    Convert a stored FileInfo into its API response model.
+    
+    Args:
+        file_info: FileInfo from scoped storage
+    
+    Returns:
+        FileInfoResponse
+    """
+    return FileInfoResponse(
+        filename=file_info.filename,
+        size=file_info.size,
+        created_at=file_info.created_at.isoformat(),
+        category=file_info.category,
+        content_hash=file_info.content_hash,
+        physical_size=file_info.physical_size
+    )
+
+
+def upload_session_response(session: UploadSession) -> UploadSessionResponse:
+    """
+    Convert a resumable upload session into its API response model.
+    
+    Args:
+        session: Upload session
+    
+    Returns:
+        UploadSessionResponse
+    """
+    return UploadSessionResponse(
+        upload_id=session.upload_id,
+        filename=session.filename,
+        size=session.size,
+        offset=session.offset,
+        expires_at=datetime.fromtimestamp(session.expires_at).isoformat()
+    )
+
+
+def _isoformat(timestamp: Optional[float]) -> Optional[str]:
+    """Format an optional epoch timestamp."""
+    return datetime.fromtimestamp(timestamp).isoformat() if timestamp is not None else None
+
+
+def transcription_job_response(job: TranscriptionJob) -> TranscriptionJobResponse:
+    """
+    Convert a transcription job into its API response model.
+    
+    Args:
+        job: Transcription job
+    
+    Returns:
+        TranscriptionJobResponse
+    """
+    return TranscriptionJobResponse(
+        job_id=job.job_id,
+        status=job.status,
+        progress=job.progress,
+        file_path=job.file_path,
+        model=job.model,
+        language=job.language,
+        cancel_requested=job.cancel_requested,
+        error=job.error,
+        text_path=job.transcript_path,
+        created_at=_isoformat(job.created_at),
+        started_at=_isoformat(job.started_at),
+        finished_at=_isoformat(job.finished_at)
+    )
+
+
+def resolve_upload_path(owner_id: str, soul_id: str, file_path: str) -> Path:
+    """
+    Resolve an audio file reference to a file in the soul's uploads.
+    
+    Accepts a bare upload filename or a path inside the soul's uploads
+    directory, so jobs never read files outside the caller's scope.
+    
+    Args:
+        owner_id: Owner identifier
+        soul_id: Soul identifier
+        file_path: Filename or path of the uploaded file
+    
+    Returns:
+        Absolute path of the uploaded file
+    """
+    uploads_path = storage.path_builder.get_category_path(
+        owner_id, soul_id, ScopedPathBuilder.CATEGORY_UPLOADS
+    ).resolve()
+    candidate = Path(file_path)
+    if not candidate.is_absolute():
+        candidate = uploads_path / candidate
+    candidate = candidate.resolve()
+    
+    if candidate.parent != uploads_path or not candidate.is_file():
+        raise_not_found("Audio file not found in this soul's uploads")
+    return candidate
+
+
+def raise_offset_conflict(error: UploadOffsetError) -> None:
+    """Raise a 409 carrying the offset the client must resume from."""
+    raise HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail=str(error),
+        headers={"Upload-Offset": str(error.current_offset)}
+    )
+
+
+async def upload_size_limit(owner_id: str, exclude_upload_id: Optional[str] = None) -> int:
+    """
+    Get the largest upload an owner may store right now.
+    
+    Args:
+        owner_id: Owner identifier
+        exclude_upload_id: Resumable upload whose own reservation is not counted
+    
+    Returns:
+        Size limit in bytes (the upload limit capped by the remaining quota,
+        less the sizes reserved by resumable uploads in progress)
+    
+    Raises:
+        HTTPException: If the owner's storage quota is exhausted
+    """
+    max_size = security_config.max_upload_size_mb * 1024 * 1024
+    remaining = await storage.remaining_quota(
+        owner_id, security_config.storage_quota_mb_per_owner * 1024 * 1024
+    )
+    if remaining is None:
+        return max_size
+    remaining -= await resumable_uploads.reserved_bytes(owner_id, exclude_upload_id)
+    if remaining <= 0:
+        raise_bad_request("Storage quota exceeded")
+    return min(max_size, remaining)
+
+
 # ==================
 # Health & Status Endpoints
 # ==================
@@ -154,6 +360,13 @@ async def llm_status():
     return LLMStatus(**llm_runner.check_status())
 
 
+@app.get("/status/inference", response_model=InferenceQueueStatus, tags=["Status"])
+async def inference_queue_status(current_user: TokenData = Depends(get_current_user)):
+    """Get inference queue metrics (admins see every owner, owners only themselves)."""
+    owner_id = None if current_user.role == "admin" else current_user.owner_id
+    return InferenceQueueStatus(**inference_scheduler.get_stats(owner_id))
+
+
 @app.get("/status/soul/{owner_id}/{soul_id}", response_model=SoulStatus, tags=["Status"])
 async def soul_status(
     owner_id: str,
@@ -168,7 +381,7 @@ async def soul_status(
             detail="Access denied to this owner's data"
         )
     
-    storage_stats = storage.get_storage_stats(owner_id, soul_id)
+    storage_stats = await storage.get_storage_stats(owner_id, soul_id)
     rag_status = scoped_rag.check_index_status(owner_id, soul_id)
     
     return SoulStatus(
@@ -268,31 +481,19 @@ async def upload_files(
     
     try:
         for file in files:
-            # Check file size
-            content = await file.read()
-            file_size = len(content)
-            
-            if file_size > security_config.max_upload_size_mb * 1024 * 1024:
-                raise_bad_request(f"File {file.filename} exceeds maximum upload size")
-            
-            # Reset file pointer
-            await file.seek(0)
+            max_size = await upload_size_limit(owner_id)
             
-            # Save file
-            file_info = storage.save_file(
+            # Stream to disk in fixed-size chunks, enforcing the size limit as we go
+            file_info = await storage.save_stream(
                 owner_id=owner_id,
                 soul_id=soul_id,
-                file_content=file.file,
+                chunks=iter_upload_file(file, AsyncScopedStorage.STREAM_CHUNK_SIZE),
                 filename=file.filename,
-                category=ScopedPathBuilder.CATEGORY_UPLOADS
+                category=ScopedPathBuilder.CATEGORY_UPLOADS,
+                max_size=max_size
             )
             
-            uploaded_files.append(FileInfoResponse(
-                filename=file_info.filename,
-                size=file_info.size,
-                created_at=file_info.created_at.isoformat(),
-                category=file_info.category
-            ))
+            uploaded_files.append(file_info_response(file_info))
             total_size += file_info.size
         
         logger.info(f"Uploaded {len(files)} files for {owner_id}/{soul_id}")
@@ -302,12 +503,228 @@ async def upload_files(
             count=len(uploaded_files),
             total_size=total_size
         )
+    except FileTooLargeError as e:
+        raise_bad_request(str(e))
+    except StorageError as e:
+        logger.error(f"File upload failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"File upload failed: {str(e)}"
+        )
+
+
+@app.put("/souls/{owner_id}/{soul_id}/upload/{filename}", response_model=FileInfoResponse, tags=["Storage"])
+async def upload_file_stream(
+    owner_id: str,
+    soul_id: str,
+    filename: str,
+    request: Request,
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Upload a single file as the raw request body.
+    
+    The body is streamed straight to disk without multipart spooling, so
+    memory use per upload is bounded by one chunk.
+    """
+    # Verify access
+    if current_user.owner_id != owner_id and current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied to this owner's data"
+        )
+    
+    if Path(filename).name != filename or filename.startswith("."):
+        raise_bad_request("Invalid filename")
+    
+    max_size = await upload_size_limit(owner_id)
+    
+    # Reject early when the client declares an oversized body
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > max_size:
+        raise_bad_request(f"File {filename} exceeds maximum upload size")
+    
+    try:
+        file_info = await storage.save_stream(
+            owner_id=owner_id,
+            soul_id=soul_id,
+            chunks=request.stream(),
+            filename=filename,
+            category=ScopedPathBuilder.CATEGORY_UPLOADS,
+            max_size=max_size
+        )
+    except FileTooLargeError as e:
+        raise_bad_request(str(e))
     except StorageError as e:
         logger.error(f"File upload failed: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"File upload failed: {str(e)}"
         )
+    
+    logger.info(f"Streamed upload {filename} for {owner_id}/{soul_id}")
+    
+    return file_info_response(file_info)
+
+
+@app.post("/souls/{owner_id}/{soul_id}/uploads", response_model=UploadSessionResponse, tags=["Storage"])
+async def create_upload_session(
+    owner_id: str,
+    soul_id: str,
+    request: UploadSessionRequest,
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Start a resumable upload.
+    
+    Send the file with PATCH requests carrying an Upload-Offset header, then
+    finalize the session. Interrupted transfers resume from the offset
+    reported by GET.
+    """
+    # Verify access
+    if current_user.owner_id != owner_id and current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied to this owner's data"
+        )
+    
+    if Path(request.filename).name != request.filename or request.filename.startswith("."):
+        raise_bad_request("Invalid filename")
+    
+    if request.size > await upload_size_limit(owner_id):
+        raise_bad_request(f"File {request.filename} exceeds maximum upload size")
+    
+    try:
+        session = await resumable_uploads.create_session(
+            owner_id, soul_id, request.filename, request.size,
+            security_config.storage_quota_mb_per_owner * 1024 * 1024
+        )
+    except FileTooLargeError as e:
+        raise_bad_request(str(e))
+    except (OSError, StorageError) as e:
+        logger.error(f"Upload session creation failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Upload session creation failed: {str(e)}"
+        )
+    
+    return upload_session_response(session)
+
+
+@app.get("/souls/{owner_id}/{soul_id}/uploads/{upload_id}", response_model=UploadSessionResponse, tags=["Storage"])
+async def get_upload_session(
+    owner_id: str,
+    soul_id: str,
+    upload_id: str,
+    current_user: TokenData = Depends(get_current_user)
+):
+    """Get the offset a resumable upload continues from."""
+    # Verify access
+    if current_user.owner_id != owner_id and current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied to this owner's data"
+        )
+    
+    try:
+        session = await resumable_uploads.get_session(owner_id, soul_id, upload_id)
+    except UploadSessionNotFoundError as e:
+        raise_not_found(str(e))
+    
+    return upload_session_response(session)
+
+
+@app.patch("/souls/{owner_id}/{soul_id}/uploads/{upload_id}", response_model=UploadSessionResponse, tags=["Storage"])
+async def append_upload_chunk(
+    owner_id: str,
+    soul_id: str,
+    upload_id: str,
+    request: Request,
+    upload_offset: int = Header(..., alias="Upload-Offset", ge=0),
+    current_user: TokenData = Depends(get_current_user)
+):
+    """Append the raw request body to a resumable upload at Upload-Offset."""
+    # Verify access
+    if current_user.owner_id != owner_id and current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied to this owner's data"
+        )
+    
+    try:
+        session = await resumable_uploads.append_chunk(
+            owner_id, soul_id, upload_id, upload_offset, request.stream()
+        )
+    except UploadSessionNotFoundError as e:
+        raise_not_found(str(e))
+    except UploadOffsetError as e:
+        raise_offset_conflict(e)
+    except FileTooLargeError as e:
+        raise_bad_request(str(e))
+    
+    return upload_session_response(session)
+
+
+@app.post("/souls/{owner_id}/{soul_id}/uploads/{upload_id}/finalize", response_model=FileInfoResponse, tags=["Storage"])
+async def finalize_upload(
+    owner_id: str,
+    soul_id: str,
+    upload_id: str,
+    current_user: TokenData = Depends(get_current_user)
+):
+    """Commit a completely received resumable upload to the soul's uploads."""
+    # Verify access
+    if current_user.owner_id != owner_id and current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied to this owner's data"
+        )
+    
+    try:
+        session = await resumable_uploads.get_session(owner_id, soul_id, upload_id)
+        if session.size > await upload_size_limit(owner_id, upload_id):
+            raise_bad_request("Storage quota exceeded")
+        file_info = await resumable_uploads.finalize(owner_id, soul_id, upload_id)
+    except UploadSessionNotFoundError as e:
+        raise_not_found(str(e))
+    except UploadOffsetError as e:
+        raise_offset_conflict(e)
+    except StorageError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"File upload failed: {str(e)}"
+        )
+    
+    return file_info_response(file_info)
+
+
+@app.delete("/souls/{owner_id}/{soul_id}/uploads/{upload_id}", response_model=DeleteResponse, tags=["Storage"])
+async def abort_upload(
+    owner_id: str,
+    soul_id: str,
+    upload_id: str,
+    current_user: TokenData = Depends(get_current_user)
+):
+    """Cancel a resumable upload and discard its received bytes."""
+    # Verify access
+    if current_user.owner_id != owner_id and current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied to this owner's data"
+        )
+    
+    try:
+        removed = await resumable_uploads.abort(owner_id, soul_id, upload_id)
+    except UploadSessionNotFoundError as e:
+        raise_not_found(str(e))
+    
+    if not removed:
+        raise_not_found("Upload session not found")
+    
+    return DeleteResponse(
+        success=True,
+        message=f"Upload {upload_id} aborted"
+    )
 
 
 @app.get("/souls/{owner_id}/{soul_id}/files", response_model=FileListResponse, tags=["Storage"])
@@ -315,9 +732,19 @@ async def list_files(
     owner_id: str,
     soul_id: str,
     category: str = None,
+    limit: Optional[int] = Query(default=None, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    sort: Literal["name", "size", "created_at"] = "name",
+    order: Literal["asc", "desc"] = "asc",
     current_user: TokenData = Depends(get_current_user)
 ):
-    """List files in soul storage."""
+    """
+    List files in soul storage.
+    
+    Without a limit every file is returned. With a limit the files come one
+    page at a time; pass the returned next_cursor to fetch the following page.
+    count and total_size always cover all matching files.
+    """
     # Verify access
     if current_user.owner_id != owner_id and current_user.role != "admin":
         raise HTTPException(
@@ -325,27 +752,70 @@ async def list_files(
             detail="Access denied to this owner's data"
         )
     
-    files = storage.list_files(owner_id, soul_id, category)
-    
-    file_responses = [
-        FileInfoResponse(
-            filename=f.filename,
-            size=f.size,
-            created_at=f.created_at.isoformat(),
-            category=f.category
+    try:
+        files, next_cursor = await storage.list_files_page(
+            owner_id, soul_id, category, limit, cursor, sort, order == "desc"
         )
-        for f in files
-    ]
+    except ValueError as e:
+        raise_bad_request(str(e))
+    
+    file_responses = [file_info_response(f) for f in files]
     
-    total_size = sum(f.size for f in files)
+    if next_cursor is None and cursor is None:
+        count, total_size = len(files), sum(f.size for f in files)
+    else:
+        count, total_size = await storage.count_files(owner_id, soul_id, category)
     
     return FileListResponse(
         files=file_responses,
-        count=len(files),
-        total_size=total_size
+        count=count,
+        total_size=total_size,
+        next_cursor=next_cursor
     )
 
 
+@app.api_route("/souls/{owner_id}/{soul_id}/files/{filename}/download", methods=["GET", "HEAD"], tags=["Storage"])
+async def download_file(
+    owner_id: str,
+    soul_id: str,
+    filename: str,
+    category: str,
+    request: Request,
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Download a stored file.
+    
+    Supports Range requests (for seeking in audio) and conditional GET via
+    If-None-Match / If-Modified-Since.
+    """
+    # Verify access
+    if current_user.owner_id != owner_id and current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied to this owner's data"
+        )
+    
+    if category not in (
+        ScopedPathBuilder.CATEGORY_UPLOADS,
+        ScopedPathBuilder.CATEGORY_TRANSCRIPTS,
+        ScopedPathBuilder.CATEGORY_INDEX,
+    ):
+        raise_bad_request("Invalid category")
+    
+    if Path(filename).name != filename or filename.startswith("."):
+        raise_bad_request("Invalid filename")
+    
+    file_info = await storage.get_file_info(owner_id, soul_id, filename, category)
+    if file_info is None:
+        raise_not_found("File not found")
+    
+    try:
+        return await storage.run(build_download_response, request, file_info)
+    except FileNotFoundError:
+        raise_not_found("File not found")
+
+
 @app.delete("/souls/{owner_id}/{soul_id}/files/{filename}", response_model=DeleteResponse, tags=["Storage"])
 async def delete_file(
     owner_id: str,
@@ -362,7 +832,7 @@ async def delete_file(
             detail="Access denied to this owner's data"
         )
     
-    success = storage.delete_file(owner_id, soul_id, filename, category)
+    success = await storage.delete_file(owner_id, soul_id, filename, category)
     
     if not success:
         raise_not_found("File not found")
@@ -387,7 +857,11 @@ async def delete_soul_data(
             detail="Access denied to this owner's data"
         )
     
-    success = storage.delete_soul_data(owner_id, soul_id)
+    success = await storage.delete_soul_data(owner_id, soul_id)
+    scoped_rag.invalidate(owner_id, soul_id)
+    semantic_cache.invalidate(owner_id, soul_id)
+    await transcription_jobs.forget(owner_id, soul_id)
+    await resumable_uploads.forget(owner_id, soul_id)
     
     if not success:
         raise_not_found("Soul data not found")
@@ -413,7 +887,11 @@ async def delete_owner_data(
             detail="Access denied to this owner's data"
         )
     
-    success = storage.delete_owner_data(owner_id)
+    success = await storage.delete_owner_data(owner_id)
+    scoped_rag.invalidate(owner_id)
+    semantic_cache.invalidate(owner_id)
+    await transcription_jobs.forget(owner_id)
+    await resumable_uploads.forget(owner_id)
     
     if not success:
         raise_not_found("Owner data not found")
@@ -452,14 +930,77 @@ async def get_models():
     )
 
 
-@app.post("/souls/{owner_id}/{soul_id}/transcribe", response_model=TranscribeResponse, tags=["Core"])
+@app.post(
+    "/souls/{owner_id}/{soul_id}/transcribe",
+    response_model=TranscriptionJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    tags=["Core"]
+)
 async def transcribe_audio(
     owner_id: str,
     soul_id: str,
     request: TranscribeRequest,
     current_user: TokenData = Depends(get_current_user)
 ):
-    """Transcribe audio file."""
+    """Queue transcription of an uploaded audio file."""
+    # Verify access
+    if current_user.owner_id != owner_id and current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied to this owner's data"
+        )
+    
+    audio_path = await storage.run(resolve_upload_path, owner_id, soul_id, request.file_path)
+    
+    # Uploads are content-hashed on write; hash uncataloged files now
+    file_info = await storage.get_file_info(
+        owner_id, soul_id, audio_path.name, ScopedPathBuilder.CATEGORY_UPLOADS
+    )
+    content_hash = file_info.content_hash if file_info else None
+    if content_hash is None:
+        _, content_hash = await storage.run(measure_stored_file, audio_path)
+    
+    job = await transcription_jobs.submit(
+        owner_id, soul_id, audio_path.name, request.model, request.language, content_hash
+    )
+    return transcription_job_response(job)
+
+
+@app.get(
+    "/souls/{owner_id}/{soul_id}/transcriptions",
+    response_model=TranscriptionJobListResponse,
+    tags=["Core"]
+)
+async def list_transcription_jobs(
+    owner_id: str,
+    soul_id: str,
+    limit: int = Query(50, ge=1, le=500),
+    current_user: TokenData = Depends(get_current_user)
+):
+    """List a soul's most recent transcription jobs."""
+    # Verify access
+    if current_user.owner_id != owner_id and current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied to this owner's data"
+        )
+    
+    jobs = await transcription_jobs.list_jobs(owner_id, soul_id, limit)
+    return TranscriptionJobListResponse(jobs=[transcription_job_response(job) for job in jobs])
+
+
+@app.get(
+    "/souls/{owner_id}/{soul_id}/transcriptions/{job_id}",
+    response_model=TranscriptionJobResponse,
+    tags=["Core"]
+)
+async def get_transcription_job(
+    owner_id: str,
+    soul_id: str,
+    job_id: str,
+    current_user: TokenData = Depends(get_current_user)
+):
+    """Get status and progress of a transcription job."""
     # Verify access
     if current_user.owner_id != owner_id and current_user.role != "admin":
         raise HTTPException(
@@ -468,40 +1009,117 @@ async def transcribe_audio(
         )
     
     try:
-        # Perform transcription (placeholder in Phase 1)
-        result = await transcription_runner.transcribe(
-            file_path=request.file_path,
-            model=request.model,
-            language=request.language
+        job = await transcription_jobs.get_job(owner_id, soul_id, job_id)
+    except TranscriptionJobNotFoundError as e:
+        raise_not_found(str(e))
+    return transcription_job_response(job)
+
+
+@app.get("/souls/{owner_id}/{soul_id}/transcriptions/{job_id}/events", tags=["Core"])
+async def stream_transcription_job(
+    owner_id: str,
+    soul_id: str,
+    job_id: str,
+    current_user: TokenData = Depends(get_current_user)
+):
+    """
+    Stream a transcription job as Server-Sent Events.
+    
+    Emits `progress` events, a `segment` event (id, start, end, text) for
+    every segment as soon as it is decoded (segments produced before the
+    client connected are replayed first) and a final `done` event with the
+    job summary.
+    """
+    # Verify access
+    if current_user.owner_id != owner_id and current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied to this owner's data"
         )
-        
-        # Save transcript to storage
-        transcript_path = storage.path_builder.get_category_path(
-            owner_id, soul_id, ScopedPathBuilder.CATEGORY_TRANSCRIPTS
+    
+    try:
+        await transcription_jobs.get_job(owner_id, soul_id, job_id)
+    except TranscriptionJobNotFoundError as e:
+        raise_not_found(str(e))
+    
+    async def event_stream() -> AsyncIterator[str]:
+        async for event, data in transcription_jobs.stream_events(owner_id, soul_id, job_id):
+            if data is None:
+                yield f": {event}\n\n"
+            else:
+                yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"cache-control": "no-cache", "x-accel-buffering": "no"}
+    )
+
+
+@app.post(
+    "/souls/{owner_id}/{soul_id}/transcriptions/{job_id}/cancel",
+    response_model=TranscriptionJobResponse,
+    tags=["Core"]
+)
+async def cancel_transcription_job(
+    owner_id: str,
+    soul_id: str,
+    job_id: str,
+    current_user: TokenData = Depends(get_current_user)
+):
+    """Cancel a queued or running transcription job."""
+    # Verify access
+    if current_user.owner_id != owner_id and current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied to this owner's data"
         )
-        transcript_path.mkdir(parents=True, exist_ok=True)
-        
-        # Generate transcript filename
-        filename = Path(request.file_path).stem + "_transcript.txt"
-        text_path = transcript_path / filename
-        
-        # Save transcript text
-        with open(text_path, "w") as f:
-            f.write(result["text"])
-        
-        logger.info(f"Transcribed audio for {owner_id}/{soul_id}: {request.file_path}")
-        
-        return TranscribeResponse(
-            text=result["text"],
-            segments=result["segments"],
-            text_path=str(text_path)
+    
+    try:
+        job = await transcription_jobs.cancel(owner_id, soul_id, job_id)
+    except TranscriptionJobNotFoundError as e:
+        raise_not_found(str(e))
+    return transcription_job_response(job)
+
+
+@app.get(
+    "/souls/{owner_id}/{soul_id}/transcriptions/{job_id}/result",
+    response_model=TranscribeResponse,
+    tags=["Core"]
+)
+async def get_transcription_result(
+    owner_id: str,
+    soul_id: str,
+    job_id: str,
+    current_user: TokenData = Depends(get_current_user)
+):
+    """Get the transcript of a completed transcription job."""
+    # Verify access
+    if current_user.owner_id != owner_id and current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied to this owner's data"
         )
-    except Exception as e:
-        logger.error(f"Transcription failed: {e}")
+    
+    try:
+        job = await transcription_jobs.get_job(owner_id, soul_id, job_id)
+    except TranscriptionJobNotFoundError as e:
+        raise_not_found(str(e))
+    
+    if job.status != STATUS_COMPLETED:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Transcription failed: {str(e)}"
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Transcription job is {job.status}"
         )
+    
+    result = job.result_data()
+    return TranscribeResponse(
+        text=result["text"],
+        segments=result["segments"],
+        text_path=job.transcript_path,
+        duration=result.get("duration"),
+        skipped_fraction=result.get("skipped_fraction")
+    )
 
 
 @app.post("/souls/{owner_id}/{soul_id}/train", response_model=TrainResponse, tags=["Core"])
@@ -533,6 +1151,8 @@ async def train_rag(
         return TrainResponse(
             success=result["success"],
             indexed_documents=result["indexed_documents"],
+            duplicate_chunks=result["duplicate_chunks"],
+            dedup_ratio=result["dedup_ratio"],
             message=result["message"]
         )
     except Exception as e:
@@ -563,42 +1183,67 @@ async def chat(
         rag_status = scoped_rag.check_index_status(owner_id, soul_id)
         has_knowledge_base = rag_status["has_index"]
         
-        # Query RAG for relevant documents
+        # Serve semantically equivalent questions from the cache
+        cache_variant = (request.model_id or DEFAULT_MODEL, request.top_k, request.include_sources)
+        use_retrieval = has_knowledge_base and request.include_sources
+        query_vector = None
+        if semantic_cache.enabled or use_retrieval:
+            query_vector = await scoped_rag.embed_query(request.query)
+        
+        if query_vector is not None:
+            hit = semantic_cache.lookup(
+                owner_id, soul_id, query_vector, rag_status["index_version"], cache_variant
+            )
+            if hit is not None:
+                logger.info(f"Chat response served from semantic cache for {owner_id}/{soul_id}")
+                return ChatResponse(
+                    response_text=hit.entry.response_text,
+                    used_docs=hit.entry.used_docs,
+                    has_knowledge_base=has_knowledge_base,
+                    total_indexed_documents=rag_status["indexed_documents"],
+                    cached=True,
+                    cache_similarity=hit.similarity
+                )
+        
+        # Query RAG for a candidate pool and assemble a diverse, budgeted context
         docs = []
-        if has_knowledge_base and request.include_sources:
-            docs = await scoped_rag.query(
+        context = None
+        if use_retrieval:
+            candidates = await scoped_rag.query(
                 owner_id=owner_id,
                 soul_id=soul_id,
                 query=request.query,
-                top_k=request.top_k
+                top_k=context_assembler.candidate_count(request.top_k),
+                query_vector=query_vector,
+                return_embeddings=True
             )
+            context = context_assembler.assemble(candidates, query_vector, request.top_k)
+            docs = context.used_docs
         
         # Build prompt with context from documents
-        # Sanitize user query to prevent prompt injection
-        sanitized_query = sanitize_text(request.query, max_length=10000)
-        
-        prompt = sanitized_query
-        if docs:
-            # Sanitize document text as well
-            sanitized_docs = [sanitize_text(doc.get('text', ''), max_length=5000) for doc in docs]
-            context_text = "\n\n".join([
-                f"Context {i+1}:\n{text}"
-                for i, text in enumerate(sanitized_docs) if text
-            ])
-            prompt = f"Context information:\n{context_text}\n\nQuestion: {sanitized_query}\n\nAnswer based on the context provided:"
+        prompt = build_rag_prompt(request.query, context)
         
         # Generate response with real LLM via run_inference
         response_text = await run_inference(
             prompt=prompt,
             history=None,
-            model_id=request.model_id
+            model_id=request.model_id,
+            owner_id=current_user.owner_id,
+            role=current_user.role
         )
         
         logger.info(f"Chat response generated for {owner_id}/{soul_id} using model {request.model_id or 'default'}")
         
+        used_docs = docs if request.include_sources else []
+        if query_vector is not None:
+            semantic_cache.store(
+                owner_id, soul_id, request.query, query_vector,
+                rag_status["index_version"], response_text, used_docs, cache_variant
+            )
+        
         return ChatResponse(
             response_text=response_text,
-            used_docs=docs if request.include_sources else [],
+            used_docs=used_docs,
             has_knowledge_base=has_knowledge_base,
             total_indexed_documents=rag_status["indexed_documents"]
         )
@@ -610,6 +1255,73 @@ async def chat(
         )
 
 
+@app.post("/owners/{owner_id}/chat", response_model=OwnerChatResponse, tags=["Core"])
+async def owner_chat(
+    owner_id: str,
+    request: ChatRequest,
+    current_user: TokenData = Depends(get_current_user)
+):
+    """Chat with RAG + LLM across all of an owner's souls."""
+    # Verify access
+    if current_user.owner_id != owner_id and current_user.role != "admin":
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Access denied to this owner's data"
+        )
+    
+    try:
+        # Query every soul index concurrently and merge into one ranking
+        owner_result = {
+            "documents": [],
+            "searched_souls": [],
+            "timed_out_souls": [],
+            "indexed_documents": 0,
+        }
+        docs = []
+        context = None
+        if request.include_sources:
+            owner_result = await scoped_rag.query_owner(
+                owner_id=owner_id,
+                query=request.query,
+                top_k=context_assembler.candidate_count(request.top_k),
+                return_embeddings=True
+            )
+            context = context_assembler.assemble(
+                owner_result["documents"], owner_result["query_vector"], request.top_k
+            )
+            docs = context.used_docs
+        
+        prompt = build_rag_prompt(request.query, context)
+        
+        response_text = await run_inference(
+            prompt=prompt,
+            history=None,
+            model_id=request.model_id,
+            owner_id=current_user.owner_id,
+            role=current_user.role
+        )
+        
+        logger.info(
+            f"Owner chat response generated for {owner_id} across "
+            f"{len(owner_result['searched_souls'])} souls using model {request.model_id or 'default'}"
+        )
+        
+        return OwnerChatResponse(
+            response_text=response_text,
+            used_docs=docs if request.include_sources else [],
+            has_knowledge_base=bool(owner_result["searched_souls"]),
+            total_indexed_documents=owner_result["indexed_documents"],
+            searched_souls=owner_result["searched_souls"],
+            timed_out_souls=owner_result["timed_out_souls"]
+        )
+    except Exception as e:
+        logger.error(f"Owner chat failed: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Owner chat failed: {str(e)}"
+        )
+
+
 # ==================
 # Startup/Shutdown Events
 # ==================
@@ -621,12 +1333,25 @@ async def startup_event():
     logger.info(f"Environment: {security_config.environment}")
     logger.info(f"Data directory: {storage.data_dir}")
     logger.info(f"CORS origins: {security_config.cors_allowed_origins}")
+    # Catalog files stored by versions without a catalog before serving listings
+    await storage.run(storage.storage.reconcile_if_empty)
+    await storage.run(storage.storage.rekey_compressed_blobs)
+    resumable_uploads.start_sweeper()
+    # Resume reclaiming anything a previous run left in the trash
+    storage.trash.schedule()
+    # Resume transcription jobs interrupted by the last shutdown
+    await transcription_jobs.start()
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """Cleanup on shutdown."""
     logger.info("CyberSeed Backend shutting down")
+    await resumable_uploads.stop_sweeper()
+    await transcription_jobs.stop()
+    transcription_runner.shutdown()
+    storage.trash.stop()
+    storage.shutdown()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,3 @@
+"""
+Reproducible performance benchmarks for the CyberSeed backend.
+"""
@@ -0,0 +1,128 @@
+"""
+Authentication overhead microbenchmark.
+
+Measures the per-request cost of the get_current_user dependency with a
+realistic traffic shape: a pool of clients, each sending its own bearer
+token over and over. It is run with full JWT verification on every call
+and with the verified-token cache, and reports mean and p50/p99 latency
+per request. Results are emitted as JSON.
+
+Usage:
+    python -m backend.benchmarks.auth_benchmark --requests 50000 --clients 100
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+from fastapi.security import HTTPAuthorizationCredentials
+
+from backend.core import auth
+from backend.core.auth import VerifiedTokenCache, create_access_token, get_current_user
+
+
+async def measure(
+    credentials: List[HTTPAuthorizationCredentials],
+    requests: int,
+    seed: int
+) -> np.ndarray:
+    """
+    Authenticate a random client's token per request.
+
+    Args:
+        credentials: One bearer credential per client
+        requests: Number of authenticated requests
+        seed: Random seed for the client order
+
+    Returns:
+        Per-request latencies in microseconds
+    """
+    rng = random.Random(seed)
+    order = [rng.randrange(len(credentials)) for _ in range(requests)]
+    latencies = np.empty(requests)
+    for i, client in enumerate(order):
+        start = time.perf_counter()
+        await get_current_user(credentials[client])
+        latencies[i] = time.perf_counter() - start
+    return latencies * 1e6
+
+
+def summarize(name: str, latencies: np.ndarray, cache: VerifiedTokenCache) -> Dict[str, Any]:
+    """Summarize one run."""
+    return {
+        "mode": name,
+        "mean_us": round(float(latencies.mean()), 2),
+        "p50_us": round(float(np.percentile(latencies, 50)), 2),
+        "p99_us": round(float(np.percentile(latencies, 99)), 2),
+        "cache": cache.get_stats(),
+    }
+
+
+async def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    """Benchmark authentication with and without the token cache."""
+    credentials = [
+        HTTPAuthorizationCredentials(
+            scheme="Bearer",
+            credentials=create_access_token(f"user-{i}", f"owner-{i}")
+        )
+        for i in range(args.clients)
+    ]
+
+    results = []
+    for name, cache_size in (("verify_every_request", 0), ("verified_token_cache", args.cache_size)):
+        auth.verified_tokens = VerifiedTokenCache(max_entries=cache_size)
+        await measure(credentials, min(1000, args.requests), args.seed)  # warm-up
+        auth.verified_tokens = VerifiedTokenCache(max_entries=cache_size)
+        latencies = await measure(credentials, args.requests, args.seed)
+        results.append(summarize(name, latencies, auth.verified_tokens))
+
+    results[1]["speedup"] = round(results[0]["mean_us"] / results[1]["mean_us"], 1)
+
+    return {
+        "benchmark": "auth",
+        "config": {
+            "requests": args.requests,
+            "clients": args.clients,
+            "cache_size": args.cache_size,
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": results,
+    }
+
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark per-request authentication overhead")
+    parser.add_argument("--requests", type=int, default=50000, help="Authenticated requests per mode")
+    parser.add_argument("--clients", type=int, default=100, help="Distinct clients (tokens)")
+    parser.add_argument("--cache-size", type=int, default=4096, help="Token cache capacity")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--output", type=str, default=None, help="Write JSON results to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None) -> None:
+    """Run the benchmark and emit JSON results."""
+    args = parse_args(argv)
+    results = asyncio.run(run_benchmark(args))
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    sys.stdout.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
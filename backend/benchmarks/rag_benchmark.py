@@ -0,0 +1,188 @@
+"""
+Retrieval benchmark for ScopedRAG.
+
+Builds a soul index from a synthetic corpus for each vector index type and
+reports build throughput, on-disk size, query latency percentiles and
+recall@k against exact search. Results are emitted as JSON.
+
+Usage:
+    python -m backend.benchmarks.rag_benchmark --documents 500 --output rag.json
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+from backend.benchmarks.synthetic import HashingEmbedder, generate_corpus, generate_queries
+from backend.core.scoped_rag import ScopedRAG
+from backend.core.scoped_storage import ScopedPathBuilder
+from backend.core.vector_index import INDEX_TYPES, FlatIndex
+
+OWNER_ID = "bench-owner"
+SOUL_ID = "bench-soul"
+
+
+def _directory_size(path: Path) -> int:
+    """Sum the sizes of all files under a directory."""
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+async def benchmark_index_type(
+    data_dir: str,
+    index_type: str,
+    queries: List[str],
+    embedder: HashingEmbedder,
+    top_k: int,
+    chunk_size: int
+) -> Dict[str, Any]:
+    """
+    Benchmark one index type on the corpus already written to data_dir.
+
+    Args:
+        data_dir: Data directory containing the corpus uploads
+        index_type: Vector index type to benchmark
+        queries: Query texts
+        embedder: Embedder shared by indexing and queries
+        top_k: Number of results per query
+        chunk_size: Words per chunk
+
+    Returns:
+        Result dictionary for the index type
+    """
+    rag = ScopedRAG(data_dir, chunk_size=chunk_size, embedder=embedder, index_type=index_type)
+    index_path = rag.path_builder.get_category_path(
+        OWNER_ID, SOUL_ID, ScopedPathBuilder.CATEGORY_INDEX
+    )
+
+    start = time.perf_counter()
+    build_result = await rag.build_index(OWNER_ID, SOUL_ID)
+    build_seconds = time.perf_counter() - start
+    chunk_count = build_result["indexed_documents"]
+
+    # Ground truth: exact search over the same stored vectors
+    exact = FlatIndex()
+    exact.load(index_path)
+
+    # Warm the loaded-index cache so latency reflects steady state
+    await rag.query(OWNER_ID, SOUL_ID, queries[0], top_k)
+
+    latencies_ms = []
+    recalls = []
+    for query in queries:
+        start = time.perf_counter()
+        docs = await rag.query(OWNER_ID, SOUL_ID, query, top_k)
+        latencies_ms.append((time.perf_counter() - start) * 1000)
+
+        expected, _ = exact.search(embedder([query])[0], top_k)
+        if len(expected):
+            found = {doc["id"] for doc in docs}
+            recalls.append(len(found.intersection(expected.tolist())) / len(expected))
+
+    return {
+        "index_type": index_type,
+        "chunks": chunk_count,
+        "build_seconds": round(build_seconds, 4),
+        "build_chunks_per_second": round(chunk_count / build_seconds, 1) if build_seconds else None,
+        "index_bytes": _directory_size(index_path),
+        "query_p50_ms": round(float(np.percentile(latencies_ms, 50)), 3),
+        "query_p99_ms": round(float(np.percentile(latencies_ms, 99)), 3),
+        f"recall_at_{top_k}": round(float(np.mean(recalls)), 4) if recalls else None,
+    }
+
+
+async def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Run the benchmark for every requested index type.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Machine-readable benchmark results
+    """
+    corpus = generate_corpus(
+        num_documents=args.documents,
+        doc_length=args.doc_length,
+        vocab_size=args.vocab_size,
+        seed=args.seed
+    )
+    queries = generate_queries(corpus, num_queries=args.queries, seed=args.seed + 1)
+    embedder = HashingEmbedder(dim=args.dim)
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="cyberseed-rag-bench-") as data_dir:
+        uploads = ScopedPathBuilder(data_dir).get_category_path(
+            OWNER_ID, SOUL_ID, ScopedPathBuilder.CATEGORY_UPLOADS
+        )
+        uploads.mkdir(parents=True)
+        for i, text in enumerate(corpus):
+            (uploads / f"doc_{i:06d}.txt").write_text(text, encoding="utf-8")
+
+        for index_type in args.index_types:
+            results.append(await benchmark_index_type(
+                data_dir, index_type, queries, embedder, args.top_k, args.chunk_size
+            ))
+
+    return {
+        "benchmark": "rag",
+        "config": {
+            "documents": args.documents,
+            "doc_length": args.doc_length,
+            "vocab_size": args.vocab_size,
+            "chunk_size": args.chunk_size,
+            "queries": args.queries,
+            "top_k": args.top_k,
+            "embedding_dim": args.dim,
+            "seed": args.seed,
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark ScopedRAG retrieval")
+    parser.add_argument("--documents", type=int, default=500, help="Number of synthetic documents")
+    parser.add_argument("--doc-length", type=int, default=400, help="Words per document")
+    parser.add_argument("--vocab-size", type=int, default=5000, help="Vocabulary size")
+    parser.add_argument("--chunk-size", type=int, default=100, help="Words per chunk")
+    parser.add_argument("--queries", type=int, default=200, help="Number of queries")
+    parser.add_argument("--top-k", type=int, default=10, help="Results per query")
+    parser.add_argument("--dim", type=int, default=256, help="Embedding dimension")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument(
+        "--index-types",
+        nargs="+",
+        default=list(INDEX_TYPES.keys()),
+        choices=list(INDEX_TYPES.keys()),
+        help="Index types to benchmark"
+    )
+    parser.add_argument("--output", type=str, default=None, help="Write JSON results to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None) -> None:
+    """Run the benchmark and emit JSON results."""
+    args = parse_args(argv)
+    results = asyncio.run(run_benchmark(args))
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    sys.stdout.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
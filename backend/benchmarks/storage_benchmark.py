@@ -0,0 +1,221 @@
+"""
+Event loop responsiveness benchmark for scoped storage.
+
+Measures /chat latency while large uploads and bulk deletes run
+concurrently, once with storage I/O executed inline on the event loop
+(the previous behaviour) and once through AsyncScopedStorage. The LLM and
+embedder are replaced with instant deterministic fakes so the numbers
+isolate storage effects. Results are emitted as JSON.
+
+Usage:
+    python -m backend.benchmarks.storage_benchmark --upload-mb 200 --delete-files 20000
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import httpx
+import numpy as np
+
+from backend import app_v2
+from backend.benchmarks.synthetic import HashingEmbedder, generate_corpus
+from backend.core.async_storage import AsyncScopedStorage
+from backend.core.scoped_rag import ScopedRAG
+from backend.core.scoped_storage import ScopedPathBuilder, ScopedStorage
+
+OWNER_ID = "dev"
+CHAT_SOUL_ID = "bench-chat"
+
+
+class InlineScopedStorage(AsyncScopedStorage):
+    """AsyncScopedStorage that runs I/O directly on the event loop."""
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        return func(*args, **kwargs)
+
+
+async def _fake_inference(**kwargs) -> str:
+    """Instant LLM stand-in."""
+    return "ok"
+
+
+def _percentiles(latencies_ms: List[float]) -> Dict[str, float]:
+    """Summarize latencies in milliseconds."""
+    if not latencies_ms:
+        return {"count": 0}
+    return {
+        "count": len(latencies_ms),
+        "p50_ms": round(float(np.percentile(latencies_ms, 50)), 3),
+        "p99_ms": round(float(np.percentile(latencies_ms, 99)), 3),
+        "max_ms": round(float(np.max(latencies_ms)), 3),
+    }
+
+
+def _prepare_data(data_dir: str, args: argparse.Namespace) -> None:
+    """Create the chat corpus and the souls that will be deleted."""
+    builder = ScopedPathBuilder(data_dir)
+
+    uploads = builder.get_category_path(OWNER_ID, CHAT_SOUL_ID, ScopedPathBuilder.CATEGORY_UPLOADS)
+    uploads.mkdir(parents=True)
+    for i, text in enumerate(generate_corpus(num_documents=50, seed=args.seed)):
+        (uploads / f"doc_{i:04d}.txt").write_text(text, encoding="utf-8")
+
+    payload = b"x" * 1024
+    for d in range(args.delete_souls):
+        soul_uploads = builder.get_category_path(
+            OWNER_ID, f"bench-delete-{d}", ScopedPathBuilder.CATEGORY_UPLOADS
+        )
+        soul_uploads.mkdir(parents=True)
+        for i in range(args.delete_files):
+            (soul_uploads / f"file_{i:06d}.bin").write_bytes(payload)
+
+
+async def _upload(client: httpx.AsyncClient, headers: Dict[str, str], index: int, size_mb: int) -> None:
+    """Stream one large upload through the raw upload endpoint."""
+    chunk = b"u" * (1024 * 1024)
+
+    async def body():
+        for _ in range(size_mb):
+            yield chunk
+
+    response = await client.put(
+        f"/souls/{OWNER_ID}/bench-upload/upload/large_{index}.bin",
+        content=body(),
+        headers=headers
+    )
+    response.raise_for_status()
+
+
+async def _delete(client: httpx.AsyncClient, headers: Dict[str, str], index: int) -> None:
+    """Delete one prepared soul."""
+    response = await client.delete(f"/souls/{OWNER_ID}/bench-delete-{index}/data", headers=headers)
+    response.raise_for_status()
+
+
+async def _chat_once(client: httpx.AsyncClient, headers: Dict[str, str]) -> float:
+    """Send one chat request and return its latency in milliseconds."""
+    start = time.perf_counter()
+    response = await client.post(
+        f"/souls/{OWNER_ID}/{CHAT_SOUL_ID}/chat",
+        json={"query": "w00001 w00002 w00003", "top_k": 3},
+        headers=headers
+    )
+    response.raise_for_status()
+    return (time.perf_counter() - start) * 1000
+
+
+async def benchmark_mode(mode: str, args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Benchmark chat latency for one storage mode.
+
+    Args:
+        mode: 'inline' or 'async'
+        args: Parsed command line arguments
+
+    Returns:
+        Result dictionary for the mode
+    """
+    with tempfile.TemporaryDirectory(prefix="cyberseed-storage-bench-") as data_dir:
+        _prepare_data(data_dir, args)
+
+        storage_cls = InlineScopedStorage if mode == "inline" else AsyncScopedStorage
+        app_v2.storage = storage_cls(ScopedStorage(data_dir))
+        app_v2.scoped_rag = ScopedRAG(data_dir, embedder=HashingEmbedder())
+        app_v2.semantic_cache.enabled = False
+        app_v2.run_inference = _fake_inference
+        # Measure storage, not the rate limiter
+        app_v2.rate_limiter.per_minute = 0
+
+        await app_v2.scoped_rag.build_index(OWNER_ID, CHAT_SOUL_ID)
+
+        transport = httpx.ASGITransport(app=app_v2.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            login = await client.post("/auth/login", json={"username": "dev", "password": "dev"})
+            headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+            idle = [await _chat_once(client, headers) for _ in range(args.chat_requests)]
+
+            load = [asyncio.create_task(_upload(client, headers, i, args.upload_mb))
+                    for i in range(args.uploads)]
+            load += [asyncio.create_task(_delete(client, headers, i))
+                     for i in range(args.delete_souls)]
+
+            start = time.perf_counter()
+            under_load = []
+            while not all(task.done() for task in load):
+                under_load.append(await _chat_once(client, headers))
+            await asyncio.gather(*load)
+            load_seconds = time.perf_counter() - start
+
+        io_workers = app_v2.storage.max_workers if mode == "async" else None
+        app_v2.storage.shutdown()
+
+    return {
+        "mode": mode,
+        "io_workers": io_workers,
+        "chat_idle": _percentiles(idle),
+        "chat_under_load": _percentiles(under_load),
+        "load_seconds": round(load_seconds, 3),
+    }
+
+
+async def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    """Run the benchmark for every requested mode."""
+    results = [await benchmark_mode(mode, args) for mode in args.modes]
+    return {
+        "benchmark": "storage",
+        "config": {
+            "uploads": args.uploads,
+            "upload_mb": args.upload_mb,
+            "delete_souls": args.delete_souls,
+            "delete_files": args.delete_files,
+            "chat_requests": args.chat_requests,
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark chat latency under storage load")
+    parser.add_argument("--uploads", type=int, default=2, help="Concurrent large uploads")
+    parser.add_argument("--upload-mb", type=int, default=100, help="Size of each upload in MiB")
+    parser.add_argument("--delete-souls", type=int, default=2, help="Souls deleted concurrently")
+    parser.add_argument("--delete-files", type=int, default=5000, help="Files in each deleted soul")
+    parser.add_argument("--chat-requests", type=int, default=50, help="Idle chat requests")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        default=["inline", "async"],
+        choices=["inline", "async"],
+        help="Storage modes to benchmark"
+    )
+    parser.add_argument("--output", type=str, default=None, help="Write JSON results to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None) -> None:
+    """Run the benchmark and emit JSON results."""
+    args = parse_args(argv)
+    results = asyncio.run(run_benchmark(args))
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    sys.stdout.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
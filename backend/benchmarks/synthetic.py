@@ -0,0 +1,190 @@
+"""
+Deterministic synthetic data for benchmarks.
+Generates text corpora, embeddings and audio without downloading any models.
+"""
+
+import hashlib
+import random
+import re
+import wave
+from pathlib import Path
+from typing import List, Tuple
+
+import numpy as np
+
+from backend.core.vector_index import normalize_rows
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def generate_corpus(
+    num_documents: int = 200,
+    doc_length: int = 400,
+    vocab_size: int = 5000,
+    num_topics: int = 20,
+    topic_weight: float = 0.6,
+    seed: int = 0
+) -> List[str]:
+    """
+    Generate a deterministic corpus with topical structure.
+
+    Words follow a Zipf-like distribution over the vocabulary. Each document
+    is assigned a topic and draws topic_weight of its words from that
+    topic's word list, so related documents share vocabulary.
+
+    Args:
+        num_documents: Number of documents
+        doc_length: Number of words per document
+        vocab_size: Number of distinct words
+        num_topics: Number of topics
+        topic_weight: Fraction of words drawn from the document's topic
+        seed: Random seed
+
+    Returns:
+        List of document texts
+    """
+    rng = random.Random(seed)
+    vocab = [f"w{i:05d}" for i in range(vocab_size)]
+    zipf_weights = [1.0 / (rank + 1) for rank in range(vocab_size)]
+    topic_size = max(1, vocab_size // num_topics)
+    topics = [rng.sample(vocab, topic_size) for _ in range(num_topics)]
+
+    documents = []
+    for _ in range(num_documents):
+        topic = topics[rng.randrange(num_topics)]
+        topic_words = int(doc_length * topic_weight)
+        words = rng.choices(topic, k=topic_words)
+        words += rng.choices(vocab, weights=zipf_weights, k=doc_length - topic_words)
+        rng.shuffle(words)
+        documents.append(" ".join(words))
+
+    return documents
+
+
+def generate_queries(
+    corpus: List[str],
+    num_queries: int = 100,
+    query_length: int = 12,
+    seed: int = 1
+) -> List[str]:
+    """
+    Generate queries by sampling word spans from corpus documents.
+
+    Args:
+        corpus: Documents to sample from
+        num_queries: Number of queries
+        query_length: Number of words per query
+        seed: Random seed
+
+    Returns:
+        List of query texts
+    """
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(num_queries):
+        words = rng.choice(corpus).split()
+        start = rng.randrange(max(1, len(words) - query_length))
+        queries.append(" ".join(words[start:start + query_length]))
+    return queries
+
+
+class HashingEmbedder:
+    """
+    Deterministic bag-of-words embedder using signed feature hashing.
+
+    Stands in for a sentence-transformers model in benchmarks so results
+    are reproducible and need no model download.
+    """
+
+    available = True
+
+    def __init__(self, dim: int = 256):
+        """
+        Initialize embedder.
+
+        Args:
+            dim: Embedding dimension
+        """
+        self.dim = dim
+
+    def __call__(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed a list of texts.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            2D float32 array of normalized embeddings, one row per text
+        """
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for token in _TOKEN_PATTERN.findall(text.lower()):
+                digest = int.from_bytes(
+                    hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "little"
+                )
+                sign = 1.0 if digest & 1 else -1.0
+                vectors[row, (digest >> 1) % self.dim] += sign
+        return normalize_rows(vectors)
+
+
+def generate_speech_audio(
+    duration_seconds: float = 600.0,
+    sample_rate: int = 16000,
+    seed: int = 0,
+    max_pause_seconds: float = 1.5
+) -> Tuple[np.ndarray, List[Tuple[float, float]]]:
+    """
+    Generate speech-like audio: voiced bursts separated by pauses.
+
+    Each utterance is a few harmonics of a wandering pitch under a smooth
+    envelope; pauses hold a faint noise floor, so silence detection has
+    something realistic to find.
+
+    Args:
+        duration_seconds: Length of the recording
+        sample_rate: Samples per second
+        seed: Random seed
+        max_pause_seconds: Longest pause between utterances (at least 0.3)
+
+    Returns:
+        Tuple of (float32 samples in [-1, 1], utterance (start, end) times)
+    """
+    rng = np.random.default_rng(seed)
+    total = int(duration_seconds * sample_rate)
+    samples = rng.normal(0.0, 0.002, total).astype(np.float32)
+    utterances = []
+
+    position = rng.uniform(0.2, 1.0)
+    while True:
+        length = rng.uniform(1.0, 6.0)
+        if position + length > duration_seconds:
+            break
+        start = int(position * sample_rate)
+        count = int(length * sample_rate)
+        t = np.arange(count) / sample_rate
+        pitch = rng.uniform(90, 220) * (1 + 0.1 * np.sin(2 * np.pi * rng.uniform(0.5, 3) * t))
+        phase = 2 * np.pi * np.cumsum(pitch) / sample_rate
+        voice = sum(np.sin(k * phase) / k for k in range(1, 5))
+        envelope = np.sin(np.pi * t / length) ** 0.5
+        samples[start:start + count] += (0.3 * envelope * voice).astype(np.float32)
+        utterances.append((position, position + length))
+        position += length + rng.uniform(0.3, max(0.3, max_pause_seconds))
+
+    return np.clip(samples, -1.0, 1.0), utterances
+
+
+def write_wav(path: Path, samples: np.ndarray, sample_rate: int = 16000) -> None:
+    """
+    Write mono float samples as a 16-bit PCM WAV file.
+
+    Args:
+        path: Output file
+        samples: Float samples in [-1, 1]
+        sample_rate: Samples per second
+    """
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(sample_rate)
+        wav.writeframes((samples * 32767).astype("<i2").tobytes())
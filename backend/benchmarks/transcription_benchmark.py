@@ -0,0 +1,217 @@
+"""
+Parallel chunked transcription benchmark.
+
+Transcribes a synthetic speech-like recording with AsyncTranscriptionRunner
+at several worker counts and reports wall-clock time, speedup over one
+worker, the fraction of silence skipped and how well the stitched
+segments match the known utterances.
+Whisper is replaced with a deterministic CPU-bound stand-in that computes
+spectrograms of each chunk and emits one segment per voiced region, so the
+numbers measure the split / dispatch / stitch pipeline and its scaling
+without a model download. Results are emitted as JSON.
+
+Usage:
+    python -m backend.benchmarks.transcription_benchmark --minutes 30 --workers 1 2 4 8
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from backend.benchmarks.synthetic import generate_speech_audio, write_wav
+from backend.core.async_operations import AsyncTranscriptionRunner
+from backend.core.audio import FRAME_SECONDS, SAMPLE_RATE, AudioChunk, frame_energy
+from backend.core.transcription_engine import read_chunk
+
+# Spectrogram passes per chunk; sets the stand-in's cost relative to real time.
+# Read from the environment so spawned worker processes see --decode-passes.
+DECODE_PASSES_ENV = "TRANSCRIPTION_BENCHMARK_PASSES"
+
+
+def synthetic_transcribe_chunk(
+    samples_path: str,
+    chunk: AudioChunk,
+    model: str,
+    language: str
+) -> List[Dict[str, Any]]:
+    """
+    CPU-bound Whisper stand-in run in the worker processes.
+
+    Segments are named after their absolute start second, so the same
+    utterance seen by two overlapping chunks yields the same text.
+    """
+    samples = read_chunk(samples_path, chunk)
+
+    frame = 400
+    frames = len(samples) // frame
+    if frames:
+        windows = samples[:frames * frame].reshape(frames, frame) * np.hanning(frame)
+        for _ in range(int(os.getenv(DECODE_PASSES_ENV, "200"))):
+            np.log1p(np.abs(np.fft.rfft(windows, axis=1)))
+
+    voiced = frame_energy(samples) > 0.02
+    segments = []
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], voiced.astype(np.int8), [0]))))
+    for begin, end in zip(edges[::2], edges[1::2]):
+        start = chunk.source_time(begin * FRAME_SECONDS)
+        segments.append({
+            "start": start,
+            "end": chunk.source_time(end * FRAME_SECONDS),
+            "text": f"utterance-{int(round(start))}"
+        })
+    return segments
+
+
+def _match_utterances(
+    segments: List[Dict[str, Any]],
+    utterances: List[Tuple[float, float]]
+) -> Dict[str, int]:
+    """Count utterances covered by exactly one, several or no stitched segments."""
+    starts = np.array([segment["start"] for segment in segments])
+    ends = np.array([segment["end"] for segment in segments])
+    counts = {"matched": 0, "duplicated": 0, "missing": 0}
+    for start, end in utterances:
+        midpoint = (start + end) / 2
+        hits = int(np.sum((starts <= midpoint) & (ends >= midpoint)))
+        key = "matched" if hits == 1 else ("duplicated" if hits > 1 else "missing")
+        counts[key] += 1
+    return counts
+
+
+async def benchmark_workers(
+    workers: int,
+    audio_path: Path,
+    warmup_path: Path,
+    utterances: List[Tuple[float, float]],
+    args: argparse.Namespace
+) -> Dict[str, Any]:
+    """
+    Transcribe the recording with a given number of worker processes.
+
+    Args:
+        workers: Worker processes
+        audio_path: Benchmark recording
+        warmup_path: Short recording used to start the pool
+        utterances: Ground-truth utterance times
+        args: Benchmark arguments
+
+    Returns:
+        Result dictionary for this worker count
+    """
+    runner = AsyncTranscriptionRunner(
+        workers=workers,
+        chunk_seconds=args.chunk_seconds,
+        overlap_seconds=args.overlap_seconds,
+        chunk_transcriber=synthetic_transcribe_chunk,
+        vad=not args.no_vad
+    )
+    try:
+        # Start every worker process before timing
+        await asyncio.gather(*(runner.transcribe(str(warmup_path)) for _ in range(workers)))
+
+        start = time.perf_counter()
+        result = await runner.transcribe(str(audio_path))
+        seconds = time.perf_counter() - start
+    finally:
+        runner.shutdown()
+
+    return {
+        "workers": workers,
+        "seconds": round(seconds, 3),
+        "realtime_factor": round(result["duration"] / seconds, 1),
+        "skipped_fraction": result["skipped_fraction"],
+        "segments": len(result["segments"]),
+        "utterances": _match_utterances(result["segments"], utterances),
+    }
+
+
+async def run_benchmark(args: argparse.Namespace) -> Dict[str, Any]:
+    """Run the benchmark for every requested worker count."""
+    samples, utterances = generate_speech_audio(
+        args.minutes * 60, SAMPLE_RATE, args.seed, args.max_pause_seconds
+    )
+    warmup, _ = generate_speech_audio(5.0, SAMPLE_RATE, args.seed)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        audio_path = Path(work_dir) / "recording.wav"
+        warmup_path = Path(work_dir) / "warmup.wav"
+        write_wav(audio_path, samples)
+        write_wav(warmup_path, warmup)
+
+        results = [
+            await benchmark_workers(workers, audio_path, warmup_path, utterances, args)
+            for workers in args.workers
+        ]
+
+    baseline = results[0]["seconds"]
+    for result in results:
+        result["speedup"] = round(baseline / result["seconds"], 2)
+
+    return {
+        "benchmark": "transcription",
+        "config": {
+            "minutes": args.minutes,
+            "chunk_seconds": args.chunk_seconds,
+            "overlap_seconds": args.overlap_seconds,
+            "max_pause_seconds": args.max_pause_seconds,
+            "decode_passes": args.decode_passes,
+            "vad": not args.no_vad,
+            "utterances": len(utterances),
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": results,
+    }
+
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark parallel chunked transcription")
+    parser.add_argument("--minutes", type=float, default=20.0, help="Length of the synthetic recording")
+    parser.add_argument("--chunk-seconds", type=float, default=60.0, help="Target chunk length")
+    parser.add_argument("--overlap-seconds", type=float, default=2.0, help="Overlap between chunks")
+    parser.add_argument(
+        "--workers",
+        nargs="+",
+        type=int,
+        default=[1, 2, 4],
+        help="Worker process counts to benchmark (the first is the speedup baseline)"
+    )
+    parser.add_argument(
+        "--decode-passes", type=int, default=200, help="Spectrogram passes per chunk (stand-in cost)"
+    )
+    parser.add_argument(
+        "--max-pause-seconds", type=float, default=6.0, help="Longest pause between utterances"
+    )
+    parser.add_argument("--no-vad", action="store_true", help="Transcribe silence too")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--output", type=str, default=None, help="Write JSON results to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None) -> None:
+    """Run the benchmark and emit JSON results."""
+    args = parse_args(argv)
+    os.environ[DECODE_PASSES_ENV] = str(args.decode_passes)
+    results = asyncio.run(run_benchmark(args))
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n", encoding="utf-8")
+    sys.stdout.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
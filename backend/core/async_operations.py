@@ -1,13 +1,37 @@
 """
 Async operations for LLM and transcription.
-Phase 1: Placeholder implementations.
+LLM: Phase 1 placeholder. Transcription: chunked Whisper on a process pool.
 """
 
-from typing import Optional, List, Dict, Any
+import asyncio
+import multiprocessing
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, List, Dict, Any, Awaitable, Callable
+
+from backend.core.audio import AudioChunk
+from backend.core.exceptions import TranscriptionError
 from backend.core.logging_config import get_logger
+from backend.core.transcription_engine import (
+    placeholder_transcription,
+    prepare_audio,
+    SegmentStitcher,
+    transcribe_chunk,
+    whisper_available,
+)
 
 logger = get_logger(__name__)
 
+# Receives the completed fraction (0.0-1.0) of a transcription
+ProgressCallback = Callable[[float], Awaitable[None]]
+# Receives newly stitched segments of a transcription, in order
+SegmentsCallback = Callable[[List[Dict[str, Any]]], Awaitable[None]]
+# (samples_path, chunk, model, language) -> segments with absolute timestamps
+ChunkTranscriber = Callable[[str, AudioChunk, str, str], List[Dict[str, Any]]]
+
 
 class AsyncLLMRunner:
     """Async LLM operations runner."""
@@ -66,18 +90,88 @@ class AsyncLLMRunner:
 
 
 class AsyncTranscriptionRunner:
-    """Async transcription operations runner."""
+    """
+    Async transcription operations runner.
     
-    def __init__(self):
-        """Initialize transcription runner."""
-        self.available = False
-        logger.info("AsyncTranscriptionRunner initialized (Phase 1: placeholder)")
+    Transcription runs on a pool of worker processes. A recording is
+    decoded once, split at silence into overlapping chunks, the speech in
+    each chunk is transcribed in parallel across the pool (silence is
+    never sent to the model) and the segments are stitched back together
+    with timestamps of the original recording.
+    """
+    
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        chunk_seconds: Optional[float] = None,
+        overlap_seconds: Optional[float] = None,
+        chunk_transcriber: Optional[ChunkTranscriber] = None,
+        vad: Optional[bool] = None
+    ):
+        """
+        Initialize transcription runner.
+        
+        Args:
+            workers: Worker processes (TRANSCRIPTION_WORKERS)
+            chunk_seconds: Target chunk length (TRANSCRIPTION_CHUNK_SECONDS)
+            overlap_seconds: Overlap between chunks (TRANSCRIPTION_CHUNK_OVERLAP_SECONDS)
+            chunk_transcriber: Picklable chunk function run in the workers
+                (default: Whisper)
+            vad: Skip silence before transcription (TRANSCRIPTION_VAD_ENABLED)
+        """
+        self.workers = max(1, workers or int(os.getenv("TRANSCRIPTION_WORKERS", "1")))
+        self.chunk_seconds = chunk_seconds or float(os.getenv("TRANSCRIPTION_CHUNK_SECONDS", "300"))
+        self.overlap_seconds = overlap_seconds if overlap_seconds is not None else float(
+            os.getenv("TRANSCRIPTION_CHUNK_OVERLAP_SECONDS", "2")
+        )
+        self.chunk_transcriber = chunk_transcriber or transcribe_chunk
+        if vad is None:
+            vad = os.getenv("TRANSCRIPTION_VAD_ENABLED", "true").lower() == "true"
+        # Shortest pause that is skipped; None disables voice activity detection
+        self.vad_min_silence = float(os.getenv("TRANSCRIPTION_VAD_MIN_SILENCE_SECONDS", "1.0")) if vad else None
+        self._executor: Optional[ProcessPoolExecutor] = None
+        logger.info(
+            f"AsyncTranscriptionRunner initialized ({self.workers} workers, "
+            f"Whisper {'available' if self.available else 'not installed: placeholder'})"
+        )
+    
+    @property
+    def available(self) -> bool:
+        """Whether real transcription can run."""
+        return self.chunk_transcriber is not transcribe_chunk or whisper_available()
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Get the worker pool; spawned workers do not inherit server threads."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+    
+    async def _run(self, func: Callable[..., Any], *args) -> Any:
+        """
+        Run a function in the worker pool.
+        
+        Raises:
+            TranscriptionError: If a worker process died
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        except BrokenProcessPool as e:
+            # Replace the pool so later transcriptions can run
+            self._executor = None
+            raise TranscriptionError(f"Transcription worker crashed: {e}")
     
     async def transcribe(
         self,
         file_path: str,
         model: str = "small",
-        language: str = "en"
+        language: str = "en",
+        progress: Optional[ProgressCallback] = None,
+        on_segments: Optional[SegmentsCallback] = None,
+        samples_path: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Transcribe audio file.
@@ -86,33 +180,93 @@ class AsyncTranscriptionRunner:
             file_path: Path to audio file
             model: Whisper model size
             language: Language code
+            progress: Optional async callback receiving the completed fraction;
+                it may raise TranscriptionCancelledError to stop the work
+            on_segments: Optional async callback receiving final segments in
+                order, as soon as the chunks holding them are stitched
+            samples_path: Where to keep the decoded samples (.npy) for later
+                runs; reused if present. Defaults to a temporary file.
         
         Returns:
             Transcription result with text and segments
+        
+        Raises:
+            TranscriptionError: If decoding or transcription fails
         """
-        logger.info(f"Transcription called (placeholder) - file: {file_path}")
+        async def report(fraction: float) -> None:
+            if progress is not None:
+                await progress(fraction)
         
-        # Placeholder response
-        result = {
-            "text": (
-                "[Phase 1 Placeholder Transcription]\n\n"
-                f"This is a placeholder transcription result for: {file_path}\n"
-                f"Model: {model}, Language: {language}\n\n"
-                "In Phase 2, this will be replaced with actual Whisper transcription."
-            ),
-            "segments": [
-                {
-                    "id": 0,
-                    "start": 0.0,
-                    "end": 5.0,
-                    "text": "Placeholder transcription segment"
-                }
-            ],
+        await report(0.0)
+        if not self.available:
+            logger.info(f"Transcription called (placeholder) - file: {file_path}")
+            result = placeholder_transcription(file_path, model, language)
+            if on_segments is not None:
+                await on_segments(result["segments"])
+            await report(1.0)
+            return result
+        
+        work_dir = None
+        if samples_path is None:
+            work_dir = tempfile.mkdtemp(prefix="transcribe-")
+            samples_path = os.path.join(work_dir, "samples.npy")
+        pending: List[asyncio.Future] = []
+        try:
+            duration, speech_seconds, chunks = await self._run(
+                prepare_audio, file_path, samples_path,
+                self.chunk_seconds, self.overlap_seconds, self.vad_min_silence
+            )
+            await report(0.05)
+            
+            async def silent() -> List[Dict[str, Any]]:
+                return []
+            
+            pending = [
+                asyncio.ensure_future(
+                    self._run(self.chunk_transcriber, samples_path, chunk, model, language)
+                    if chunk.speech_regions() else silent()
+                )
+                for chunk in chunks
+            ]
+            # Chunks finish out of order; stitch and emit them in order
+            stitcher = SegmentStitcher(len(chunks))
+            next_chunk = 0
+            for done, future in enumerate(asyncio.as_completed(pending), start=1):
+                await future
+                while next_chunk < len(chunks) and pending[next_chunk].done():
+                    added = stitcher.add(chunks[next_chunk], pending[next_chunk].result())
+                    next_chunk += 1
+                    if added and on_segments is not None:
+                        await on_segments(added)
+                await report(0.05 + 0.95 * done / len(chunks))
+            
+            segments = stitcher.segments
+        finally:
+            # Queued chunks of a cancelled or failed transcription are dropped
+            for future in pending:
+                future.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            if work_dir is not None:
+                shutil.rmtree(work_dir, ignore_errors=True)
+        
+        skipped_fraction = 1.0 - speech_seconds / duration if duration else 0.0
+        logger.info(
+            f"Transcribed {file_path}: {duration:.1f}s of audio in {len(chunks)} chunks "
+            f"({skipped_fraction:.0%} silence skipped), {len(segments)} segments"
+        )
+        return {
+            "text": " ".join(segment["text"] for segment in segments),
+            "segments": segments,
             "language": language,
-            "duration": 5.0
+            "duration": duration,
+            "skipped_fraction": round(max(0.0, skipped_fraction), 4)
         }
-        
-        return result
+    
+    def shutdown(self) -> None:
+        """Shut the worker pool down, dropping chunks not yet started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
     
     def check_status(self) -> Dict[str, Any]:
         """
@@ -121,8 +275,15 @@ class AsyncTranscriptionRunner:
         Returns:
             Status dictionary
         """
+        if self.available:
+            return {
+                "available": True,
+                "phase": "2",
+                "model": os.getenv("WHISPER_MODEL", "small"),
+                "message": f"Transcription runs on {self.workers} worker processes"
+            }
         return {
-            "available": self.available,
+            "available": False,
             "phase": "1 (placeholder)",
             "model": "none",
             "message": "Transcription integration pending Phase 2"
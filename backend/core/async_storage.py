@@ -0,0 +1,221 @@
+"""
+Non-blocking scoped storage for async endpoints.
+Runs ScopedStorage file I/O on a dedicated, bounded thread pool so slow
+disk operations never stall the event loop.
+"""
+
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, BinaryIO, Callable, List, Optional, Tuple
+
+from backend.core.exceptions import FileTooLargeError, StorageError
+from backend.core.logging_config import get_logger
+from backend.core.scoped_storage import FileInfo, ScopedStorage
+
+logger = get_logger(__name__)
+
+
+class AsyncScopedStorage:
+    """Async facade over ScopedStorage backed by a bounded I/O thread pool."""
+
+    # Read size for streamed uploads
+    STREAM_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, storage: Optional[ScopedStorage] = None, max_workers: int = None):
+        """
+        Initialize async storage.
+
+        Args:
+            storage: Synchronous storage to wrap
+            max_workers: Number of I/O threads (bounds concurrent disk operations)
+        """
+        self.storage = storage or ScopedStorage()
+        self.path_builder = self.storage.path_builder
+        self.data_dir = self.storage.data_dir
+        self.trash = self.storage.trash
+        self.max_workers = max_workers or int(os.getenv("STORAGE_IO_WORKERS", "4"))
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="storage-io"
+        )
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run a blocking function on the storage I/O pool.
+
+        Args:
+            func: Blocking callable
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            The callable's return value
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    def shutdown(self) -> None:
+        """Stop the I/O pool after pending operations finish."""
+        self._executor.shutdown(wait=True)
+
+    async def save_file(
+        self,
+        owner_id: str,
+        soul_id: str,
+        file_content: BinaryIO,
+        filename: str,
+        category: str
+    ) -> FileInfo:
+        """Async version of ScopedStorage.save_file."""
+        return await self.run(
+            self.storage.save_file, owner_id, soul_id, file_content, filename, category
+        )
+
+    async def write_text(
+        self,
+        owner_id: str,
+        soul_id: str,
+        filename: str,
+        text: str,
+        category: str
+    ) -> FileInfo:
+        """Async version of ScopedStorage.write_text."""
+        return await self.run(
+            self.storage.write_text, owner_id, soul_id, filename, text, category
+        )
+
+    async def list_files(
+        self,
+        owner_id: str,
+        soul_id: str,
+        category: Optional[str] = None
+    ) -> List[FileInfo]:
+        """Async version of ScopedStorage.list_files."""
+        return await self.run(self.storage.list_files, owner_id, soul_id, category)
+
+    async def list_files_page(
+        self,
+        owner_id: str,
+        soul_id: str,
+        category: Optional[str] = None,
+        limit: Optional[int] = 100,
+        cursor: Optional[str] = None,
+        sort: str = "name",
+        descending: bool = False
+    ) -> Tuple[List[FileInfo], Optional[str]]:
+        """Async version of ScopedStorage.list_files_page."""
+        return await self.run(
+            self.storage.list_files_page, owner_id, soul_id, category, limit, cursor, sort, descending
+        )
+
+    async def count_files(
+        self,
+        owner_id: str,
+        soul_id: str,
+        category: Optional[str] = None
+    ) -> Tuple[int, int]:
+        """Async version of ScopedStorage.count_files."""
+        return await self.run(self.storage.count_files, owner_id, soul_id, category)
+
+    async def get_file_info(
+        self,
+        owner_id: str,
+        soul_id: str,
+        filename: str,
+        category: str
+    ) -> Optional[FileInfo]:
+        """Async version of ScopedStorage.get_file_info."""
+        return await self.run(self.storage.get_file_info, owner_id, soul_id, filename, category)
+
+    async def open_file(self, owner_id: str, soul_id: str, filename: str, category: str) -> BinaryIO:
+        """Async version of ScopedStorage.open_file."""
+        return await self.run(self.storage.open_file, owner_id, soul_id, filename, category)
+
+    async def delete_file(
+        self,
+        owner_id: str,
+        soul_id: str,
+        filename: str,
+        category: str
+    ) -> bool:
+        """Async version of ScopedStorage.delete_file."""
+        return await self.run(self.storage.delete_file, owner_id, soul_id, filename, category)
+
+    async def delete_soul_data(self, owner_id: str, soul_id: str) -> bool:
+        """Async version of ScopedStorage.delete_soul_data."""
+        return await self.run(self.storage.delete_soul_data, owner_id, soul_id)
+
+    async def delete_owner_data(self, owner_id: str) -> bool:
+        """Async version of ScopedStorage.delete_owner_data."""
+        return await self.run(self.storage.delete_owner_data, owner_id)
+
+    async def remaining_quota(self, owner_id: str, quota_bytes: int) -> Optional[int]:
+        """Async version of ScopedStorage.remaining_quota."""
+        return await self.run(self.storage.remaining_quota, owner_id, quota_bytes)
+
+    async def get_storage_stats(self, owner_id: str, soul_id: str) -> dict:
+        """Async version of ScopedStorage.get_storage_stats."""
+        return await self.run(self.storage.get_storage_stats, owner_id, soul_id)
+
+    async def save_stream(
+        self,
+        owner_id: str,
+        soul_id: str,
+        chunks: AsyncIterator[bytes],
+        filename: str,
+        category: str,
+        max_size: Optional[int] = None
+    ) -> FileInfo:
+        """
+        Save a streamed file to scoped storage in a single pass.
+
+        Chunks are written straight to a staging file while the size is
+        counted and a SHA-256 hash is computed. The file is committed
+        atomically only once the stream completes (deduplicated against the
+        blob store for uploads), so peak memory is one chunk and an aborted
+        upload never leaves a partial file.
+
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            chunks: Async iterator of file content chunks
+            filename: Name of the file
+            category: Category for the file
+            max_size: Maximum allowed size in bytes
+
+        Returns:
+            FileInfo object with file details and content hash
+
+        Raises:
+            FileTooLargeError: If the stream exceeds max_size
+            StorageError: If file save fails
+        """
+        staged = await self.run(self.storage.begin_write, owner_id, soul_id, filename, category)
+        size = 0
+
+        try:
+            async for chunk in chunks:
+                size += len(chunk)
+                if max_size is not None and size > max_size:
+                    raise FileTooLargeError(
+                        f"File {filename} exceeds maximum upload size of {max_size} bytes"
+                    )
+                await self.run(staged.write, chunk)
+
+            file_info = await self.run(staged.commit)
+        except FileTooLargeError:
+            await self.run(staged.abort)
+            logger.warning(f"Aborted upload {staged.file_path}: exceeded {max_size} bytes")
+            raise
+        except Exception as e:
+            await self.run(staged.abort)
+            logger.error(f"Failed to save streamed file {filename}: {e}")
+            raise StorageError(f"Failed to save file: {e}")
+
+        logger.info(f"Saved streamed file: {staged.file_path} ({size} bytes)")
+
+        return file_info
@@ -0,0 +1,387 @@
+"""
+Audio decoding, voice activity detection and silence-aware chunk planning
+for transcription.
+
+Audio is handled as 16 kHz mono float32 samples, the format Whisper
+consumes. PCM WAV files are decoded with the standard library; other
+formats go through the ffmpeg command line tool, as Whisper itself does.
+Decoded samples of uploads are kept as memory-mappable .npy sidecars, so
+each upload is decoded once no matter how often it is transcribed.
+"""
+
+import glob
+import os
+import re
+import shutil
+import subprocess
+import uuid
+import wave
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from backend.core.exceptions import TranscriptionError
+
+SAMPLE_RATE = 16000
+
+# Suffix of decoded-audio sidecars kept next to uploads
+DECODED_SUFFIX = ".pcm16k.npy"
+
+# Frame length for energy analysis
+FRAME_SECONDS = 0.03
+
+# Voice activity: frames louder than this many times the noise floor (the
+# 10th percentile of frame energy), and never below VAD_MIN_RMS, are speech
+VAD_NOISE_RATIO = 4.0
+VAD_MIN_RMS = 0.01
+# The noise floor estimate is capped, so recordings without pauses (whose
+# quietest frames are still speech) or with loud steady noise keep a
+# threshold that speech can reach
+VAD_MAX_NOISE_FLOOR = 0.02
+
+
+@dataclass
+class AudioChunk:
+    """
+    A slice of audio to transcribe independently.
+
+    The chunk covers [start, end) including overlap with its neighbours;
+    segments are only kept from its core [core_start, core_end), so every
+    moment of the recording belongs to exactly one chunk.
+    """
+    index: int
+    start: float
+    end: float
+    core_start: float
+    core_end: float
+    # Speech regions within [start, end); None means the whole chunk.
+    # Only these are sent to the model, back to back.
+    regions: Optional[List[Tuple[float, float]]] = None
+
+    def speech_regions(self) -> List[Tuple[float, float]]:
+        """Regions of the chunk that are transcribed."""
+        return [(self.start, self.end)] if self.regions is None else self.regions
+
+    def source_time(self, offset: float) -> float:
+        """
+        Map a time in the chunk's transcribed audio back to the recording.
+
+        Args:
+            offset: Seconds from the start of the concatenated speech regions
+
+        Returns:
+            Seconds from the start of the recording
+        """
+        position = 0.0
+        regions = self.speech_regions()
+        for start, end in regions:
+            if offset <= position + (end - start):
+                return start + (offset - position)
+            position += end - start
+        return regions[-1][1] if regions else self.start
+
+
+def _resample(samples: np.ndarray, source_rate: int) -> np.ndarray:
+    """Linearly resample to SAMPLE_RATE."""
+    if source_rate == SAMPLE_RATE or len(samples) == 0:
+        return samples
+    duration = len(samples) / source_rate
+    target_times = np.arange(int(duration * SAMPLE_RATE)) / SAMPLE_RATE
+    source_times = np.arange(len(samples)) / source_rate
+    return np.interp(target_times, source_times, samples).astype(np.float32)
+
+
+def _load_wav(path: Path) -> np.ndarray:
+    """Decode a PCM WAV file."""
+    with wave.open(str(path), "rb") as wav:
+        channels = wav.getnchannels()
+        width = wav.getsampwidth()
+        rate = wav.getframerate()
+        frames = wav.readframes(wav.getnframes())
+
+    if width == 2:
+        samples = np.frombuffer(frames, dtype="<i2").astype(np.float32) / 32768.0
+    elif width == 4:
+        samples = np.frombuffer(frames, dtype="<i4").astype(np.float32) / 2147483648.0
+    elif width == 1:
+        samples = (np.frombuffer(frames, dtype=np.uint8).astype(np.float32) - 128.0) / 128.0
+    else:
+        raise TranscriptionError(f"Unsupported WAV sample width: {width} bytes")
+
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    return _resample(samples, rate)
+
+
+def _load_with_ffmpeg(path: Path) -> np.ndarray:
+    """Decode any format ffmpeg understands."""
+    if shutil.which("ffmpeg") is None:
+        raise TranscriptionError(f"Cannot decode {path.name}: ffmpeg is not installed")
+    command = [
+        "ffmpeg", "-nostdin", "-threads", "0", "-i", str(path),
+        "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(SAMPLE_RATE), "-"
+    ]
+    try:
+        output = subprocess.run(command, capture_output=True, check=True).stdout
+    except subprocess.CalledProcessError as e:
+        raise TranscriptionError(f"Failed to decode {path.name}: {e.stderr.decode(errors='replace')[-500:]}")
+    return np.frombuffer(output, dtype="<i2").astype(np.float32) / 32768.0
+
+
+def load_audio(path: Path) -> np.ndarray:
+    """
+    Decode an audio file to 16 kHz mono float32 samples.
+
+    Args:
+        path: Audio file
+
+    Returns:
+        1D float32 array in [-1, 1]
+
+    Raises:
+        TranscriptionError: If the file cannot be decoded
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".wav":
+        try:
+            return _load_wav(path)
+        except (wave.Error, EOFError):
+            # Compressed WAV variants: let ffmpeg handle them
+            pass
+    return _load_with_ffmpeg(path)
+
+
+def decoded_audio_path(audio_path: Path, content_hash: Optional[str] = None) -> Path:
+    """
+    Location of the decoded samples of an uploaded audio file.
+
+    The sidecar is hidden (so listings and catalog scans skip it) and
+    named after the content hash, so replacing the upload with different
+    audio never reuses stale samples.
+
+    Args:
+        audio_path: Uploaded audio file
+        content_hash: SHA-256 of its content, if known
+
+    Returns:
+        Path of the .npy sidecar
+    """
+    audio_path = Path(audio_path)
+    tag = f".{content_hash[:16]}" if content_hash else ""
+    return audio_path.parent / f".{audio_path.name}{tag}{DECODED_SUFFIX}"
+
+
+def decoded_audio_files(audio_path: Path) -> List[Path]:
+    """
+    Find the decoded-audio sidecars of an uploaded audio file.
+
+    Only names decoded_audio_path() produces for this file are matched, so
+    sidecars of other uploads sharing a name prefix are left alone.
+
+    Args:
+        audio_path: Uploaded audio file
+
+    Returns:
+        Sidecar paths, for any content the upload has had
+    """
+    audio_path = Path(audio_path)
+    name = re.compile(
+        rf"\.{re.escape(audio_path.name)}(\.[0-9a-f]{{16}})?{re.escape(DECODED_SUFFIX)}"
+    )
+    candidates = audio_path.parent.glob(f".{glob.escape(audio_path.name)}.*")
+    return [path for path in candidates if name.fullmatch(path.name)]
+
+
+def load_decoded_audio(audio_path: Path, samples_path: Path) -> np.ndarray:
+    """
+    Get the decoded samples of an audio file, decoding it only once.
+
+    Samples are stored as a .npy file and returned memory-mapped, so
+    callers (and other processes) read them without decoding or copying.
+    Sidecars left from previous content of the same upload are removed.
+
+    Args:
+        audio_path: Audio file
+        samples_path: Where the decoded samples are kept
+
+    Returns:
+        Read-only memory-mapped float32 samples
+
+    Raises:
+        TranscriptionError: If the file cannot be decoded
+    """
+    samples_path = Path(samples_path)
+    if not samples_path.exists():
+        samples = load_audio(Path(audio_path))
+        temp_path = samples_path.with_name(f"{samples_path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            with open(temp_path, "wb") as f:
+                np.save(f, samples)
+            os.replace(temp_path, samples_path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+        for stale in decoded_audio_files(audio_path):
+            if stale != samples_path:
+                stale.unlink(missing_ok=True)
+
+    return np.load(samples_path, mmap_mode="r")
+
+
+def frame_energy(samples: np.ndarray, frame_seconds: float = FRAME_SECONDS) -> np.ndarray:
+    """
+    Compute the RMS energy of consecutive frames.
+
+    Args:
+        samples: 16 kHz mono samples
+        frame_seconds: Frame length
+
+    Returns:
+        1D array with one RMS value per full frame
+    """
+    frame_length = max(1, int(frame_seconds * SAMPLE_RATE))
+    frame_count = len(samples) // frame_length
+    if frame_count == 0:
+        return np.zeros(0, dtype=np.float32)
+    frames = samples[:frame_count * frame_length].reshape(frame_count, frame_length)
+    return np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
+
+
+def detect_speech(
+    samples: np.ndarray,
+    min_silence_seconds: float = 1.0,
+    padding_seconds: float = 0.3
+) -> List[Tuple[float, float]]:
+    """
+    Find the speech regions of a recording from frame energy.
+
+    Frames well above the recording's noise floor count as speech; gaps
+    shorter than min_silence_seconds are bridged and every region is
+    padded, so word onsets and trailing consonants are kept.
+
+    Args:
+        samples: 16 kHz mono samples
+        min_silence_seconds: Shortest pause that splits two regions
+        padding_seconds: Audio kept before and after each region
+
+    Returns:
+        (start, end) times of the speech regions, in order
+    """
+    energy = frame_energy(samples)
+    if len(energy) == 0:
+        return []
+    duration = len(samples) / SAMPLE_RATE
+    noise_floor = min(VAD_MAX_NOISE_FLOOR, float(np.percentile(energy, 10)))
+    threshold = max(VAD_MIN_RMS, VAD_NOISE_RATIO * noise_floor)
+    voiced = (energy > threshold).astype(np.int8)
+
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], voiced, [0]))))
+    starts, ends = edges[::2] * FRAME_SECONDS, edges[1::2] * FRAME_SECONDS
+    if len(starts) == 0:
+        return []
+
+    # Bridge short pauses, then pad (padding can close remaining gaps too)
+    gaps = starts[1:] - ends[:-1] >= max(min_silence_seconds, 2 * padding_seconds)
+    starts = np.maximum(starts[np.concatenate(([True], gaps))] - padding_seconds, 0.0)
+    ends = np.minimum(ends[np.concatenate((gaps, [True]))] + padding_seconds, duration)
+    return [(float(start), float(end)) for start, end in zip(starts, ends)]
+
+
+def is_near_silent(energy: np.ndarray, start: float, end: float) -> bool:
+    """
+    Check whether a stretch of audio is quiet in absolute terms.
+
+    Args:
+        energy: Frame energy of the recording (frame_energy)
+        start: Start time in seconds
+        end: End time in seconds
+
+    Returns:
+        True unless a tenth of its frames are louder than VAD_MIN_RMS
+    """
+    frames = energy[int(start / FRAME_SECONDS):int(end / FRAME_SECONDS)]
+    return len(frames) == 0 or float(np.percentile(frames, 90)) <= VAD_MIN_RMS
+
+
+def restrict_to_speech(
+    chunks: List[AudioChunk],
+    regions: List[Tuple[float, float]],
+    energy: Optional[np.ndarray] = None
+) -> List[AudioChunk]:
+    """
+    Limit each chunk to the speech regions it overlaps.
+
+    Voice activity detection can miss speech it cannot tell from the
+    recording's own floor, so with the frame energy given, a chunk without
+    speech regions that is not near-silent is transcribed whole instead.
+
+    Args:
+        chunks: Planned chunks
+        regions: Speech regions of the recording
+        energy: Frame energy of the recording (frame_energy)
+
+    Returns:
+        The same chunks with regions set (empty for silent chunks, None
+        for chunks transcribed whole)
+    """
+    for chunk in chunks:
+        chunk.regions = [
+            (max(start, chunk.start), min(end, chunk.end))
+            for start, end in regions
+            if start < chunk.end and end > chunk.start
+        ]
+        if not chunk.regions and energy is not None and not is_near_silent(energy, chunk.start, chunk.end):
+            chunk.regions = None
+    return chunks
+
+
+def plan_chunks(
+    samples: np.ndarray,
+    chunk_seconds: float,
+    overlap_seconds: float
+) -> List[AudioChunk]:
+    """
+    Split audio into chunks whose boundaries fall on silence.
+
+    Each boundary is placed at the quietest frame within a tenth of the
+    chunk length around its nominal position, so cuts rarely land inside
+    a word. Audio shorter than one and a half chunks is not split.
+
+    Args:
+        samples: 16 kHz mono samples
+        chunk_seconds: Target chunk length
+        overlap_seconds: Audio shared with each neighbour
+
+    Returns:
+        Chunks in order
+    """
+    duration = len(samples) / SAMPLE_RATE
+    if duration < chunk_seconds * 1.5:
+        return [AudioChunk(0, 0.0, duration, 0.0, duration)]
+
+    energy = frame_energy(samples)
+    search = chunk_seconds / 10
+    boundaries = [0.0]
+    nominal = chunk_seconds
+
+    while duration - nominal >= chunk_seconds / 2:
+        low = int((nominal - search) / FRAME_SECONDS)
+        high = int((nominal + search) / FRAME_SECONDS)
+        window = energy[low:high]
+        cut = (low + int(np.argmin(window))) * FRAME_SECONDS if len(window) else nominal
+        boundaries.append(cut)
+        nominal = cut + chunk_seconds
+    boundaries.append(duration)
+
+    return [
+        AudioChunk(
+            index=index,
+            start=max(0.0, core_start - overlap_seconds),
+            end=min(duration, core_end + overlap_seconds),
+            core_start=core_start,
+            core_end=core_end
+        )
+        for index, (core_start, core_end) in enumerate(zip(boundaries, boundaries[1:]))
+    ]
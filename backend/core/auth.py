@@ -2,8 +2,12 @@
 JWT authentication for the CyberSeed backend.
 """
 
+import hashlib
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Optional, Literal
+from typing import Optional, Literal, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from pydantic import BaseModel
@@ -38,6 +42,140 @@ class TokenPair(BaseModel):
     token_type: str = "bearer"
 
 
+class VerifiedTokenCache:
+    """
+    Bounded LRU cache of verified access tokens.
+    
+    Clients send the same bearer token on every request, so its signature
+    is verified once and the resulting TokenData is reused until the
+    token's exp. Entries are keyed by a SHA-256 digest of the token, so
+    raw tokens are never kept in memory. The least recently used entries
+    are evicted when the cache is full.
+    """
+    
+    def __init__(self, max_entries: int = None):
+        """
+        Initialize token cache.
+        
+        Args:
+            max_entries: Maximum cached tokens (AUTH_TOKEN_CACHE_SIZE); 0 disables the cache
+        """
+        self.max_entries = (
+            max_entries if max_entries is not None else security_config.auth_token_cache_size
+        )
+        # digest -> (token data, expiry as epoch seconds)
+        self._entries: "OrderedDict[bytes, Tuple[TokenData, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def _digest(token: str) -> bytes:
+        """Cache key of a token."""
+        return hashlib.sha256(token.encode("utf-8")).digest()
+    
+    def get(self, token: str) -> Optional[TokenData]:
+        """
+        Get the verified data of a token.
+        
+        Args:
+            token: JWT token string
+        
+        Returns:
+            TokenData, or None if the token is not cached or has expired
+        """
+        if self.max_entries <= 0:
+            return None
+        key = self._digest(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            token_data, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return token_data
+    
+    def put(self, token: str, token_data: TokenData, expires_at: float) -> None:
+        """
+        Cache a verified token.
+        
+        Args:
+            token: JWT token string
+            token_data: Its verified data
+            expires_at: The token's exp claim (epoch seconds)
+        """
+        if self.max_entries <= 0 or expires_at <= time.time():
+            return
+        key = self._digest(token)
+        with self._lock:
+            self._entries[key] = (token_data, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def revoke(self, token: str) -> bool:
+        """
+        Drop a token, so its next use is verified again.
+        
+        Call this from whatever revokes tokens (logout, denylist), before
+        the revocation is checked.
+        
+        Args:
+            token: JWT token string
+        
+        Returns:
+            True if the token was cached
+        """
+        with self._lock:
+            return self._entries.pop(self._digest(token), None) is not None
+    
+    def revoke_user(self, user_id: str) -> int:
+        """
+        Drop every cached token of a user (e.g. after a role change).
+        
+        Args:
+            user_id: User identifier
+        
+        Returns:
+            Number of dropped tokens
+        """
+        with self._lock:
+            keys = [key for key, (data, _) in self._entries.items() if data.user_id == user_id]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+    
+    def clear(self) -> None:
+        """Drop all cached tokens (e.g. after rotating JWT_SECRET_KEY)."""
+        with self._lock:
+            self._entries.clear()
+    
+    def get_stats(self) -> dict:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Dictionary with entry count, capacity, hits and misses
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+
+# Verified access tokens shared by all requests
+verified_tokens = VerifiedTokenCache()
+
+
 def hash_password(password: str) -> str:
     """
     Hash a password.
@@ -140,15 +278,15 @@ def create_refresh_token(
     return encoded_jwt
 
 
-def decode_token(token: str) -> TokenData:
+def _verify_token(token: str) -> Tuple[TokenData, float]:
     """
-    Decode and validate a JWT token.
+    Verify a JWT token.
     
     Args:
         token: JWT token string
     
     Returns:
-        TokenData object
+        Tuple of (TokenData, exp claim as epoch seconds)
     
     Raises:
         HTTPException: If token is invalid
@@ -168,43 +306,81 @@ def decode_token(token: str) -> TokenData:
             logger.warning("Token missing required fields")
             raise_unauthorized("Invalid token: missing required fields")
         
-        return TokenData(
+        token_data = TokenData(
             user_id=user_id,
             owner_id=owner_id,
             role=role,
             exp=datetime.fromtimestamp(payload.get("exp"))
         )
+        return token_data, float(payload.get("exp"))
     except JWTError as e:
         logger.warning(f"JWT decode error: {e}")
         raise_unauthorized(f"Could not validate credentials: {e}")
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security_bearer)
-) -> TokenData:
+def decode_token(token: str) -> TokenData:
     """
-    Dependency to get current authenticated user from JWT token.
+    Decode and validate a JWT token.
     
     Args:
-        credentials: HTTP Bearer credentials
+        token: JWT token string
     
     Returns:
         TokenData object
     
     Raises:
-        HTTPException: If authentication fails
+        HTTPException: If token is invalid
+    """
+    token_data, _ = _verify_token(token)
+    return token_data
+
+
+def authenticate_token(token: str) -> TokenData:
+    """
+    Authenticate an access token, using the verified-token cache.
+    
+    Args:
+        token: JWT token string
+    
+    Returns:
+        TokenData object
+    
+    Raises:
+        HTTPException: If the token is invalid or has expired
     """
-    token = credentials.credentials
-    token_data = decode_token(token)
+    token_data = verified_tokens.get(token)
+    if token_data is not None:
+        return token_data
+    
+    token_data, expires_at = _verify_token(token)
     
     # Check if token has expired
     if token_data.exp and token_data.exp < datetime.utcnow():
         logger.warning("Token has expired")
         raise_unauthorized("Token has expired")
     
+    verified_tokens.put(token, token_data, expires_at)
     return token_data
 
 
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security_bearer)
+) -> TokenData:
+    """
+    Dependency to get current authenticated user from JWT token.
+    
+    Args:
+        credentials: HTTP Bearer credentials
+    
+    Returns:
+        TokenData object
+    
+    Raises:
+        HTTPException: If authentication fails
+    """
+    return authenticate_token(credentials.credentials)
+
+
 def verify_dev_credentials(username: str, password: str) -> bool:
     """
     Verify development mode credentials.
@@ -0,0 +1,316 @@
+"""
+Content-addressed blob store for scoped uploads.
+
+Each distinct file content is stored once under DATA_DIR/.blobs by its
+SHA-256 hash (suffixed with the codec when stored compressed, since the
+bytes on disk differ per codec) and hardlinked into the scoped uploads/ directories, so the
+ScopedPathBuilder layout keeps resolving to regular files. The hardlink
+count doubles as the reference count: a blob with a link count of 1 is
+no longer referenced by any soul.
+"""
+
+import hashlib
+import os
+import shutil
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from backend.core.compression import iter_stored_file
+from backend.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def hash_file(path: Path, codec: Optional[str] = None, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Compute the SHA-256 hash of a file's original content.
+
+    Blobs are keyed by the hash of the uncompressed content, so files
+    stored compressed are hashed through the decompressing reader.
+
+    Args:
+        path: Scoped file path
+        codec: Codec recorded when the file was written
+        chunk_size: Read size
+
+    Returns:
+        Hex digest
+    """
+    hasher = hashlib.sha256()
+    for chunk in iter_stored_file(path, codec, chunk_size):
+        hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def blob_key(content_hash: str, codec: Optional[str] = None) -> str:
+    """
+    Get the key of a blob.
+
+    Args:
+        content_hash: SHA-256 of the original content
+        codec: Codec the blob's bytes are compressed with
+
+    Returns:
+        The hash, or <hash>.<codec> for compressed content
+    """
+    return content_hash if codec is None else f"{content_hash}.{codec}"
+
+
+class BlobStore:
+    """Store file contents once by hash and hardlink them into scoped paths."""
+
+    BLOBS_DIRNAME = ".blobs"
+    TEMP_DIRNAME = ".tmp"
+
+    def __init__(self, data_dir: Path):
+        """
+        Initialize blob store.
+
+        Args:
+            data_dir: Root data directory; blobs live in data_dir/.blobs
+        """
+        self.root = Path(data_dir) / self.BLOBS_DIRNAME
+        self.temp_dir = self.root / self.TEMP_DIRNAME
+        # Serializes link/unlink decisions within this process
+        self._lock = threading.Lock()
+
+    def blob_path(self, key: str) -> Path:
+        """
+        Get the path of a blob.
+
+        Args:
+            key: Blob key from blob_key()
+
+        Returns:
+            Path fanned out by the first two hex characters
+        """
+        return self.root / key[:2] / key[2:]
+
+    def temp_path(self) -> Path:
+        """
+        Get a unique temporary path inside the blob store.
+
+        Content is written here first so it can be renamed into the store
+        atomically (same filesystem).
+
+        Returns:
+            Temporary file path
+        """
+        self.temp_dir.mkdir(parents=True, exist_ok=True)
+        return self.temp_dir / uuid.uuid4().hex
+
+    def store(
+        self,
+        temp_path: Path,
+        key: str,
+        target_path: Path,
+        old_key: Optional[str] = None
+    ) -> bool:
+        """
+        Commit temporary content as a blob and link it to a scoped path.
+
+        If a blob with the same key already exists the temporary file is
+        discarded. The scoped path is replaced atomically, so readers see
+        either the old file or the complete new one.
+
+        Args:
+            temp_path: Fully written temporary file from temp_path()
+            key: Blob key of the content, as encoded in the temporary file
+            target_path: Scoped path to link the blob to
+            old_key: Known blob key of the content being replaced, avoids rehashing
+
+        Returns:
+            True if the content was already stored (deduplicated)
+        """
+        blob_path = self.blob_path(key)
+        link_temp = target_path.parent / f".{target_path.name}.{uuid.uuid4().hex}.link"
+
+        with self._lock:
+            deduplicated = blob_path.exists()
+            if deduplicated:
+                temp_path.unlink(missing_ok=True)
+            else:
+                blob_path.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(temp_path, blob_path)
+
+            try:
+                os.link(blob_path, link_temp)
+            except OSError as e:
+                # Filesystems without hardlinks get a private copy instead
+                logger.warning(f"Hardlink unavailable for {target_path}, copying: {e}")
+                shutil.copyfile(blob_path, link_temp)
+
+            self._replace_target(link_temp, target_path, old_key)
+
+        if deduplicated:
+            logger.info(f"Deduplicated upload {target_path} against blob {key[:12]}")
+
+        return deduplicated
+
+    def _replace_target(self, source: Path, target_path: Path, old_key: Optional[str] = None) -> None:
+        """
+        Atomically replace a scoped file, releasing the blob it pointed to.
+
+        Args:
+            source: New file to move into place
+            target_path: Scoped path
+            old_key: Known blob key of the current content (uncataloged
+                files are hashed and assumed to be stored as-is)
+        """
+        try:
+            last_reference = target_path.stat().st_nlink == 2
+        except FileNotFoundError:
+            last_reference = False
+        if not last_reference:
+            old_key = None
+        elif old_key is None:
+            old_key = hash_file(target_path)
+
+        os.replace(source, target_path)
+
+        if old_key is not None:
+            self._collect(self.blob_path(old_key))
+
+    def rekey(self, old_key: str, key: str, linked_path: Path) -> bool:
+        """
+        Move a blob to another key, if a scoped path links to it.
+
+        Args:
+            old_key: Key the blob is stored under
+            key: Key it belongs under
+            linked_path: Scoped file expected to link to the blob
+
+        Returns:
+            True if the blob was moved
+        """
+        old_path, new_path = self.blob_path(old_key), self.blob_path(key)
+        with self._lock:
+            try:
+                if new_path.exists() or not os.path.samefile(old_path, linked_path):
+                    return False
+            except FileNotFoundError:
+                return False
+            new_path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(old_path, new_path)
+        return True
+
+    def release(self, file_path: Path, key: Optional[str] = None) -> None:
+        """
+        Delete a scoped file and its blob if it was the last reference.
+
+        Args:
+            file_path: Scoped file path
+            key: Known blob key of the file, avoids rehashing
+        """
+        with self._lock:
+            try:
+                links = file_path.stat().st_nlink
+            except FileNotFoundError:
+                return
+
+            if links == 2 and key is None:
+                key = hash_file(file_path)
+
+            file_path.unlink()
+
+            if key is not None:
+                self._collect(self.blob_path(key))
+
+    def _collect(self, blob_path: Path) -> bool:
+        """Remove a blob that no scoped path links to anymore."""
+        try:
+            if blob_path.stat().st_nlink == 1:
+                blob_path.unlink()
+                logger.debug(f"Removed unreferenced blob {blob_path.name}")
+                return True
+        except FileNotFoundError:
+            pass
+        return False
+
+    def collect(self, keys: Iterable[str]) -> int:
+        """
+        Remove the given blobs if they are no longer referenced.
+
+        Only these blobs' link counts are checked, and the lock is taken
+        per blob, so uploads are not held up by a large release.
+
+        Args:
+            keys: Keys of blobs that may have lost their last link
+
+        Returns:
+            Number of blobs removed
+        """
+        removed = 0
+        for key in set(keys):
+            with self._lock:
+                removed += self._collect(self.blob_path(key))
+
+        if removed:
+            logger.info(f"Collected {removed} unreferenced blobs")
+
+        return removed
+
+    def collect_garbage(self) -> int:
+        """
+        Remove all blobs that are no longer referenced.
+
+        Scans the whole store; used when the released hashes are unknown.
+        The lock is taken per blob rather than for the whole scan.
+
+        Returns:
+            Number of blobs removed
+        """
+        removed = 0
+        if not self.root.exists():
+            return removed
+
+        for shard in self.root.iterdir():
+            if not shard.is_dir() or shard.name == self.TEMP_DIRNAME:
+                continue
+            for blob_path in shard.iterdir():
+                with self._lock:
+                    removed += self._collect(blob_path)
+
+        if removed:
+            logger.info(f"Collected {removed} unreferenced blobs")
+
+        return removed
+
+    @staticmethod
+    def reference_count(stats: os.stat_result) -> int:
+        """
+        Get how many scoped paths share a file's content.
+
+        Args:
+            stats: stat() result of a scoped file
+
+        Returns:
+            Number of scoped references (1 for files outside the blob store)
+        """
+        return max(1, stats.st_nlink - 1)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get blob store statistics.
+
+        Scans every blob; intended for diagnostics rather than hot paths.
+
+        Returns:
+            Dictionary with blob count, physical bytes and deduplicated bytes
+        """
+        stats = {"blobs": 0, "physical_size": 0, "deduplicated_bytes": 0}
+        if not self.root.exists():
+            return stats
+
+        for shard in self.root.iterdir():
+            if not shard.is_dir() or shard.name == self.TEMP_DIRNAME:
+                continue
+            for blob_path in shard.iterdir():
+                blob_stats = blob_path.stat()
+                stats["blobs"] += 1
+                stats["physical_size"] += blob_stats.st_size
+                stats["deduplicated_bytes"] += blob_stats.st_size * max(0, blob_stats.st_nlink - 2)
+
+        return stats
@@ -0,0 +1,223 @@
+"""
+Transparent compression at rest for scoped storage.
+
+Text files in configured categories are stored zstd-compressed (or gzip
+when the optional zstandard package is missing) under their normal names.
+The codec is recorded in the storage catalog when a file is written and
+passed back in on read; content is never sniffed, so a file is only
+decompressed if this module compressed it, and files stored before
+compression was enabled keep reading as-is. Readers always see the
+original bytes.
+"""
+
+import gzip
+import hashlib
+import os
+from pathlib import Path
+from typing import BinaryIO, Iterable, Optional, Tuple
+
+from backend.core.lazy_init import zstandard_lazy
+from backend.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+CODECS = ("zstd", "gzip")
+
+# Only text files are compressed; audio and archives are already compact
+COMPRESSIBLE_EXTENSIONS = {
+    ".txt", ".md", ".markdown", ".csv", ".json", ".jsonl", ".log", ".srt", ".vtt"
+}
+
+READ_CHUNK_SIZE = 1024 * 1024
+
+
+def is_compressible(filename: str) -> bool:
+    """
+    Check whether a file name is eligible for compression.
+
+    Args:
+        filename: Scoped file name
+
+    Returns:
+        True for text extensions
+    """
+    return Path(filename).suffix.lower() in COMPRESSIBLE_EXTENSIONS
+
+
+def open_stored_file(path: Path, codec: Optional[str] = None) -> BinaryIO:
+    """
+    Open a stored file for streaming reads of its original content.
+
+    Args:
+        path: Scoped file path
+        codec: Codec recorded when the file was written (None = stored as-is)
+
+    Returns:
+        Binary file object yielding decompressed bytes
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the codec is unknown
+        RuntimeError: If the file is zstd-compressed and zstandard is missing
+    """
+    path = Path(path)
+
+    if codec == "gzip":
+        return gzip.open(path, "rb")
+    if codec == "zstd":
+        zstandard = zstandard_lazy._load()
+        if zstandard is None:
+            raise RuntimeError(f"{path.name} is zstd-compressed but zstandard is not installed")
+        return zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+    if codec is not None:
+        raise ValueError(f"Unknown compression codec: {codec}")
+    return open(path, "rb")
+
+
+def iter_stored_file(
+    path: Path,
+    codec: Optional[str] = None,
+    chunk_size: int = READ_CHUNK_SIZE
+) -> Iterable[bytes]:
+    """
+    Iterate over the original content of a stored file.
+
+    Args:
+        path: Scoped file path
+        codec: Codec recorded when the file was written
+        chunk_size: Bytes per chunk
+
+    Yields:
+        Decompressed content chunks
+    """
+    with open_stored_file(path, codec) as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            yield chunk
+
+
+def measure_stored_file(
+    path: Path,
+    codec: Optional[str] = None,
+    hash_contents: bool = True
+) -> Tuple[int, Optional[str]]:
+    """
+    Get the logical size and optionally the content hash of a stored file.
+
+    Args:
+        path: Scoped file path
+        codec: Codec recorded when the file was written
+        hash_contents: Compute the SHA-256 of the original content
+
+    Returns:
+        Tuple of (logical size, hex digest or None)
+    """
+    if not hash_contents and codec is None:
+        return Path(path).stat().st_size, None
+
+    hasher = hashlib.sha256() if hash_contents else None
+    size = 0
+    for chunk in iter_stored_file(path, codec):
+        size += len(chunk)
+        if hasher is not None:
+            hasher.update(chunk)
+    return size, hasher.hexdigest() if hasher is not None else None
+
+
+class _CompressedWriter:
+    """Write-only file that compresses into an owned raw file."""
+
+    def __init__(self, raw: BinaryIO, stream: BinaryIO):
+        self._raw = raw
+        self._stream = stream
+
+    def write(self, data: bytes) -> int:
+        return self._stream.write(data)
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._raw.close()
+
+    def __enter__(self) -> "_CompressedWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class StorageCompression:
+    """Per-category compression policy for scoped storage."""
+
+    def __init__(self, categories: Iterable[str] = None, codec: str = None, level: int = None):
+        """
+        Initialize compression policy.
+
+        Args:
+            categories: Categories whose text files are compressed
+            codec: 'zstd' (falls back to gzip if unavailable) or 'gzip'
+            level: Compression level (codec default if unset)
+        """
+        if categories is None:
+            categories = os.getenv("STORAGE_COMPRESSION_CATEGORIES", "").split(",")
+        self.categories = {category.strip() for category in categories if category.strip()}
+
+        codec = (codec or os.getenv("STORAGE_COMPRESSION_CODEC", "zstd")).lower()
+        if codec not in CODECS:
+            raise ValueError(f"Unknown compression codec: {codec}")
+        if codec == "zstd" and zstandard_lazy._load() is None:
+            if self.categories:
+                logger.warning("zstandard is not installed, compressing with gzip instead")
+            codec = "gzip"
+        self.codec = codec
+
+        level_env = os.getenv("STORAGE_COMPRESSION_LEVEL")
+        self.level = level if level is not None else (int(level_env) if level_env else None)
+
+    def codec_for(self, category: str, filename: str) -> Optional[str]:
+        """
+        Get the codec new content for a file is written with.
+
+        Args:
+            category: Category of the file
+            filename: Scoped file name
+
+        Returns:
+            The configured codec if the category is configured and the file
+            is text, otherwise None
+        """
+        if category in self.categories and is_compressible(filename):
+            return self.codec
+        return None
+
+    def open_writer(self, path: Path, codec: Optional[str]) -> BinaryIO:
+        """
+        Open a file for writing with a codec from codec_for().
+
+        Output is deterministic for a given codec and level, so identical
+        content still produces identical bytes.
+
+        Args:
+            path: File to create
+            codec: Codec to compress with (None = write as-is)
+
+        Returns:
+            Writable binary file object
+        """
+        raw = open(path, "wb")
+        if codec is None:
+            return raw
+
+        try:
+            if codec == "zstd":
+                compressor = zstandard_lazy.ZstdCompressor(level=self.level or 3)
+                stream = compressor.stream_writer(raw, closefd=False)
+            else:
+                stream = gzip.GzipFile(
+                    filename="", fileobj=raw, mode="wb",
+                    compresslevel=self.level or 6, mtime=0
+                )
+        except Exception:
+            raw.close()
+            raise
+        return _CompressedWriter(raw, stream)
@@ -0,0 +1,238 @@
+"""
+Token-budgeted context assembly for RAG prompts.
+Selects retrieved chunks by maximal marginal relevance, merges neighbouring
+chunks from the same source and stops at a token budget.
+"""
+
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from backend.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the number of LLM tokens in a text.
+
+    Uses the common ~4 characters per token heuristic, which is close
+    enough for budgeting without loading a tokenizer.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Estimated token count
+    """
+    return max(1, len(text) // 4)
+
+
+@dataclass
+class ContextSection:
+    """A contiguous piece of context built from one or more chunks."""
+    text: str
+    source_key: Tuple[Any, ...]
+    chunk_indexes: List[int]
+    docs: List[Dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class AssembledContext:
+    """Context selected for a prompt."""
+    sections: List[ContextSection]
+    used_docs: List[Dict[str, Any]]
+    token_count: int
+
+
+class ContextAssembler:
+    """Assemble prompt context from retrieved chunks."""
+
+    def __init__(
+        self,
+        token_budget: int = None,
+        mmr_lambda: float = None,
+        fetch_factor: int = None
+    ):
+        """
+        Initialize context assembler.
+
+        Args:
+            token_budget: Maximum estimated tokens of context
+            mmr_lambda: Relevance/diversity trade-off (1.0 = relevance only)
+            fetch_factor: Candidates retrieved per selected chunk
+        """
+        self.token_budget = token_budget or int(os.getenv("RAG_CONTEXT_TOKEN_BUDGET", "1500"))
+        self.mmr_lambda = mmr_lambda if mmr_lambda is not None else float(
+            os.getenv("RAG_MMR_LAMBDA", "0.7")
+        )
+        self.fetch_factor = fetch_factor or int(os.getenv("RAG_MMR_FETCH_FACTOR", "4"))
+
+    def candidate_count(self, top_k: int) -> int:
+        """
+        Number of candidates to retrieve for a final top_k selection.
+
+        Args:
+            top_k: Maximum number of chunks to select
+
+        Returns:
+            Candidate pool size
+        """
+        return top_k * self.fetch_factor
+
+    def _mmr_order(
+        self,
+        docs: List[Dict[str, Any]],
+        query_vector: Optional[np.ndarray]
+    ) -> List[int]:
+        """
+        Order candidates by maximal marginal relevance.
+
+        Candidates without embeddings fall back to relevance order.
+
+        Args:
+            docs: Retrieved candidates with 'score' and optional 'embedding'
+            query_vector: Normalized query embedding
+
+        Returns:
+            Candidate positions in selection order
+        """
+        if query_vector is None or any(doc.get("embedding") is None for doc in docs):
+            return sorted(range(len(docs)), key=lambda i: docs[i].get("score", 0.0), reverse=True)
+
+        embeddings = np.stack([doc["embedding"] for doc in docs])
+        relevance = embeddings @ query_vector
+        similarity = embeddings @ embeddings.T
+
+        selected: List[int] = []
+        max_similarity = np.full(len(docs), -np.inf, dtype=np.float32)
+        remaining = np.ones(len(docs), dtype=bool)
+
+        while remaining.any():
+            redundancy = np.where(np.isfinite(max_similarity), max_similarity, 0.0)
+            mmr = self.mmr_lambda * relevance - (1.0 - self.mmr_lambda) * redundancy
+            mmr[~remaining] = -np.inf
+            best = int(np.argmax(mmr))
+            selected.append(best)
+            remaining[best] = False
+            max_similarity = np.maximum(max_similarity, similarity[best])
+
+        return selected
+
+    @staticmethod
+    def _source_of(doc: Dict[str, Any]) -> Tuple[Tuple[Any, ...], Optional[int]]:
+        """
+        Get the merge key and chunk position of a document.
+
+        Args:
+            doc: Retrieved chunk
+
+        Returns:
+            Tuple of (source key, chunk index or None)
+        """
+        sources = doc.get("sources") or [{}]
+        primary = sources[0]
+        key = (doc.get("soul_id"), primary.get("category"), primary.get("filename"))
+        return key, primary.get("chunk_index")
+
+    def assemble(
+        self,
+        docs: List[Dict[str, Any]],
+        query_vector: Optional[np.ndarray] = None,
+        top_k: int = 5
+    ) -> AssembledContext:
+        """
+        Select and merge chunks into a token-budgeted context.
+
+        Args:
+            docs: Retrieved candidates, optionally carrying 'embedding'
+            query_vector: Normalized query embedding
+            top_k: Maximum number of chunks to select
+
+        Returns:
+            AssembledContext with sections in selection order and the
+            selected documents (without embeddings)
+        """
+        selected: List[Dict[str, Any]] = []
+        tokens = 0
+
+        for position in self._mmr_order(docs, query_vector):
+            if len(selected) >= top_k:
+                break
+
+            doc = {key: value for key, value in docs[position].items() if key != "embedding"}
+            text = doc.get("text", "")
+            if not text:
+                continue
+
+            doc_tokens = estimate_tokens(text)
+            if tokens + doc_tokens > self.token_budget:
+                if not selected:
+                    # Always keep the best chunk, trimmed to the budget
+                    doc["text"] = text[:self.token_budget * 4]
+                    selected.append(doc)
+                    tokens = estimate_tokens(doc["text"])
+                break
+
+            selected.append(doc)
+            tokens += doc_tokens
+
+        return AssembledContext(
+            sections=self._merge_neighbours(selected),
+            used_docs=selected,
+            token_count=tokens
+        )
+
+    def _merge_neighbours(self, selected: List[Dict[str, Any]]) -> List[ContextSection]:
+        """
+        Merge selected chunks that are adjacent in the same source.
+
+        Sections keep the selection rank of their best chunk; chunks inside
+        a section are ordered by position in the source.
+
+        Args:
+            selected: Selected chunks in selection order
+
+        Returns:
+            List of context sections
+        """
+        sections: List[ContextSection] = []
+        by_source: Dict[Tuple[Any, ...], List[ContextSection]] = {}
+
+        for doc in selected:
+            key, chunk_index = self._source_of(doc)
+            merged = False
+
+            if chunk_index is not None:
+                for section in by_source.get(key, []):
+                    if chunk_index == section.chunk_indexes[-1] + 1:
+                        section.text = f"{section.text} {doc['text']}"
+                        section.chunk_indexes.append(chunk_index)
+                    elif chunk_index == section.chunk_indexes[0] - 1:
+                        section.text = f"{doc['text']} {section.text}"
+                        section.chunk_indexes.insert(0, chunk_index)
+                    else:
+                        continue
+                    section.docs.append(doc)
+                    merged = True
+                    break
+
+            if not merged:
+                section = ContextSection(
+                    text=doc["text"],
+                    source_key=key,
+                    chunk_indexes=[chunk_index] if chunk_index is not None else [],
+                    docs=[doc]
+                )
+                sections.append(section)
+                if chunk_index is not None:
+                    by_source.setdefault(key, []).append(section)
+
+        return sections
+
+
+# Global instance
+context_assembler = ContextAssembler()
@@ -0,0 +1,175 @@
+"""
+HTTP responses for downloading scoped files.
+
+Files stored as-is are served with Starlette's FileResponse, which handles
+Range requests and hands the path to the server through the ASGI pathsend
+extension where supported (so the server can use sendfile and the bytes
+never pass through Python). Files the catalog records as compressed are
+sent with their stored Content-Encoding when the client accepts it, and
+otherwise decompressed as a stream; everything else is sent byte for
+byte, whatever it looks like. Every response carries ETag and Last-Modified, and conditional
+GETs that still match are answered with 304.
+"""
+
+import mimetypes
+import os
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Optional
+from urllib.parse import quote
+
+from fastapi import Request, Response, status
+from fastapi.responses import FileResponse, StreamingResponse
+
+from backend.core.compression import iter_stored_file
+from backend.core.scoped_storage import FileInfo
+
+# Content-Encoding tokens of the storage codecs
+CONTENT_ENCODINGS = {"gzip": "gzip", "zstd": "zstd"}
+
+
+def content_disposition(filename: str) -> str:
+    """Attachment disposition header value, RFC 5987-encoded when needed."""
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"attachment; filename*=utf-8''{quoted}"
+    return f'attachment; filename="{filename}"'
+
+
+def make_etag(file_info: FileInfo, stats: os.stat_result, encoding: Optional[str] = None) -> str:
+    """
+    Build a strong ETag for a file representation.
+
+    Content-hashed files get an ETag derived from the hash, which stays
+    stable across re-uploads of identical content; other files fall back
+    to modification time and size.
+
+    Args:
+        file_info: Stored file details
+        stats: stat() result of the stored file
+        encoding: Content-Encoding of the representation, if any
+
+    Returns:
+        Quoted ETag value
+    """
+    if file_info.content_hash:
+        tag = file_info.content_hash
+    else:
+        tag = f"{stats.st_mtime_ns:x}-{stats.st_size:x}"
+    if encoding:
+        tag = f"{tag}-{encoding}"
+    return f'"{tag}"'
+
+
+def is_not_modified(request: Request, etag: str, last_modified: float) -> bool:
+    """
+    Evaluate conditional GET headers.
+
+    If-None-Match takes precedence over If-Modified-Since (RFC 9110).
+
+    Args:
+        request: Incoming request
+        etag: Current ETag
+        last_modified: Modification time (epoch seconds)
+
+    Returns:
+        True if the client's cached copy is still current
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        # Weak comparison: W/ prefixes are ignored
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return etag.removeprefix("W/") in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+        return int(last_modified) <= since
+
+    return False
+
+
+def accepts_encoding(request: Request, encoding: str) -> bool:
+    """
+    Check whether the client accepts a content coding.
+
+    Args:
+        request: Incoming request
+        encoding: Content-Encoding token
+
+    Returns:
+        True if Accept-Encoding lists the coding with a non-zero q-value
+    """
+    for item in request.headers.get("accept-encoding", "").split(","):
+        token, _, params = item.strip().partition(";")
+        if token.strip().lower() != encoding:
+            continue
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                return float(q[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+def build_download_response(request: Request, file_info: FileInfo) -> Response:
+    """
+    Build the response for downloading a stored file.
+
+    Performs blocking stat() and header reads; call it from a worker thread.
+
+    Args:
+        request: Incoming request (for conditional, Range and encoding headers)
+        file_info: Stored file details from ScopedStorage.get_file_info
+
+    Returns:
+        FileResponse, StreamingResponse or a 304 response
+
+    Raises:
+        FileNotFoundError: If the file disappeared
+    """
+    path = Path(file_info.path)
+    stats = path.stat()
+    codec = file_info.codec
+    encoding = CONTENT_ENCODINGS.get(codec) if codec else None
+
+    passthrough = encoding is not None and accepts_encoding(request, encoding)
+    etag = make_etag(file_info, stats, encoding if passthrough else None)
+    last_modified = formatdate(stats.st_mtime, usegmt=True)
+    headers = {"etag": etag, "last-modified": last_modified}
+    if encoding is not None:
+        headers["vary"] = "Accept-Encoding"
+
+    if is_not_modified(request, etag, stats.st_mtime):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if encoding is None or passthrough:
+        if passthrough:
+            headers["content-encoding"] = encoding
+        return FileResponse(
+            path,
+            stat_result=stats,
+            headers=headers,
+            filename=file_info.filename
+        )
+
+    # Client cannot decode the stored encoding: decompress on the fly.
+    # The decoded stream is not seekable, so Range is not offered.
+    headers["accept-ranges"] = "none"
+    # The codec comes from the catalog entry that also recorded the logical
+    # size; without one the length is unknown and the body goes chunked
+    if file_info.codec is not None and file_info.size != file_info.physical_size:
+        headers["content-length"] = str(file_info.size)
+    headers["content-disposition"] = content_disposition(file_info.filename)
+    return StreamingResponse(
+        iter_stored_file(path, codec),
+        headers=headers,
+        media_type=mimetypes.guess_type(file_info.filename)[0] or "application/octet-stream"
+    )
@@ -0,0 +1,69 @@
+"""
+Text embedding providers for RAG indexing and retrieval.
+The sentence-transformers model is loaded lazily on first use.
+"""
+
+import os
+import threading
+from typing import List, Optional
+
+import numpy as np
+
+from backend.core.lazy_init import embeddings_lazy
+from backend.core.logging_config import get_logger
+from backend.core.vector_index import normalize_rows
+
+logger = get_logger(__name__)
+
+
+class SentenceTransformerEmbedder:
+    """Embed texts with a sentence-transformers model."""
+
+    def __init__(self, model_name: Optional[str] = None, batch_size: int = 64):
+        """
+        Initialize embedder.
+
+        Args:
+            model_name: sentence-transformers model name
+            batch_size: Number of texts encoded per batch
+        """
+        self.model_name = model_name or os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2")
+        self.batch_size = batch_size
+        self._model = None
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> bool:
+        """Check if sentence-transformers is installed."""
+        return embeddings_lazy._load() is not None
+
+    def _get_model(self):
+        """Load the model on first use."""
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    logger.info(f"Loading embedding model: {self.model_name}")
+                    self._model = embeddings_lazy(self.model_name)
+        return self._model
+
+    def __call__(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed a list of texts.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            2D float32 array of normalized embeddings, one row per text
+        """
+        vectors = self._get_model().encode(
+            texts,
+            batch_size=self.batch_size,
+            convert_to_numpy=True,
+            show_progress_bar=False
+        )
+        return normalize_rows(vectors)
+
+
+# Global instance
+default_embedder = SentenceTransformerEmbedder()
@@ -25,6 +25,24 @@ class StorageError(CyberSeedException):
     pass
 
 
+class FileTooLargeError(StorageError):
+    """Raised when an upload exceeds the maximum allowed size."""
+    pass
+
+
+class UploadSessionNotFoundError(StorageError):
+    """Raised when a resumable upload session does not exist or has expired."""
+    pass
+
+
+class UploadOffsetError(StorageError):
+    """Raised when a resumable upload chunk does not start at the current offset."""
+
+    def __init__(self, message: str, current_offset: int):
+        super().__init__(message)
+        self.current_offset = current_offset
+
+
 class RAGError(CyberSeedException):
     """Raised when RAG operations fail."""
     pass
@@ -35,6 +53,16 @@ class TranscriptionError(CyberSeedException):
     pass
 
 
+class TranscriptionJobNotFoundError(TranscriptionError):
+    """Raised when a transcription job does not exist."""
+    pass
+
+
+class TranscriptionCancelledError(TranscriptionError):
+    """Raised inside a transcription worker when its job was cancelled."""
+    pass
+
+
 class LLMError(CyberSeedException):
     """Raised when LLM operations fail."""
     pass
@@ -0,0 +1,97 @@
+"""
+Online migration from the flat to the hash-sharded data layout.
+
+Each owner directory is moved with a single rename, which is atomic on the
+same filesystem, so the server can keep running with STORAGE_LAYOUT=sharded
+while the migration proceeds: owners not yet moved resolve to their flat
+path, moved owners to their sharded path. If a request recreated a flat
+directory while its owner was being moved, the leftover entries are merged
+into the sharded tree.
+"""
+
+import os
+from pathlib import Path
+from typing import Dict
+
+from backend.core.logging_config import get_logger
+from backend.core.scoped_storage import ScopedPathBuilder
+
+logger = get_logger(__name__)
+
+
+def _merge_tree(source: Path, target: Path) -> int:
+    """
+    Move the contents of source into target, then remove source.
+
+    Entries missing in target are renamed over; directories present in
+    both are merged recursively; for files present in both the newer one
+    wins.
+
+    Args:
+        source: Leftover directory
+        target: Authoritative directory
+
+    Returns:
+        Number of entries moved
+    """
+    moved = 0
+    target.mkdir(parents=True, exist_ok=True)
+
+    for entry in list(source.iterdir()):
+        destination = target / entry.name
+        if not destination.exists():
+            os.rename(entry, destination)
+            moved += 1
+        elif entry.is_dir() and destination.is_dir():
+            moved += _merge_tree(entry, destination)
+        elif entry.stat().st_mtime > destination.stat().st_mtime:
+            os.replace(entry, destination)
+            moved += 1
+        else:
+            entry.unlink()
+
+    source.rmdir()
+    return moved
+
+
+def migrate_to_sharded(data_dir: str = None, dry_run: bool = False) -> Dict[str, int]:
+    """
+    Move every flat-layout owner directory into the sharded layout.
+
+    Safe to run repeatedly and while the server is running in sharded mode.
+
+    Args:
+        data_dir: Root data directory (default: DATA_DIR)
+        dry_run: Only count the owners that would be moved
+
+    Returns:
+        Dictionary with moved, merged and remaining owner counts
+    """
+    path_builder = ScopedPathBuilder(data_dir, layout=ScopedPathBuilder.LAYOUT_SHARDED)
+    result = {"moved": 0, "merged": 0, "remaining": 0}
+
+    for owner_id in path_builder.list_flat_owner_ids():
+        flat_path = path_builder.flat_owner_path(owner_id)
+        sharded_path = path_builder.sharded_owner_path(owner_id)
+
+        if dry_run:
+            result["remaining"] += 1
+            continue
+
+        try:
+            if sharded_path.exists():
+                _merge_tree(flat_path, sharded_path)
+                result["merged"] += 1
+            else:
+                sharded_path.parent.mkdir(parents=True, exist_ok=True)
+                os.rename(flat_path, sharded_path)
+                result["moved"] += 1
+        except OSError as e:
+            logger.error(f"Failed to migrate owner {owner_id}: {e}")
+            result["remaining"] += 1
+
+    logger.info(
+        f"Layout migration: {result['moved']} moved, {result['merged']} merged, "
+        f"{result['remaining']} remaining"
+    )
+    return result
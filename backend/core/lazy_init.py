@@ -133,6 +133,18 @@ def _import_whisper():
 whisper_lazy = lazy_import('whisper', _import_whisper)
 
 
+# Zstandard lazy import
+def _import_zstandard():
+    """Custom import for zstd compression."""
+    try:
+        import zstandard
+        return zstandard
+    except ImportError:
+        return None
+
+zstandard_lazy = lazy_import('zstandard', _import_zstandard)
+
+
 # Transformers lazy imports
 def _import_transformers():
     """Custom import for transformers library."""
@@ -1,4 +1,5 @@
 from .router import run_inference
 from .model_registry import get_model_config, MODELS
+from .scheduler import inference_scheduler
 
-__all__ = ["run_inference", "get_model_config", "MODELS"]
+__all__ = ["run_inference", "get_model_config", "MODELS", "inference_scheduler"]
@@ -1,6 +1,7 @@
 from typing import List, Optional
 from .model_registry import get_model_config, DEFAULT_MODEL
 from .local_ollama import OllamaClient
+from .scheduler import inference_scheduler
 
 PROVIDERS = {
     "ollama": OllamaClient
@@ -9,8 +10,16 @@ PROVIDERS = {
 async def run_inference(
     prompt: str,
     history: Optional[List[dict]] = None,
-    model_id: Optional[str] = None
+    model_id: Optional[str] = None,
+    owner_id: Optional[str] = None,
+    role: str = "owner"
 ) -> str:
+    if owner_id is not None:
+        # Wait for this owner's fair share of the model
+        history_text = " ".join(msg.get("content", "") for msg in history or [])
+        async with inference_scheduler.slot(owner_id, role, f"{history_text} {prompt}"):
+            return await run_inference(prompt, history, model_id)
+    
     if model_id is None:
         model_id = DEFAULT_MODEL
     
@@ -0,0 +1,273 @@
+"""
+Fair scheduling of LLM inference across owners.
+
+Only LLM_MAX_CONCURRENT_INFERENCES requests are sent to the model server
+at once; the rest wait in one queue per owner. Free slots are handed out
+by deficit round-robin: owners with waiting requests take turns, and
+each turn adds a quantum of estimated prompt tokens, scaled by the
+weight of the requester's role, to the owner's deficit. An owner's
+requests are dispatched while their cost fits its deficit. An owner
+firing a batch of requests therefore only delays others by its share,
+while admins (LLM_ROLE_WEIGHTS) get a larger one.
+"""
+
+import asyncio
+import itertools
+import os
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Deque, Dict, Optional
+
+import numpy as np
+
+from backend.core.context_assembler import estimate_tokens
+from backend.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_ROLE_WEIGHTS = {"owner": 1.0, "admin": 4.0}
+
+# Queue waits kept per owner for percentiles
+WAIT_SAMPLES = 1000
+
+
+def parse_role_weights(value: Optional[str]) -> Dict[str, float]:
+    """
+    Parse role weights like "owner=1,admin=4" over the defaults.
+
+    Args:
+        value: Comma-separated role=weight pairs
+
+    Returns:
+        Weight per role
+    """
+    weights = dict(DEFAULT_ROLE_WEIGHTS)
+    for item in (value or "").split(","):
+        role, _, weight = item.partition("=")
+        if role.strip() and weight.strip():
+            weights[role.strip()] = max(0.01, float(weight))
+    return weights
+
+
+@dataclass(eq=False)
+class _Waiter:
+    """A request waiting for an inference slot."""
+    future: asyncio.Future
+    cost: int
+    weight: float
+    enqueued_at: float
+
+
+@dataclass
+class _OwnerStats:
+    """Queueing metrics of one owner."""
+    requests: int = 0
+    cancelled: int = 0
+    running: int = 0
+    # Requests queued or running; owners with none may be forgotten
+    active: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    waits: Deque[float] = field(default_factory=lambda: deque(maxlen=WAIT_SAMPLES))
+
+
+class FairInferenceScheduler:
+    """Deficit round-robin scheduler of inference slots across owners."""
+
+    def __init__(
+        self,
+        max_concurrent: int = None,
+        quantum: int = None,
+        role_weights: Dict[str, float] = None,
+        max_tracked_owners: int = None
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            max_concurrent: Requests sent to the model at once (LLM_MAX_CONCURRENT_INFERENCES)
+            quantum: Estimated prompt tokens an owner may dispatch per turn at
+                weight 1 (LLM_FAIR_QUANTUM_TOKENS)
+            role_weights: Share multiplier per role (LLM_ROLE_WEIGHTS)
+            max_tracked_owners: Owners whose queue metrics are kept; the least
+                recently active idle owners are forgotten beyond it
+                (LLM_STATS_MAX_OWNERS)
+        """
+        self.max_concurrent = max(1, max_concurrent or int(os.getenv("LLM_MAX_CONCURRENT_INFERENCES", "2")))
+        self.quantum = quantum or int(os.getenv("LLM_FAIR_QUANTUM_TOKENS", "1000"))
+        self.role_weights = role_weights or parse_role_weights(os.getenv("LLM_ROLE_WEIGHTS"))
+        self.max_tracked_owners = max(1, max_tracked_owners or int(os.getenv("LLM_STATS_MAX_OWNERS", "1000")))
+
+        # Owners with waiting requests, in round-robin order
+        self._queues: "OrderedDict[str, Deque[_Waiter]]" = OrderedDict()
+        self._deficits: Dict[str, float] = {}
+        # Whether the owner at the head of the round has received its quantum
+        self._turn_started = False
+        self._running = 0
+        # Per-owner metrics, least recently active first
+        self._stats: "OrderedDict[str, _OwnerStats]" = OrderedDict()
+
+        logger.info(
+            f"FairInferenceScheduler initialized ({self.max_concurrent} concurrent, "
+            f"quantum {self.quantum} tokens, weights {self.role_weights})"
+        )
+
+    def _dispatch(self) -> None:
+        """Hand free slots to waiting requests in deficit round-robin order."""
+        while self._running < self.max_concurrent and self._queues:
+            owner_id, queue = next(iter(self._queues.items()))
+            head = queue[0]
+            if head.future.done():
+                # Cancelled before it could withdraw itself
+                queue.popleft()
+                if not queue:
+                    del self._queues[owner_id]
+                    self._deficits.pop(owner_id, None)
+                    self._turn_started = False
+                continue
+            if not self._turn_started:
+                self._deficits[owner_id] = self._deficits.get(owner_id, 0.0) + self.quantum * head.weight
+                self._turn_started = True
+
+            if head.cost > self._deficits[owner_id]:
+                # Turn over: keep the deficit and move to the back of the round
+                self._queues.move_to_end(owner_id)
+                self._turn_started = False
+                continue
+
+            queue.popleft()
+            self._deficits[owner_id] -= head.cost
+            if not queue:
+                # Idle owners do not bank credit
+                del self._queues[owner_id]
+                self._deficits.pop(owner_id, None)
+                self._turn_started = False
+            self._running += 1
+            head.future.set_result(None)
+
+    def _release(self, stats: _OwnerStats) -> None:
+        """Free a slot and dispatch the next request."""
+        self._running -= 1
+        stats.running -= 1
+        self._dispatch()
+
+    def _owner_stats(self, owner_id: str) -> _OwnerStats:
+        """
+        Get an owner's metrics and mark the owner as just active.
+
+        Beyond max_tracked_owners, the least recently active owners without
+        queued or running requests are forgotten, so the metrics of owners
+        that come and go do not accumulate.
+        """
+        stats = self._stats.get(owner_id)
+        if stats is None:
+            stats = self._stats[owner_id] = _OwnerStats()
+        self._stats.move_to_end(owner_id)
+
+        excess = len(self._stats) - self.max_tracked_owners
+        if excess > 0:
+            idle = (owner for owner, owner_stats in self._stats.items() if not owner_stats.active)
+            for owner in list(itertools.islice(idle, excess)):
+                if owner != owner_id:
+                    del self._stats[owner]
+        return stats
+
+    def _withdraw(self, owner_id: str, waiter: _Waiter) -> None:
+        """Remove a request that was cancelled while queued."""
+        queue = self._queues.get(owner_id)
+        if queue is None or waiter not in queue:
+            return
+        at_head = next(iter(self._queues)) == owner_id
+        queue.remove(waiter)
+        if not queue:
+            del self._queues[owner_id]
+            self._deficits.pop(owner_id, None)
+            if at_head:
+                self._turn_started = False
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, owner_id: str, role: str, prompt: str) -> AsyncIterator[None]:
+        """
+        Wait for an inference slot and hold it for the duration of the block.
+
+        Args:
+            owner_id: Owner the request is charged to
+            role: Requester role (selects the weight)
+            prompt: Prompt text (its estimated tokens are the request's cost)
+        """
+        waiter = _Waiter(
+            future=asyncio.get_running_loop().create_future(),
+            cost=estimate_tokens(prompt),
+            weight=self.role_weights.get(role, 1.0),
+            enqueued_at=time.monotonic()
+        )
+        stats = self._owner_stats(owner_id)
+        stats.active += 1
+        try:
+            self._queues.setdefault(owner_id, deque()).append(waiter)
+            self._dispatch()
+
+            try:
+                await waiter.future
+            except asyncio.CancelledError:
+                stats.cancelled += 1
+                if waiter.future.done() and not waiter.future.cancelled():
+                    # Granted just as the caller went away: pass the slot on
+                    self._running -= 1
+                    self._dispatch()
+                else:
+                    self._withdraw(owner_id, waiter)
+                raise
+
+            wait = time.monotonic() - waiter.enqueued_at
+            stats.requests += 1
+            stats.running += 1
+            stats.total_wait += wait
+            stats.max_wait = max(stats.max_wait, wait)
+            stats.waits.append(wait)
+            try:
+                yield
+            finally:
+                self._release(stats)
+        finally:
+            stats.active -= 1
+
+    def get_stats(self, owner_id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get queueing metrics.
+
+        Args:
+            owner_id: Only report this owner
+
+        Returns:
+            Dictionary with slot usage and per-owner queue waits in milliseconds
+        """
+        owners = {}
+        for owner, stats in self._stats.items():
+            if owner_id is not None and owner != owner_id:
+                continue
+            waits = np.array(stats.waits) * 1000.0 if stats.waits else np.zeros(1)
+            owners[owner] = {
+                "queued": len(self._queues.get(owner, ())),
+                "running": stats.running,
+                "requests": stats.requests,
+                "cancelled": stats.cancelled,
+                "mean_wait_ms": round(stats.total_wait * 1000.0 / stats.requests, 2) if stats.requests else 0.0,
+                "p50_wait_ms": round(float(np.percentile(waits, 50)), 2),
+                "p95_wait_ms": round(float(np.percentile(waits, 95)), 2),
+                "max_wait_ms": round(stats.max_wait * 1000.0, 2),
+            }
+        return {
+            "max_concurrent": self.max_concurrent,
+            "running": self._running,
+            "queued": sum(len(queue) for queue in self._queues.values()),
+            "role_weights": self.role_weights,
+            "owners": owners,
+        }
+
+
+# Global instance
+inference_scheduler = FairInferenceScheduler()
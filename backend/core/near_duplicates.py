@@ -0,0 +1,186 @@
+"""
+Near-duplicate text detection using MinHash signatures and LSH banding.
+Used by the RAG indexing pipeline to store repeated chunks only once.
+"""
+
+import hashlib
+import re
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+# Mersenne prime used for the universal hash family
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text for duplicate comparison.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Lowercased text with punctuation and whitespace collapsed
+    """
+    return " ".join(_TOKEN_PATTERN.findall(text.lower()))
+
+
+def shingles(text: str, size: int = 3) -> Set[bytes]:
+    """
+    Build word shingles for a text.
+
+    Args:
+        text: Input text
+        size: Number of words per shingle
+
+    Returns:
+        Set of encoded shingles
+    """
+    words = _TOKEN_PATTERN.findall(text.lower())
+    if len(words) <= size:
+        return {" ".join(words).encode("utf-8")} if words else set()
+
+    return {
+        " ".join(words[i:i + size]).encode("utf-8")
+        for i in range(len(words) - size + 1)
+    }
+
+
+class MinHasher:
+    """Compute fixed-length MinHash signatures for texts."""
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 3, seed: int = 1):
+        """
+        Initialize MinHasher.
+
+        Args:
+            num_perm: Number of hash permutations (signature length)
+            shingle_size: Number of words per shingle
+            seed: Seed for the permutation parameters
+        """
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+
+    def signature(self, text: str) -> Tuple[int, ...]:
+        """
+        Compute the MinHash signature of a text.
+
+        Args:
+            text: Input text
+
+        Returns:
+            Tuple of num_perm minimum hash values
+        """
+        hashes = np.fromiter(
+            (
+                int.from_bytes(hashlib.blake2b(shingle, digest_size=4).digest(), "little")
+                for shingle in shingles(text, self.shingle_size)
+            ),
+            dtype=np.uint64
+        )
+        if len(hashes) == 0:
+            return tuple([_MAX_HASH] * self.num_perm)
+
+        # uint64 arithmetic wraps on overflow, which is fine for hashing
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % np.uint64(_MERSENNE_PRIME)
+        return tuple((permuted & np.uint64(_MAX_HASH)).min(axis=1).tolist())
+
+    @staticmethod
+    def jaccard(sig_a: Tuple[int, ...], sig_b: Tuple[int, ...]) -> float:
+        """
+        Estimate Jaccard similarity from two signatures.
+
+        Args:
+            sig_a: First signature
+            sig_b: Second signature
+
+        Returns:
+            Estimated Jaccard similarity in [0, 1]
+        """
+        matches = sum(1 for a, b in zip(sig_a, sig_b) if a == b)
+        return matches / len(sig_a)
+
+
+class NearDuplicateIndex:
+    """
+    LSH index that maps each text to the first near-identical text seen.
+
+    Exact duplicates (after normalization) are resolved with a digest lookup.
+    Everything else goes through MinHash signatures split into bands; texts
+    that share a band bucket are verified against the similarity threshold.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = 128,
+        bands: int = 16,
+        shingle_size: int = 3
+    ):
+        """
+        Initialize near-duplicate index.
+
+        Args:
+            threshold: Minimum estimated Jaccard similarity to count as duplicate
+            num_perm: Signature length (must be divisible by bands)
+            bands: Number of LSH bands
+            shingle_size: Number of words per shingle
+        """
+        if num_perm % bands != 0:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.hasher = MinHasher(num_perm=num_perm, shingle_size=shingle_size)
+
+        self._exact: Dict[str, int] = {}
+        self._buckets: List[Dict[Tuple[int, ...], List[int]]] = [{} for _ in range(bands)]
+        self._signatures: Dict[int, Tuple[int, ...]] = {}
+
+    def find_or_add(self, key: int, text: str) -> Optional[int]:
+        """
+        Look up a near-duplicate of text, adding text if none exists.
+
+        Args:
+            key: Identifier for text if it is new
+            text: Text to check
+
+        Returns:
+            Key of the existing near-duplicate, or None if text was added
+        """
+        normalized = normalize_text(text)
+        digest = hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+        if digest in self._exact:
+            return self._exact[digest]
+
+        signature = self.hasher.signature(normalized)
+        band_keys = [
+            tuple(signature[band * self.rows:(band + 1) * self.rows])
+            for band in range(self.bands)
+        ]
+
+        seen: Set[int] = set()
+        for band, band_key in enumerate(band_keys):
+            for candidate in self._buckets[band].get(band_key, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                if MinHasher.jaccard(signature, self._signatures[candidate]) >= self.threshold:
+                    self._exact[digest] = candidate
+                    return candidate
+
+        self._exact[digest] = key
+        self._signatures[key] = signature
+        for band, band_key in enumerate(band_keys):
+            self._buckets[band].setdefault(band_key, []).append(key)
+
+        return None
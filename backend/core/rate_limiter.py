@@ -0,0 +1,514 @@
+"""
+Request rate limiting with token buckets.
+
+Every request takes tokens from two buckets: one for the authenticated
+owner and one for the client IP. A request is admitted only if both
+buckets hold enough tokens, so one owner cannot flood the API from many
+addresses and one address cannot flood it with many tokens. Routes have
+different costs: a chat or training request costs far more than listing
+files. Owner buckets refill continuously at RATE_LIMIT_PER_MINUTE tokens
+per minute (IP buckets at RATE_LIMIT_PER_IP_PER_MINUTE) and hold at most
+one minute's worth.
+
+Behind a reverse proxy every request comes from the proxy's address, so
+the client IP is taken from X-Forwarded-For when the connection comes from
+one of RATE_LIMIT_TRUSTED_PROXIES; otherwise that header is ignored, since
+clients could forge it.
+
+Bucket state lives in memory by default, in shards with their own locks.
+With several uvicorn workers, RATE_LIMIT_BACKEND=sqlite keeps the buckets
+in a SQLite database inside the data directory so limits are shared.
+"""
+
+import asyncio
+import hashlib
+import ipaddress
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from fastapi import HTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from backend.core.auth import authenticate_token
+from backend.core.logging_config import get_logger
+from backend.core.security_config import security_config
+
+logger = get_logger(__name__)
+
+# Route costs in tokens, by route name (override with RATE_LIMIT_ROUTE_COSTS)
+DEFAULT_ROUTE_COSTS = {
+    "chat": 10,
+    "train": 20,
+    "transcribe": 10,
+    "upload": 2,
+    "default": 1,
+}
+
+# (method, path pattern, route name); the first match names the route
+ROUTE_PATTERNS = [
+    ("POST", re.compile(r"^/(souls/[^/]+/[^/]+|owners/[^/]+)/chat$"), "chat"),
+    ("POST", re.compile(r"^/souls/[^/]+/[^/]+/train$"), "train"),
+    ("POST", re.compile(r"^/souls/[^/]+/[^/]+/transcribe$"), "transcribe"),
+    (None, re.compile(r"^/souls/[^/]+/[^/]+/uploads?(/.*)?$"), "upload"),
+]
+
+# Paths that are never limited
+EXEMPT_PATHS = {"/health", "/docs", "/redoc", "/openapi.json"}
+
+
+def parse_route_costs(value: Optional[str]) -> Dict[str, int]:
+    """
+    Parse route costs like "chat=10,train=20" over the defaults.
+
+    Args:
+        value: Comma-separated name=cost pairs
+
+    Returns:
+        Cost per route name
+    """
+    costs = dict(DEFAULT_ROUTE_COSTS)
+    for item in (value or "").split(","):
+        name, _, cost = item.partition("=")
+        if name.strip() and cost.strip():
+            costs[name.strip()] = max(0, int(cost))
+    return costs
+
+
+def parse_trusted_proxies(value: Optional[str]) -> List[Union[ipaddress.IPv4Network, ipaddress.IPv6Network]]:
+    """
+    Parse trusted proxy addresses like "10.0.0.0/8,127.0.0.1".
+
+    Args:
+        value: Comma-separated addresses or networks
+
+    Returns:
+        Networks whose X-Forwarded-For headers are trusted
+    """
+    return [
+        ipaddress.ip_network(item.strip(), strict=False)
+        for item in (value or "").split(",") if item.strip()
+    ]
+
+
+@dataclass
+class RateLimitDecision:
+    """Outcome of taking tokens for a request."""
+    allowed: bool
+    limit: int
+    remaining: int
+    # Seconds until the most depleted bucket is full again
+    reset: float
+    # Seconds until the request could be admitted (0 if allowed)
+    retry_after: float
+
+
+# A bucket to charge: (key, capacity); capacity refills once per minute
+Bucket = Tuple[str, float]
+
+
+def _refill(tokens: float, updated: float, now: float, capacity: float) -> float:
+    """Tokens in a bucket after refilling since its last update."""
+    return min(capacity, tokens + (now - updated) * capacity / 60.0)
+
+
+def _decide(buckets: Sequence[Bucket], levels: List[float], cost: float) -> RateLimitDecision:
+    """Decide on a request given the current levels of its buckets."""
+    allowed = all(level >= cost for level in levels)
+    # Report the bucket with the fewest tokens left
+    after = [level - cost if allowed else level for level in levels]
+    tightest = min(range(len(buckets)), key=lambda i: after[i])
+    capacity = buckets[tightest][1]
+    rate = capacity / 60.0
+    return RateLimitDecision(
+        allowed=allowed,
+        limit=int(capacity),
+        remaining=max(0, int(after[tightest])),
+        reset=(capacity - after[tightest]) / rate,
+        retry_after=0.0 if allowed else max(
+            (cost - level) / (bucket[1] / 60.0)
+            for bucket, level in zip(buckets, levels) if level < cost
+        )
+    )
+
+
+class MemoryBucketStore:
+    """Token buckets in process memory, sharded to keep lock contention low."""
+
+    blocking = False
+
+    def __init__(self, shards: int = 16):
+        """
+        Initialize memory bucket store.
+
+        Args:
+            shards: Number of independently locked shards
+        """
+        self._shards: List[Dict[str, Tuple[float, float]]] = [{} for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+        self._operations = 0
+
+    def _shard_of(self, key: str) -> int:
+        """Shard holding a bucket."""
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=4).digest()
+        return int.from_bytes(digest, "big") % len(self._shards)
+
+    def take(self, buckets: Sequence[Bucket], cost: float) -> RateLimitDecision:
+        """
+        Take cost tokens from every bucket, or from none of them.
+
+        Args:
+            buckets: Buckets the request is charged to
+            cost: Tokens the request costs
+
+        Returns:
+            RateLimitDecision
+        """
+        now = time.monotonic()
+        shards = sorted({self._shard_of(key) for key, _ in buckets})
+        # Locks are always taken in shard order, so requests cannot deadlock
+        for shard in shards:
+            self._locks[shard].acquire()
+        try:
+            levels = []
+            for key, capacity in buckets:
+                tokens, updated = self._shards[self._shard_of(key)].get(key, (capacity, now))
+                levels.append(_refill(tokens, updated, now, capacity))
+            decision = _decide(buckets, levels, cost)
+            for (key, _), level in zip(buckets, levels):
+                self._shards[self._shard_of(key)][key] = (
+                    level - cost if decision.allowed else level, now
+                )
+        finally:
+            for shard in reversed(shards):
+                self._locks[shard].release()
+
+        self._operations += 1
+        if self._operations % 10000 == 0:
+            self._prune(now)
+        return decision
+
+    def _prune(self, now: float) -> None:
+        """Forget buckets idle for a minute; they have refilled and equal new ones."""
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                for key in [k for k, (_, updated) in shard.items() if now - updated >= 60.0]:
+                    del shard[key]
+
+    def reset(self) -> None:
+        """Drop all buckets."""
+        for shard, lock in zip(self._shards, self._locks):
+            with lock:
+                shard.clear()
+
+
+class SQLiteBucketStore:
+    """Token buckets in a SQLite database shared by all server processes."""
+
+    DB_FILENAME = ".rate-limits.db"
+    blocking = True
+
+    def __init__(self, data_dir: Path):
+        """
+        Initialize SQLite bucket store.
+
+        Args:
+            data_dir: Root data directory; the database lives inside it
+        """
+        self.db_path = Path(data_dir) / self.DB_FILENAME
+        self._local = threading.local()
+        self._initialized = False
+        self._init_lock = threading.Lock()
+        self._operations = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's connection, creating the schema on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=OFF")
+
+        with self._init_lock:
+            if not self._initialized:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS buckets ("
+                    "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL"
+                    ") WITHOUT ROWID"
+                )
+                self._initialized = True
+
+        self._local.conn = conn
+        return conn
+
+    def take(self, buckets: Sequence[Bucket], cost: float) -> RateLimitDecision:
+        """Take cost tokens from every bucket, or from none of them (see MemoryBucketStore)."""
+        conn = self._connect()
+        # Wall-clock time: processes do not share a monotonic clock
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            levels = []
+            for key, capacity in buckets:
+                row = conn.execute(
+                    "SELECT tokens, updated FROM buckets WHERE key = ?", (key,)
+                ).fetchone()
+                tokens, updated = row if row else (capacity, now)
+                levels.append(_refill(tokens, min(updated, now), now, capacity))
+            decision = _decide(buckets, levels, cost)
+            conn.executemany(
+                "INSERT OR REPLACE INTO buckets VALUES (?, ?, ?)",
+                [
+                    (key, level - cost if decision.allowed else level, now)
+                    for (key, _), level in zip(buckets, levels)
+                ]
+            )
+            self._operations += 1
+            if self._operations % 10000 == 0:
+                conn.execute("DELETE FROM buckets WHERE updated < ?", (now - 60.0,))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return decision
+
+    def reset(self) -> None:
+        """Drop all buckets."""
+        self._connect().execute("DELETE FROM buckets")
+
+
+class RateLimiter:
+    """Per-owner and per-IP token bucket rate limiter."""
+
+    def __init__(
+        self,
+        per_minute: int = None,
+        ip_per_minute: int = None,
+        route_costs: Dict[str, int] = None,
+        backend: str = None,
+        data_dir: str = None,
+        trusted_proxies: Sequence[str] = None
+    ):
+        """
+        Initialize rate limiter.
+
+        Args:
+            per_minute: Tokens per owner per minute (RATE_LIMIT_PER_MINUTE; 0 disables limiting)
+            ip_per_minute: Tokens per client IP per minute (RATE_LIMIT_PER_IP_PER_MINUTE;
+                0 disables the IP buckets)
+            route_costs: Cost per route name (RATE_LIMIT_ROUTE_COSTS)
+            backend: Bucket store, memory or sqlite (RATE_LIMIT_BACKEND)
+            data_dir: Root data directory for the sqlite backend
+            trusted_proxies: Proxy addresses or networks whose X-Forwarded-For
+                header names the client (RATE_LIMIT_TRUSTED_PROXIES)
+        """
+        self.per_minute = per_minute if per_minute is not None else security_config.rate_limit_per_minute
+        self.ip_per_minute = ip_per_minute if ip_per_minute is not None else int(
+            os.getenv("RATE_LIMIT_PER_IP_PER_MINUTE", str(self.per_minute * 2))
+        )
+        self.route_costs = route_costs or parse_route_costs(os.getenv("RATE_LIMIT_ROUTE_COSTS"))
+        self.trusted_proxies = (
+            parse_trusted_proxies(",".join(trusted_proxies)) if trusted_proxies is not None
+            else parse_trusted_proxies(os.getenv("RATE_LIMIT_TRUSTED_PROXIES"))
+        )
+
+        backend = backend or os.getenv("RATE_LIMIT_BACKEND", "memory")
+        if backend == "sqlite":
+            self.store = SQLiteBucketStore(Path(data_dir or os.getenv("DATA_DIR", "./data")))
+        elif backend == "memory":
+            self.store = MemoryBucketStore()
+        else:
+            raise ValueError(f"Unknown rate limit backend: {backend}")
+
+        if self.enabled:
+            capacity = min(c for c in (self.per_minute, self.ip_per_minute) if c > 0)
+            too_costly = sorted(name for name, cost in self.route_costs.items() if cost > capacity)
+            if too_costly:
+                logger.warning(
+                    f"Route costs above the {capacity} token bucket capacity are capped at it, so "
+                    f"each such request empties a bucket: {', '.join(too_costly)}"
+                )
+
+        logger.info(
+            f"RateLimiter initialized ({backend} backend, {self.per_minute}/min per owner, "
+            f"{self.ip_per_minute}/min per IP, {len(self.trusted_proxies)} trusted proxies)"
+            if self.enabled else "RateLimiter disabled"
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether requests are limited at all."""
+        return self.per_minute > 0
+
+    def route_cost(self, method: str, path: str) -> int:
+        """
+        Get the token cost of a request.
+
+        Args:
+            method: HTTP method
+            path: Request path
+
+        Returns:
+            Cost in tokens
+        """
+        for route_method, pattern, name in ROUTE_PATTERNS:
+            if (route_method is None or route_method == method) and pattern.match(path):
+                return self.route_costs.get(name, self.route_costs["default"])
+        return self.route_costs["default"]
+
+    def _is_trusted_proxy(self, address: str) -> bool:
+        """Whether an address belongs to a trusted proxy."""
+        try:
+            ip = ipaddress.ip_address(address)
+        except ValueError:
+            return False
+        return any(ip in network for network in self.trusted_proxies)
+
+    def client_ip(self, peer: Optional[str], forwarded_for: Optional[str] = None) -> Optional[str]:
+        """
+        Get the address a request is charged to.
+
+        Forwarded addresses are followed from the nearest hop back, only
+        while each hop is a trusted proxy, so a client cannot choose its
+        bucket by sending its own X-Forwarded-For.
+
+        Args:
+            peer: Address of the connecting socket
+            forwarded_for: X-Forwarded-For header value, if any
+
+        Returns:
+            Client address, or None if unknown
+        """
+        client = peer
+        if client is None or not forwarded_for:
+            return client
+        hops = [hop.strip() for hop in forwarded_for.split(",") if hop.strip()]
+        while hops and self._is_trusted_proxy(client):
+            client = hops.pop()
+        return client
+
+    def check(self, owner_id: Optional[str], client_ip: Optional[str], cost: int) -> RateLimitDecision:
+        """
+        Charge a request to its owner and IP buckets.
+
+        Args:
+            owner_id: Authenticated owner, if any
+            client_ip: Client address, if known
+            cost: Tokens the request costs
+
+        Returns:
+            RateLimitDecision reporting the tighter bucket
+        """
+        buckets = []
+        if owner_id is not None:
+            buckets.append((f"owner:{owner_id}", float(self.per_minute)))
+        if client_ip is not None and self.ip_per_minute > 0:
+            buckets.append((f"ip:{client_ip}", float(self.ip_per_minute)))
+        if not buckets:
+            return RateLimitDecision(True, self.per_minute, self.per_minute, 0.0, 0.0)
+        # A cost above a bucket's capacity could never be paid, even by an idle client
+        cost = min(cost, min(capacity for _, capacity in buckets))
+        return self.store.take(buckets, cost)
+
+    def reset(self) -> None:
+        """Drop all bucket state."""
+        self.store.reset()
+
+
+def _forwarded_for(scope: Scope) -> Optional[str]:
+    """X-Forwarded-For of a request, with repeated headers joined in order."""
+    values = [
+        value.decode("latin-1") for name, value in scope.get("headers", [])
+        if name == b"x-forwarded-for"
+    ]
+    return ",".join(values) if values else None
+
+
+def _owner_of(scope: Scope) -> Optional[str]:
+    """Owner of a request's bearer token; None if absent or invalid (auth rejects it later)."""
+    for name, value in scope.get("headers", []):
+        if name == b"authorization":
+            scheme, _, token = value.decode("latin-1").partition(" ")
+            if scheme.lower() != "bearer" or not token:
+                return None
+            try:
+                return authenticate_token(token.strip()).owner_id
+            except HTTPException:
+                return None
+    return None
+
+
+class RateLimitMiddleware:
+    """
+    ASGI middleware enforcing a RateLimiter.
+
+    Admitted responses carry RateLimit-Limit, RateLimit-Remaining and
+    RateLimit-Reset headers; rejected requests get 429 with Retry-After.
+    """
+
+    def __init__(self, app: ASGIApp, limiter: RateLimiter):
+        """
+        Initialize middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            limiter: Rate limiter to enforce
+        """
+        self.app = app
+        self.limiter = limiter
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or not self.limiter.enabled
+            or scope["method"] == "OPTIONS"
+            or scope["path"] in EXEMPT_PATHS
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        cost = self.limiter.route_cost(scope["method"], scope["path"])
+        client = scope.get("client")
+        client_ip = self.limiter.client_ip(client[0] if client else None, _forwarded_for(scope))
+        args = (_owner_of(scope), client_ip, cost)
+        if self.limiter.store.blocking:
+            decision = await asyncio.get_running_loop().run_in_executor(None, self.limiter.check, *args)
+        else:
+            decision = self.limiter.check(*args)
+
+        headers = [
+            (b"ratelimit-limit", str(decision.limit).encode()),
+            (b"ratelimit-remaining", str(decision.remaining).encode()),
+            (b"ratelimit-reset", str(math.ceil(decision.reset)).encode()),
+        ]
+
+        if not decision.allowed:
+            logger.warning(f"Rate limited {scope['method']} {scope['path']} (owner={args[0]}, ip={args[1]})")
+            headers.append((b"retry-after", str(max(1, math.ceil(decision.retry_after))).encode()))
+            body = b'{"detail":"Rate limit exceeded"}'
+            await send({
+                "type": "http.response.start",
+                "status": 429,
+                "headers": headers + [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message = {**message, "headers": list(message.get("headers", [])) + headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
@@ -0,0 +1,589 @@
+"""
+Resumable chunked uploads for scoped storage.
+
+A client creates an upload session with the final file size, appends
+chunks at explicit byte offsets and finalizes the session once every byte
+has arrived. Chunks are appended to a staging file in
+DATA_DIR/.upload-sessions, so an interrupted transfer resumes from the
+last stored offset instead of starting over. Session state lives in one
+SQLite table next to it and survives restarts. The declared size of every
+live session is reserved against the owner's quota, and abandoned sessions
+are removed by a background sweeper once they expire.
+"""
+
+import asyncio
+import os
+import re
+import sqlite3
+import threading
+import time
+import uuid
+import weakref
+from dataclasses import dataclass
+from pathlib import Path
+from typing import AsyncIterator, List, Optional
+
+from backend.core.async_storage import AsyncScopedStorage
+from backend.core.exceptions import (
+    FileTooLargeError,
+    StorageError,
+    UploadOffsetError,
+    UploadSessionNotFoundError,
+)
+from backend.core.logging_config import get_logger
+from backend.core.scoped_storage import FileInfo, ScopedPathBuilder
+
+logger = get_logger(__name__)
+
+_UPLOAD_ID_PATTERN = re.compile(r"^[0-9a-f]{32}$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    upload_id TEXT PRIMARY KEY,
+    owner_id TEXT NOT NULL,
+    soul_id TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    received INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_by_owner ON sessions (owner_id, soul_id);
+CREATE INDEX IF NOT EXISTS sessions_by_expiry ON sessions (expires_at);
+"""
+
+_COLUMNS = "upload_id, owner_id, soul_id, filename, size, received, created_at, expires_at"
+
+
+@dataclass
+class UploadSession:
+    """State of a resumable upload."""
+    upload_id: str
+    owner_id: str
+    soul_id: str
+    filename: str
+    size: int
+    offset: int
+    created_at: float
+    expires_at: float
+
+    @property
+    def complete(self) -> bool:
+        """Whether every byte has been received."""
+        return self.offset >= self.size
+
+
+class UploadSessionStore:
+    """Upload sessions table backed by SQLite in WAL mode."""
+
+    DB_FILENAME = ".upload-sessions.db"
+
+    def __init__(self, data_dir: Path):
+        """
+        Initialize session store.
+
+        Args:
+            data_dir: Root data directory; the database lives inside it
+        """
+        self.db_path = Path(data_dir) / self.DB_FILENAME
+        self._local = threading.local()
+        self._initialized = False
+        self._init_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's connection, creating the schema on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+
+        with self._init_lock:
+            if not self._initialized:
+                conn.executescript(_SCHEMA)
+                self._initialized = True
+
+        self._local.conn = conn
+        return conn
+
+    def insert(self, session: UploadSession) -> None:
+        """
+        Record a new session.
+
+        Args:
+            session: Session to record
+        """
+        self._connect().execute(
+            f"INSERT INTO sessions ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (session.upload_id, session.owner_id, session.soul_id, session.filename,
+             session.size, session.offset, session.created_at, session.expires_at)
+        )
+
+    def get(self, upload_id: str) -> Optional[UploadSession]:
+        """
+        Look up a session.
+
+        Args:
+            upload_id: Session identifier
+
+        Returns:
+            UploadSession or None
+        """
+        row = self._connect().execute(
+            f"SELECT {_COLUMNS} FROM sessions WHERE upload_id = ?", (upload_id,)
+        ).fetchone()
+        return UploadSession(*row) if row else None
+
+    def update(self, session: UploadSession) -> None:
+        """
+        Record a session's received bytes and expiry.
+
+        Args:
+            session: Updated session
+        """
+        self._connect().execute(
+            "UPDATE sessions SET received = ?, expires_at = ? WHERE upload_id = ?",
+            (session.offset, session.expires_at, session.upload_id)
+        )
+
+    def remove(self, upload_id: str) -> bool:
+        """
+        Remove a session.
+
+        Args:
+            upload_id: Session identifier
+
+        Returns:
+            True if the session existed
+        """
+        cursor = self._connect().execute("DELETE FROM sessions WHERE upload_id = ?", (upload_id,))
+        return cursor.rowcount > 0
+
+    def reserved_bytes(self, owner_id: str, exclude_upload_id: Optional[str], now: float) -> int:
+        """
+        Get the declared bytes of an owner's live sessions.
+
+        Args:
+            owner_id: Owner identifier
+            exclude_upload_id: Session not to count
+            now: Current time; expired sessions hold no reservation
+
+        Returns:
+            Total declared size in bytes
+        """
+        row = self._connect().execute(
+            "SELECT COALESCE(SUM(size), 0) FROM sessions "
+            "WHERE owner_id = ? AND expires_at >= ? AND upload_id != ?",
+            (owner_id, now, exclude_upload_id or "")
+        ).fetchone()
+        return row[0]
+
+    def list_expired(self, now: float) -> List[str]:
+        """
+        List sessions that expired before a time.
+
+        Args:
+            now: Current time
+
+        Returns:
+            Upload identifiers
+        """
+        rows = self._connect().execute(
+            "SELECT upload_id FROM sessions WHERE expires_at < ?", (now,)
+        ).fetchall()
+        return [row[0] for row in rows]
+
+    def list_soul_sessions(self, owner_id: str, soul_id: Optional[str] = None) -> List[str]:
+        """
+        List the sessions of a soul, or of every soul of an owner.
+
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier (None for the whole owner)
+
+        Returns:
+            Upload identifiers
+        """
+        if soul_id is None:
+            rows = self._connect().execute(
+                "SELECT upload_id FROM sessions WHERE owner_id = ?", (owner_id,)
+            ).fetchall()
+        else:
+            rows = self._connect().execute(
+                "SELECT upload_id FROM sessions WHERE owner_id = ? AND soul_id = ?",
+                (owner_id, soul_id)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+
+class ResumableUploadManager:
+    """Manage resumable upload sessions on top of AsyncScopedStorage."""
+
+    SESSIONS_DIRNAME = ".upload-sessions"
+
+    def __init__(
+        self,
+        storage: AsyncScopedStorage,
+        session_ttl_seconds: int = None,
+        sweep_interval_seconds: int = None
+    ):
+        """
+        Initialize resumable upload manager.
+
+        Args:
+            storage: Async scoped storage that finalized uploads are committed to
+            session_ttl_seconds: Idle time after which a session expires
+            sweep_interval_seconds: Seconds between expired session sweeps
+        """
+        self.storage = storage
+        self.store = UploadSessionStore(storage.data_dir)
+        self.sessions_path = Path(storage.data_dir) / self.SESSIONS_DIRNAME
+        self.session_ttl_seconds = session_ttl_seconds or int(
+            os.getenv("UPLOAD_SESSION_TTL_SECONDS", str(24 * 3600))
+        )
+        self.sweep_interval_seconds = sweep_interval_seconds or int(
+            os.getenv("UPLOAD_SESSION_SWEEP_INTERVAL_SECONDS", "600")
+        )
+        # Serializes chunk appends, finalization and expiry per session; a
+        # lock is dropped as soon as nobody holds or waits for it
+        self._locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+        # Serializes quota checks with the reservations they admit
+        self._reserve_lock = asyncio.Lock()
+        self._sweeper: Optional[asyncio.Task] = None
+
+    def _staging_path(self, upload_id: str) -> Path:
+        """
+        Get the staging file of a session.
+
+        Raises:
+            UploadSessionNotFoundError: If the upload id is malformed
+        """
+        if not _UPLOAD_ID_PATTERN.match(upload_id):
+            raise UploadSessionNotFoundError(f"Upload session {upload_id} not found")
+        return self.sessions_path / f"{upload_id}.part"
+
+    def _lock_for(self, upload_id: str) -> asyncio.Lock:
+        """Get the lock of a session."""
+        lock = self._locks.get(upload_id)
+        if lock is None:
+            lock = self._locks[upload_id] = asyncio.Lock()
+        return lock
+
+    def _read_session(self, owner_id: str, soul_id: str, upload_id: str) -> UploadSession:
+        """
+        Load a live session of a soul.
+
+        Raises:
+            UploadSessionNotFoundError: If the session is missing or expired
+        """
+        self._staging_path(upload_id)
+        session = self.store.get(upload_id)
+        if session is None or session.owner_id != owner_id or session.soul_id != soul_id:
+            raise UploadSessionNotFoundError(f"Upload session {upload_id} not found")
+
+        if session.expires_at < time.time():
+            raise UploadSessionNotFoundError(f"Upload session {upload_id} has expired")
+
+        return session
+
+    def _create(self, owner_id: str, soul_id: str, filename: str, size: int) -> UploadSession:
+        """Record session state, then create its empty staging file."""
+        now = time.time()
+        session = UploadSession(
+            upload_id=uuid.uuid4().hex,
+            owner_id=owner_id,
+            soul_id=soul_id,
+            filename=filename,
+            size=size,
+            offset=0,
+            created_at=now,
+            expires_at=now + self.session_ttl_seconds
+        )
+
+        # State first: a staging file without state is an orphan to the sweeper
+        self.store.insert(session)
+        try:
+            self.sessions_path.mkdir(parents=True, exist_ok=True)
+            self._staging_path(session.upload_id).touch()
+        except OSError:
+            self.store.remove(session.upload_id)
+            raise
+        return session
+
+    async def reserved_bytes(self, owner_id: str, exclude_upload_id: Optional[str] = None) -> int:
+        """
+        Get the bytes reserved by an owner's live upload sessions.
+
+        Args:
+            owner_id: Owner identifier
+            exclude_upload_id: Session not to count (e.g. the one being finalized)
+
+        Returns:
+            Total declared size in bytes
+        """
+        return await self.storage.run(
+            self.store.reserved_bytes, owner_id, exclude_upload_id, time.time()
+        )
+
+    async def create_session(
+        self,
+        owner_id: str,
+        soul_id: str,
+        filename: str,
+        size: int,
+        quota_bytes: int = 0
+    ) -> UploadSession:
+        """
+        Start a resumable upload, reserving its size against the quota.
+
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            filename: Name of the file once finalized
+            size: Total size of the file in bytes
+            quota_bytes: Per-owner quota in bytes (0 disables the quota)
+
+        Returns:
+            The new session
+
+        Raises:
+            FileTooLargeError: If the size does not fit the remaining quota
+        """
+        async with self._reserve_lock:
+            remaining = await self.storage.remaining_quota(owner_id, quota_bytes)
+            if remaining is not None and size > remaining - await self.reserved_bytes(owner_id):
+                raise FileTooLargeError("Storage quota exceeded")
+            session = await self.storage.run(self._create, owner_id, soul_id, filename, size)
+
+        logger.info(
+            f"Created upload session {session.upload_id} for {owner_id}/{soul_id}/{filename} "
+            f"({size} bytes)"
+        )
+        return session
+
+    async def get_session(self, owner_id: str, soul_id: str, upload_id: str) -> UploadSession:
+        """
+        Get the current state of an upload.
+
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            upload_id: Session identifier
+
+        Returns:
+            The session, whose offset is where the next chunk must start
+
+        Raises:
+            UploadSessionNotFoundError: If the session is missing or expired
+        """
+        return await self.storage.run(self._read_session, owner_id, soul_id, upload_id)
+
+    async def append_chunk(
+        self,
+        owner_id: str,
+        soul_id: str,
+        upload_id: str,
+        offset: int,
+        chunks: AsyncIterator[bytes]
+    ) -> UploadSession:
+        """
+        Append a chunk at the given offset.
+
+        The body is streamed into the staging file. If the connection drops
+        mid-chunk, the bytes already written are kept and the offset reflects
+        them, so the client resumes from there.
+
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            upload_id: Session identifier
+            offset: Byte offset the chunk starts at
+            chunks: Async iterator over the chunk body
+
+        Returns:
+            The updated session
+
+        Raises:
+            UploadSessionNotFoundError: If the session is missing or expired
+            UploadOffsetError: If offset is not the current session offset
+            FileTooLargeError: If the chunk runs past the declared size
+        """
+        async with self._lock_for(upload_id):
+            session = await self.get_session(owner_id, soul_id, upload_id)
+            if offset != session.offset:
+                raise UploadOffsetError(
+                    f"Chunk offset {offset} does not match upload offset {session.offset}",
+                    current_offset=session.offset
+                )
+
+            try:
+                f = await self.storage.run(open, self._staging_path(upload_id), "r+b")
+            except FileNotFoundError:
+                raise UploadSessionNotFoundError(f"Upload session {upload_id} not found")
+            try:
+                # Drop bytes past the recorded offset left by a crashed append
+                await self.storage.run(f.truncate, session.offset)
+                await self.storage.run(f.seek, session.offset)
+                async for chunk in chunks:
+                    if session.offset + len(chunk) > session.size:
+                        raise FileTooLargeError(
+                            f"Chunk exceeds the declared upload size of {session.size} bytes"
+                        )
+                    await self.storage.run(f.write, chunk)
+                    session.offset += len(chunk)
+            finally:
+                await self.storage.run(f.close)
+                session.expires_at = time.time() + self.session_ttl_seconds
+                await self.storage.run(self.store.update, session)
+
+        return session
+
+    async def finalize(self, owner_id: str, soul_id: str, upload_id: str) -> FileInfo:
+        """
+        Commit a complete upload to the soul's uploads.
+
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            upload_id: Session identifier
+
+        Returns:
+            FileInfo of the stored file
+
+        Raises:
+            UploadSessionNotFoundError: If the session is missing or expired
+            UploadOffsetError: If bytes are still missing
+            StorageError: If the commit fails
+        """
+        category = ScopedPathBuilder.CATEGORY_UPLOADS
+
+        async with self._lock_for(upload_id):
+            session = await self.get_session(owner_id, soul_id, upload_id)
+            if not session.complete:
+                raise UploadOffsetError(
+                    f"Upload incomplete: {session.offset} of {session.size} bytes received",
+                    current_offset=session.offset
+                )
+
+            try:
+                file_info = await self.storage.run(
+                    self.storage.storage.commit_file,
+                    owner_id, soul_id, self._staging_path(upload_id), session.filename, category
+                )
+            except Exception as e:
+                logger.error(f"Failed to finalize upload {upload_id}: {e}")
+                raise StorageError(f"Failed to finalize upload: {e}")
+
+            # The file is cataloged now, so its reservation can go
+            await self.storage.run(self.store.remove, upload_id)
+
+        logger.info(f"Finalized upload {upload_id} as {file_info.path} ({file_info.size} bytes)")
+        return file_info
+
+    def _discard(self, upload_id: str) -> bool:
+        """Remove a session's state, then its staging file."""
+        existed = self.store.remove(upload_id)
+        self._staging_path(upload_id).unlink(missing_ok=True)
+        return existed
+
+    async def abort(self, owner_id: str, soul_id: str, upload_id: str) -> bool:
+        """
+        Cancel an upload and delete its staged bytes.
+
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            upload_id: Session identifier
+
+        Returns:
+            True if a session was removed
+        """
+        self._staging_path(upload_id)
+        async with self._lock_for(upload_id):
+            session = await self.storage.run(self.store.get, upload_id)
+            if session is None or session.owner_id != owner_id or session.soul_id != soul_id:
+                return False
+            return await self.storage.run(self._discard, upload_id)
+
+    async def forget(self, owner_id: str, soul_id: Optional[str] = None) -> int:
+        """
+        Remove the upload sessions of deleted data.
+
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier (None for the whole owner)
+
+        Returns:
+            Number of removed sessions
+        """
+        removed = 0
+        upload_ids = await self.storage.run(self.store.list_soul_sessions, owner_id, soul_id)
+        for upload_id in upload_ids:
+            async with self._lock_for(upload_id):
+                removed += await self.storage.run(self._discard, upload_id)
+        return removed
+
+    def _expire(self, upload_id: str, now: float) -> bool:
+        """Remove a session if it is still expired."""
+        session = self.store.get(upload_id)
+        if session is None or session.expires_at >= now:
+            return False
+        return self._discard(upload_id)
+
+    def _remove_orphans(self) -> int:
+        """Delete staging files whose session state is gone (crash during finalize or abort)."""
+        removed = 0
+        if not self.sessions_path.exists():
+            return removed
+        for staging_path in self.sessions_path.glob("*.part"):
+            if self.store.get(staging_path.stem) is None:
+                staging_path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+    async def sweep_expired(self) -> int:
+        """
+        Remove expired upload sessions.
+
+        Each session is removed under its lock and only if it is still
+        expired then, so a chunk being appended is never cut off.
+
+        Returns:
+            Number of sessions removed
+        """
+        removed = 0
+        for upload_id in await self.storage.run(self.store.list_expired, time.time()):
+            async with self._lock_for(upload_id):
+                removed += await self.storage.run(self._expire, upload_id, time.time())
+        await self.storage.run(self._remove_orphans)
+
+        if removed:
+            logger.info(f"Removed {removed} expired upload sessions")
+        return removed
+
+    async def _sweep_loop(self) -> None:
+        """Sweep expired sessions periodically."""
+        while True:
+            try:
+                await self.sweep_expired()
+            except Exception as e:
+                logger.error(f"Upload session sweep failed: {e}")
+            await asyncio.sleep(self.sweep_interval_seconds)
+
+    def start_sweeper(self) -> None:
+        """Start the background sweeper on the running event loop."""
+        if self._sweeper is None:
+            self._sweeper = asyncio.get_running_loop().create_task(self._sweep_loop())
+
+    async def stop_sweeper(self) -> None:
+        """Stop the background sweeper."""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            try:
+                await self._sweeper
+            except asyncio.CancelledError:
+                pass
+            self._sweeper = None
@@ -1,13 +1,31 @@
 """
 Scoped RAG (Retrieval-Augmented Generation) index management.
-Phase 1: Placeholder implementations.
+Phase 2: Document collection, chunking, near-duplicate suppression,
+embedding and vector search. Transcript segment files are chunked along
+segment boundaries, and their chunks keep the audio timestamps.
 """
 
-from typing import List, Dict, Any, Optional
+import asyncio
+import heapq
+import itertools
+import json
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 
+import numpy as np
+
+from backend.core.compression import open_stored_file
 from backend.core.logging_config import get_logger
 from backend.core.scoped_storage import ScopedPathBuilder
+from backend.core.storage_catalog import StorageCatalog
+from backend.core.near_duplicates import NearDuplicateIndex
+from backend.core.embeddings import default_embedder
+from backend.core.vector_index import FlatIndex, create_index
 
 logger = get_logger(__name__)
 
@@ -15,15 +33,328 @@ logger = get_logger(__name__)
 class ScopedRAG:
     """Scoped RAG index manager per soul."""
     
-    def __init__(self, data_dir: str = None):
+    # Index file names
+    CHUNKS_FILENAME = "chunks.jsonl"
+    MANIFEST_FILENAME = "manifest.json"
+    
+    # File types that are read as text during indexing
+    TEXT_EXTENSIONS = {".txt", ".md", ".markdown", ".csv", ".json", ".log", ".srt", ".vtt"}
+    
+    # Transcript segment files (one JSON segment per line); indexed instead
+    # of the plain-text transcript with the same name
+    SEGMENTS_EXTENSION = ".jsonl"
+    
+    def __init__(
+        self,
+        data_dir: str = None,
+        owner_query_timeout: float = None,
+        chunk_size: int = None,
+        dedup_threshold: float = None,
+        embedder=None,
+        index_type: str = None
+    ):
         """
         Initialize scoped RAG manager.
         
         Args:
             data_dir: Root directory for data storage
+            owner_query_timeout: Shared deadline in seconds for owner-wide queries
+            chunk_size: Number of words per indexed chunk
+            dedup_threshold: Jaccard similarity above which chunks are duplicates
+            embedder: Callable mapping a list of texts to normalized vectors
+            index_type: Vector index type (flat, ivf)
         """
         self.path_builder = ScopedPathBuilder(data_dir)
-        logger.info("ScopedRAG initialized (Phase 1: placeholder)")
+        # Compression codecs of stored documents are recorded in the catalog
+        self.catalog = StorageCatalog(self.path_builder.data_dir)
+        self.owner_query_timeout = owner_query_timeout or float(
+            os.getenv("RAG_OWNER_QUERY_TIMEOUT", "5.0")
+        )
+        self.chunk_size = chunk_size or int(os.getenv("RAG_CHUNK_SIZE_WORDS", "200"))
+        self.dedup_threshold = dedup_threshold or float(
+            os.getenv("RAG_DEDUP_THRESHOLD", "0.8")
+        )
+        self.embedder = embedder or default_embedder
+        self.index_type = index_type or os.getenv("RAG_INDEX_TYPE", "flat")
+        create_index(self.index_type)  # Fail fast on unknown index types
+        
+        # Loaded indexes keyed by (owner_id, soul_id), validated by the
+        # manifest's build id (versions restart at 1 after a soul is deleted)
+        self.max_loaded_indexes = int(os.getenv("RAG_LOADED_INDEX_CACHE", "32"))
+        self._loaded_indexes: "OrderedDict[Tuple[str, str], Tuple[str, FlatIndex, List[Dict[str, Any]]]]" = OrderedDict()
+        self._loaded_lock = threading.Lock()
+        
+        logger.info(f"ScopedRAG initialized (Phase 2: {self.index_type} index)")
+    
+    @property
+    def embeddings_available(self) -> bool:
+        """Check if the embedder can be used."""
+        return getattr(self.embedder, "available", True)
+    
+    def _collect_documents(
+        self,
+        owner_id: str,
+        soul_id: str,
+        include_uploads: bool,
+        include_transcripts: bool
+    ) -> List[Tuple[str, Path, Optional[str]]]:
+        """
+        Collect text documents to index for a soul.
+        
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            include_uploads: Include uploaded files
+            include_transcripts: Include transcript files
+        
+        Returns:
+            List of (category, path, codec) tuples in a stable order
+        """
+        categories = []
+        if include_uploads:
+            categories.append(ScopedPathBuilder.CATEGORY_UPLOADS)
+        if include_transcripts:
+            categories.append(ScopedPathBuilder.CATEGORY_TRANSCRIPTS)
+        
+        documents = []
+        for category in categories:
+            category_path = self.path_builder.get_category_path(owner_id, soul_id, category)
+            if not category_path.exists():
+                continue
+            codecs = {
+                entry.filename: entry.codec
+                for entry in self.catalog.list_files(owner_id, soul_id, [category])
+            }
+            
+            extensions = set(self.TEXT_EXTENSIONS)
+            if category == ScopedPathBuilder.CATEGORY_TRANSCRIPTS:
+                extensions.add(self.SEGMENTS_EXTENSION)
+            files = [
+                file_path for file_path in sorted(category_path.iterdir())
+                if (
+                    file_path.is_file()
+                    and not file_path.name.startswith(".")
+                    and file_path.suffix.lower() in extensions
+                )
+            ]
+            segmented = {
+                file_path.stem for file_path in files
+                if file_path.suffix.lower() == self.SEGMENTS_EXTENSION
+            }
+            for file_path in files:
+                if file_path.suffix.lower() == ".txt" and file_path.stem in segmented:
+                    # Same transcript; its segments carry timestamps
+                    continue
+                documents.append((category, file_path, codecs.get(file_path.name)))
+        
+        return documents
+    
+    def _chunk_text(self, text: str) -> List[str]:
+        """
+        Split text into chunks of roughly chunk_size words.
+        
+        Args:
+            text: Document text
+        
+        Returns:
+            List of chunk texts
+        """
+        words = text.replace("\x00", "").split()
+        return [
+            " ".join(words[i:i + self.chunk_size])
+            for i in range(0, len(words), self.chunk_size)
+        ]
+    
+    def _chunk_segments(self, segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Group transcript segments into chunks of roughly chunk_size words.
+        
+        Chunks end on segment boundaries, so each covers a contiguous
+        stretch of audio; a segment longer than chunk_size is kept whole.
+        
+        Args:
+            segments: Segments in order with start, end and text
+        
+        Returns:
+            Chunks with text, start, end and the ids of their first and last segment
+        """
+        chunks = []
+        current: List[Dict[str, Any]] = []
+        words = 0
+        for segment in segments:
+            segment_words = len(segment["text"].split())
+            if current and words + segment_words > self.chunk_size:
+                chunks.append(current)
+                current, words = [], 0
+            current.append(segment)
+            words += segment_words
+        if current:
+            chunks.append(current)
+        
+        return [
+            {
+                "text": " ".join(segment["text"].replace("\x00", "") for segment in group).strip(),
+                "start": group[0]["start"],
+                "end": group[-1]["end"],
+                "segment_ids": [group[0]["id"], group[-1]["id"]],
+            }
+            for group in chunks
+        ]
+    
+    def _read_document_chunks(self, file_path: Path, codec: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Read a document and split it into chunks.
+        
+        Segment files are chunked along segment boundaries and their chunks
+        keep the audio timestamps; other documents are chunked by words.
+        
+        Args:
+            file_path: Document to read
+            codec: Compression codec recorded for the document
+        
+        Returns:
+            Chunks with text and, for segment files, timestamps
+        """
+        # Read through storage's decoder so compressed files are indexed as text
+        with open_stored_file(file_path, codec) as f:
+            text = f.read().decode("utf-8", errors="replace")
+        
+        if file_path.suffix.lower() != self.SEGMENTS_EXTENSION:
+            return [{"text": chunk_text} for chunk_text in self._chunk_text(text)]
+        
+        segments = []
+        for line_number, line in enumerate(text.splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                segment = json.loads(line)
+                segments.append({
+                    "id": segment.get("id", len(segments)),
+                    "start": float(segment["start"]),
+                    "end": float(segment["end"]),
+                    "text": str(segment["text"]),
+                })
+            except (ValueError, KeyError, TypeError) as e:
+                logger.warning(f"Skipping malformed segment {file_path.name}:{line_number}: {e}")
+        return [chunk for chunk in self._chunk_segments(segments) if chunk["text"]]
+    
+    def _build_chunks(
+        self,
+        documents: List[Tuple[str, Path, Optional[str]]]
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Chunk documents and fold near-duplicate chunks together.
+        
+        Duplicate chunks are stored once; every occurrence is kept as a
+        source reference on the stored chunk.
+        
+        Args:
+            documents: List of (category, path, codec) tuples
+        
+        Returns:
+            Tuple of (unique chunks, total chunks before dedup)
+        """
+        dedup_index = NearDuplicateIndex(threshold=self.dedup_threshold)
+        chunks: List[Dict[str, Any]] = []
+        total_chunks = 0
+        
+        for category, file_path, codec in documents:
+            try:
+                document_chunks = self._read_document_chunks(file_path, codec)
+            except (OSError, RuntimeError, ValueError) as e:
+                logger.warning(f"Skipping unreadable document {file_path}: {e}")
+                continue
+            
+            for chunk_index, document_chunk in enumerate(document_chunks):
+                total_chunks += 1
+                chunk_text = document_chunk.pop("text")
+                # Timestamps (if any) belong to this occurrence of the text
+                source = {
+                    "filename": file_path.name,
+                    "category": category,
+                    "chunk_index": chunk_index,
+                    **document_chunk,
+                }
+                
+                duplicate_of = dedup_index.find_or_add(len(chunks), chunk_text)
+                if duplicate_of is not None:
+                    chunks[duplicate_of]["sources"].append(source)
+                    continue
+                
+                chunks.append({
+                    "id": len(chunks),
+                    "text": chunk_text,
+                    "sources": [source],
+                })
+        
+        return chunks, total_chunks
+    
+    def _build_vector_index(self, chunks: List[Dict[str, Any]]) -> FlatIndex:
+        """
+        Embed chunks and build a vector index over them.
+        
+        Args:
+            chunks: Unique chunks; row i of the index is chunk id i
+        
+        Returns:
+            Built vector index
+        """
+        vectors = self.embedder([chunk["text"] for chunk in chunks])
+        index = create_index(self.index_type)
+        index.build(vectors)
+        return index
+    
+    def _load_manifest(self, index_path: Path) -> Optional[Dict[str, Any]]:
+        """
+        Load the index manifest if present.
+        
+        Args:
+            index_path: Path to index directory
+        
+        Returns:
+            Manifest dictionary or None if the index has not been built
+        """
+        manifest_path = index_path / self.MANIFEST_FILENAME
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable index manifest {manifest_path}: {e}")
+            return None
+    
+    def _write_index(
+        self,
+        index_path: Path,
+        chunks: List[Dict[str, Any]],
+        manifest: Dict[str, Any],
+        vector_index: Optional[FlatIndex] = None
+    ) -> None:
+        """
+        Persist chunks, vectors and manifest, writing the manifest last.
+        
+        Args:
+            index_path: Path to index directory
+            chunks: Unique chunks with source references
+            manifest: Index manifest
+            vector_index: Optional vector index to save
+        """
+        index_path.mkdir(parents=True, exist_ok=True)
+        
+        if vector_index is not None:
+            vector_index.save(index_path)
+        
+        chunks_tmp = index_path / (self.CHUNKS_FILENAME + ".tmp")
+        with open(chunks_tmp, "w", encoding="utf-8") as f:
+            for chunk in chunks:
+                f.write(json.dumps(chunk, ensure_ascii=False) + "\n")
+        os.replace(chunks_tmp, index_path / self.CHUNKS_FILENAME)
+        
+        manifest_tmp = index_path / (self.MANIFEST_FILENAME + ".tmp")
+        with open(manifest_tmp, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(manifest_tmp, index_path / self.MANIFEST_FILENAME)
     
     async def build_index(
         self,
@@ -44,7 +375,7 @@ class ScopedRAG:
         Returns:
             Index build result
         """
-        logger.info(f"Building RAG index (placeholder) for {owner_id}/{soul_id}")
+        logger.info(f"Building RAG index for {owner_id}/{soul_id}")
         
         # Get paths to index
         index_path = self.path_builder.get_category_path(
@@ -52,19 +383,65 @@ class ScopedRAG:
         )
         index_path.mkdir(parents=True, exist_ok=True)
         
-        # Placeholder: In Phase 2, this would:
-        # 1. Collect all documents from uploads and transcripts
-        # 2. Chunk documents
-        # 3. Generate embeddings
-        # 4. Build vector index
-        # 5. Save index to index_path
+        documents = self._collect_documents(
+            owner_id, soul_id, include_uploads, include_transcripts
+        )
+        
+        # Chunking and MinHash signatures are CPU-bound; keep them off the event loop
+        loop = asyncio.get_running_loop()
+        chunks, total_chunks = await loop.run_in_executor(
+            None, self._build_chunks, documents
+        )
+        
+        duplicate_chunks = total_chunks - len(chunks)
+        dedup_ratio = duplicate_chunks / total_chunks if total_chunks else 0.0
+        
+        previous = self._load_manifest(index_path) or {}
+        manifest = {
+            "version": previous.get("version", 0) + 1,
+            "build_id": uuid.uuid4().hex,
+            "built_at": datetime.utcnow().isoformat(),
+            "source_documents": len(documents),
+            "total_chunks": total_chunks,
+            "unique_chunks": len(chunks),
+            "duplicate_chunks": duplicate_chunks,
+            "dedup_ratio": round(dedup_ratio, 4),
+        }
+        
+        vector_index = None
+        if chunks and self.embeddings_available:
+            vector_index = await loop.run_in_executor(None, self._build_vector_index, chunks)
+            manifest["embedding_dim"] = int(vector_index.vectors.shape[1])
+        elif chunks:
+            logger.warning("No embedding model available; index will not be searchable")
+        
+        manifest["index_type"] = self.index_type
+        manifest["has_embeddings"] = vector_index is not None
+        
+        await loop.run_in_executor(
+            None, self._write_index, index_path, chunks, manifest, vector_index
+        )
+        
+        logger.info(
+            f"Indexed {len(chunks)} unique chunks from {len(documents)} documents for "
+            f"{owner_id}/{soul_id} ({duplicate_chunks} near-duplicates folded)"
+        )
         
         result = {
             "success": True,
-            "phase": "1 (placeholder)",
-            "indexed_documents": 0,
+            "phase": "2",
+            "indexed_documents": len(chunks),
+            "source_documents": len(documents),
+            "duplicate_chunks": duplicate_chunks,
+            "dedup_ratio": manifest["dedup_ratio"],
+            "index_version": manifest["version"],
+            "index_type": self.index_type,
+            "searchable": manifest["has_embeddings"],
             "index_path": str(index_path),
-            "message": "RAG indexing is a placeholder in Phase 1. Will be implemented in Phase 2."
+            "message": (
+                f"Indexed {len(chunks)} chunks from {len(documents)} documents; "
+                f"{duplicate_chunks} duplicate chunks stored once"
+            )
         }
         
         return result
@@ -74,7 +451,9 @@ class ScopedRAG:
         owner_id: str,
         soul_id: str,
         query: str,
-        top_k: int = 5
+        top_k: int = 5,
+        query_vector: Optional[np.ndarray] = None,
+        return_embeddings: bool = False
     ) -> List[Dict[str, Any]]:
         """
         Query RAG index for relevant documents.
@@ -84,20 +463,201 @@ class ScopedRAG:
             soul_id: Soul identifier
             query: Query string
             top_k: Number of documents to retrieve
+            query_vector: Precomputed query embedding (see embed_query)
+            return_embeddings: Attach each chunk's stored embedding as 'embedding'
         
         Returns:
             List of relevant documents with metadata
         """
-        logger.info(f"Querying RAG index (placeholder) for {owner_id}/{soul_id}: {query[:50]}")
+        logger.info(f"Querying RAG index for {owner_id}/{soul_id}: {query[:50]}")
         
-        # Placeholder: In Phase 2, this would:
-        # 1. Load vector index
-        # 2. Generate query embedding
-        # 3. Search for similar documents
-        # 4. Return top-k results with scores
+        index_path = self.path_builder.get_category_path(
+            owner_id, soul_id, ScopedPathBuilder.CATEGORY_INDEX
+        )
+        loop = asyncio.get_running_loop()
+        manifest = await loop.run_in_executor(None, self._load_manifest, index_path)
+        if not manifest or not manifest.get("has_embeddings"):
+            return []
         
-        # Return empty list for now
-        return []
+        vector_index, chunks = await loop.run_in_executor(
+            None, self._get_loaded_index, owner_id, soul_id, index_path, manifest
+        )
+        if query_vector is None:
+            query_vector = await self.embed_query(query)
+        
+        ids, scores = vector_index.search(query_vector, top_k)
+        
+        docs = []
+        for chunk_id, score in zip(ids.tolist(), scores.tolist()):
+            doc = {**chunks[chunk_id], "score": float(score)}
+            if return_embeddings:
+                doc["embedding"] = vector_index.vectors[chunk_id]
+            docs.append(doc)
+        
+        return docs
+    
+    async def embed_query(self, query: str) -> Optional[np.ndarray]:
+        """
+        Embed a query string.
+        
+        Args:
+            query: Query string
+        
+        Returns:
+            Normalized query embedding, or None if no embedder is available
+        """
+        if not self.embeddings_available:
+            return None
+        
+        loop = asyncio.get_running_loop()
+        return (await loop.run_in_executor(None, self.embedder, [query]))[0]
+    
+    def _get_loaded_index(
+        self,
+        owner_id: str,
+        soul_id: str,
+        index_path: Path,
+        manifest: Dict[str, Any]
+    ) -> Tuple[FlatIndex, List[Dict[str, Any]]]:
+        """
+        Get a soul's vector index and chunks, loading them from disk if needed.
+        
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            index_path: Path to index directory
+            manifest: Current index manifest
+        
+        Returns:
+            Tuple of (vector index, chunks)
+        """
+        key = (owner_id, soul_id)
+        # Manifests written before build ids existed are told apart by build time
+        build_id = manifest.get("build_id") or manifest.get("built_at") or ""
+        with self._loaded_lock:
+            cached = self._loaded_indexes.get(key)
+            if cached is not None and cached[0] == build_id:
+                self._loaded_indexes.move_to_end(key)
+                return cached[1], cached[2]
+        
+        vector_index = create_index(manifest.get("index_type", FlatIndex.INDEX_TYPE))
+        vector_index.load(index_path)
+        
+        with open(index_path / self.CHUNKS_FILENAME, "r", encoding="utf-8") as f:
+            chunks = [json.loads(line) for line in f if line.strip()]
+        
+        with self._loaded_lock:
+            self._loaded_indexes[key] = (build_id, vector_index, chunks)
+            self._loaded_indexes.move_to_end(key)
+            while len(self._loaded_indexes) > self.max_loaded_indexes:
+                self._loaded_indexes.popitem(last=False)
+        
+        return vector_index, chunks
+    
+    async def query_owner(
+        self,
+        owner_id: str,
+        query: str,
+        top_k: int = 5,
+        timeout: Optional[float] = None,
+        return_embeddings: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Query the RAG indexes of all of an owner's souls.
+        
+        Each soul's index is queried concurrently under one shared deadline.
+        Souls that miss the deadline are cancelled and reported rather than
+        failing the whole query. The per-soul top-k lists are merged with a
+        heap so the result is globally ranked by score.
+        
+        Args:
+            owner_id: Owner identifier
+            query: Query string
+            top_k: Number of documents to retrieve across all souls
+            timeout: Deadline in seconds (defaults to owner_query_timeout)
+            return_embeddings: Attach each chunk's stored embedding as 'embedding'
+        
+        Returns:
+            Dictionary with ranked documents tagged with soul_id, the souls
+            searched, the souls that timed out, the total indexed documents
+            and the query embedding shared by all souls
+        """
+        timeout = timeout if timeout is not None else self.owner_query_timeout
+        
+        # Every soul's manifest is read, so keep the disk reads off the event loop
+        loop = asyncio.get_running_loop()
+        all_soul_ids = await loop.run_in_executor(None, self.path_builder.list_soul_ids, owner_id)
+        checks = await asyncio.gather(*(
+            loop.run_in_executor(None, self.check_index_status, owner_id, soul_id)
+            for soul_id in all_soul_ids
+        ))
+        statuses = dict(zip(all_soul_ids, checks))
+        soul_ids = [soul_id for soul_id, st in statuses.items() if st["has_index"]]
+        
+        logger.info(f"Querying {len(soul_ids)} soul indexes for owner {owner_id}: {query[:50]}")
+        
+        result = {
+            "documents": [],
+            "searched_souls": [],
+            "timed_out_souls": [],
+            "indexed_documents": 0,
+            "query_vector": None,
+        }
+        
+        if not soul_ids:
+            return result
+        
+        # Embed once and share the vector across all souls
+        query_vector = await self.embed_query(query)
+        result["query_vector"] = query_vector
+        
+        tasks = {
+            asyncio.create_task(self.query(
+                owner_id, soul_id, query, top_k,
+                query_vector=query_vector,
+                return_embeddings=return_embeddings
+            )): soul_id
+            for soul_id in soul_ids
+        }
+        done, pending = await asyncio.wait(tasks.keys(), timeout=timeout)
+        
+        for task in pending:
+            task.cancel()
+            result["timed_out_souls"].append(tasks[task])
+        
+        ranked_lists = []
+        for task in done:
+            soul_id = tasks[task]
+            if task.exception() is not None:
+                logger.error(f"RAG query failed for {owner_id}/{soul_id}: {task.exception()}")
+                continue
+            
+            result["searched_souls"].append(soul_id)
+            result["indexed_documents"] += statuses[soul_id]["indexed_documents"]
+            
+            docs = sorted(
+                ({**doc, "soul_id": soul_id} for doc in task.result()),
+                key=lambda doc: doc.get("score", 0.0),
+                reverse=True
+            )
+            ranked_lists.append(docs[:top_k])
+        
+        if pending:
+            logger.warning(
+                f"Owner query for {owner_id} timed out after {timeout}s on "
+                f"{len(pending)} soul(s): {sorted(result['timed_out_souls'])}"
+            )
+        
+        merged = heapq.merge(
+            *ranked_lists,
+            key=lambda doc: doc.get("score", 0.0),
+            reverse=True
+        )
+        result["documents"] = list(itertools.islice(merged, top_k))
+        result["searched_souls"].sort()
+        result["timed_out_souls"].sort()
+        
+        return result
     
     def check_index_status(
         self,
@@ -118,20 +678,27 @@ class ScopedRAG:
             owner_id, soul_id, ScopedPathBuilder.CATEGORY_INDEX
         )
         
-        exists = index_path.exists()
+        manifest = self._load_manifest(index_path)
         
         status = {
-            "has_index": exists,
+            "has_index": manifest is not None,
             "index_path": str(index_path),
             "indexed_documents": 0,
-            "phase": "1 (placeholder)",
-            "message": "RAG index checking is placeholder in Phase 1"
+            "duplicate_chunks": 0,
+            "dedup_ratio": 0.0,
+            "index_version": 0,
+            "phase": "2",
+            "message": "RAG index has not been built" if manifest is None else "RAG index built"
         }
         
-        if exists:
-            # Count files in index directory
-            files = list(index_path.glob("*"))
-            status["indexed_documents"] = len(files)
+        if manifest is not None:
+            status["indexed_documents"] = manifest.get("unique_chunks", 0)
+            status["duplicate_chunks"] = manifest.get("duplicate_chunks", 0)
+            status["dedup_ratio"] = manifest.get("dedup_ratio", 0.0)
+            status["index_version"] = manifest.get("version", 0)
+            status["built_at"] = manifest.get("built_at")
+            status["index_type"] = manifest.get("index_type")
+            status["searchable"] = manifest.get("has_embeddings", False)
         
         return status
     
@@ -154,6 +721,8 @@ class ScopedRAG:
             owner_id, soul_id, ScopedPathBuilder.CATEGORY_INDEX
         )
         
+        self.invalidate(owner_id, soul_id)
+        
         if index_path.exists():
             import shutil
             shutil.rmtree(index_path)
@@ -162,6 +731,23 @@ class ScopedRAG:
         
         return False
 
+    
+    def invalidate(self, owner_id: str, soul_id: Optional[str] = None) -> None:
+        """
+        Drop loaded indexes for a soul, or for all of an owner's souls.
+        
+        Args:
+            owner_id: Owner identifier
+            soul_id: Optional soul identifier
+        """
+        with self._loaded_lock:
+            if soul_id is not None:
+                self._loaded_indexes.pop((owner_id, soul_id), None)
+                return
+            
+            for key in [key for key in self._loaded_indexes if key[0] == owner_id]:
+                del self._loaded_indexes[key]
+
 
 # Global instance
 scoped_rag = ScopedRAG()
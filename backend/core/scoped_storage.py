@@ -1,17 +1,32 @@
 """
 Scoped file storage for the CyberSeed backend.
 Files are organized by owner_id and soul_id.
+Uploads are backed by a content-addressed blob store and all writes are atomic.
 """
 
+import hashlib
+import heapq
+import itertools
 import os
-import shutil
+import uuid
 from pathlib import Path
-from typing import List, Optional, BinaryIO
+from typing import Iterator, List, Optional, BinaryIO, Sequence, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 
 from backend.core.logging_config import get_logger
 from backend.core.exceptions import StorageError
+from backend.core.audio import decoded_audio_files
+from backend.core.blob_store import BlobStore, blob_key, hash_file
+from backend.core.storage_catalog import (
+    SORT_KEYS,
+    CatalogEntry,
+    StorageCatalog,
+    decode_cursor,
+    encode_cursor,
+)
+from backend.core.trash import TrashBin
+from backend.core.compression import StorageCompression, measure_stored_file, open_stored_file
 
 logger = get_logger(__name__)
 
@@ -24,24 +39,135 @@ class FileInfo:
     created_at: datetime
     path: str
     category: str
+    content_hash: Optional[str] = None
+    references: int = 1
+    # Bytes on disk; differs from size when stored compressed
+    physical_size: Optional[int] = None
+    # Compression codec recorded at write time (None = stored as-is)
+    codec: Optional[str] = None
+    
+    def __post_init__(self):
+        if self.physical_size is None:
+            self.physical_size = self.size
+
+
+class StagedWrite:
+    """
+    New content for a scoped file, staged and then committed atomically.
+    
+    Content is hashed and counted as it is written (compressing on the fly
+    when the category's policy asks for it); nothing is visible at the
+    final path until commit().
+    """
+    
+    def __init__(
+        self,
+        storage: "ScopedStorage",
+        owner_id: str,
+        soul_id: str,
+        filename: str,
+        category: str
+    ):
+        """
+        Initialize staged write.
+        
+        Args:
+            storage: Storage the file is committed to
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            filename: Name of the file
+            category: Category for the file
+        """
+        self.storage = storage
+        self.owner_id = owner_id
+        self.soul_id = soul_id
+        self.category = category
+        self.file_path = storage.path_builder.get_category_path(owner_id, soul_id, category) / filename
+        self.staging_path = storage.staging_path(self.file_path, category)
+        self.codec = storage.compression.codec_for(category, filename)
+        self.size = 0
+        self.content_hash: Optional[str] = None
+        self._hasher = hashlib.sha256()
+        self._writer = storage.compression.open_writer(self.staging_path, self.codec)
+    
+    def write(self, chunk: bytes) -> None:
+        """Append a chunk of original content."""
+        self._hasher.update(chunk)
+        self._writer.write(chunk)
+        self.size += len(chunk)
+    
+    def finish(self) -> None:
+        """Flush the staged content so it is ready to be moved into place."""
+        if self.content_hash is None:
+            self._writer.close()
+            self.content_hash = self._hasher.hexdigest()
+    
+    def move_into_place(self) -> None:
+        """Move the finished content to the final path."""
+        self.storage.commit_staged(
+            self.staging_path, self.file_path, self.content_hash, self.category,
+            self.storage.cataloged_blob_key(self.owner_id, self.soul_id, self.category, self.file_path.name),
+            self.codec
+        )
+    
+    def record(self) -> FileInfo:
+        """Record the committed content in the catalog."""
+        return self.storage.record_file(
+            self.owner_id, self.soul_id, self.category, self.file_path, self.content_hash,
+            self.size, self.codec
+        )
+    
+    def commit(self) -> FileInfo:
+        """
+        Move the staged content into place and record it.
+        
+        Returns:
+            FileInfo object with file details
+        """
+        self.finish()
+        self.move_into_place()
+        return self.record()
+    
+    def abort(self) -> None:
+        """Discard the staged content."""
+        try:
+            self._writer.close()
+        finally:
+            self.staging_path.unlink(missing_ok=True)
 
 
 class ScopedPathBuilder:
-    """Build scoped file paths based on owner and soul IDs."""
+    """
+    Build scoped file paths based on owner and soul IDs.
+    
+    In the flat layout owners live at DATA_DIR/<owner_id>. The sharded
+    layout fans owners out by hash as DATA_DIR/.shards/ab/cd/<owner_id> so
+    no directory grows with the number of owners. While a deployment is
+    being migrated, owners not yet moved keep resolving to their flat path.
+    """
     
     # Category constants
     CATEGORY_UPLOADS = "uploads"
     CATEGORY_TRANSCRIPTS = "transcripts"
     CATEGORY_INDEX = "index"
     
-    def __init__(self, data_dir: str = None):
+    # Layout constants
+    LAYOUT_FLAT = "flat"
+    LAYOUT_SHARDED = "sharded"
+    SHARDS_DIRNAME = ".shards"
+    
+    def __init__(self, data_dir: str = None, layout: str = None):
         """
         Initialize path builder.
         
         Args:
             data_dir: Root directory for data storage
+            layout: 'flat' or 'sharded'
         """
         self.data_dir = Path(data_dir or os.getenv("DATA_DIR", "./data"))
+        self.layout = layout or os.getenv("STORAGE_LAYOUT", self.LAYOUT_FLAT)
+        if self.layout not in (self.LAYOUT_FLAT, self.LAYOUT_SHARDED):
+            raise ValueError(f"Unknown storage layout: {self.layout}")
     
     def get_soul_path(self, owner_id: str, soul_id: str) -> Path:
         """
@@ -54,7 +180,7 @@ class ScopedPathBuilder:
         Returns:
             Path to soul directory
         """
-        return self.data_dir / owner_id / soul_id
+        return self.get_owner_path(owner_id) / soul_id
     
     def get_category_path(self, owner_id: str, soul_id: str, category: str) -> Path:
         """
@@ -80,8 +206,86 @@ class ScopedPathBuilder:
         Returns:
             Path to owner directory
         """
+        if self.layout == self.LAYOUT_FLAT:
+            return self.flat_owner_path(owner_id)
+        
+        sharded_path = self.sharded_owner_path(owner_id)
+        if not sharded_path.exists():
+            # Not migrated yet: keep serving the flat directory
+            flat_path = self.flat_owner_path(owner_id)
+            if flat_path.exists():
+                return flat_path
+        return sharded_path
+    
+    def flat_owner_path(self, owner_id: str) -> Path:
+        """Owner directory in the flat layout."""
         return self.data_dir / owner_id
     
+    def sharded_owner_path(self, owner_id: str) -> Path:
+        """Owner directory in the sharded layout."""
+        digest = hashlib.sha256(owner_id.encode("utf-8")).hexdigest()
+        return self.data_dir / self.SHARDS_DIRNAME / digest[:2] / digest[2:4] / owner_id
+    
+    def list_flat_owner_ids(self) -> List[str]:
+        """
+        List owners stored in the flat layout.
+        
+        Returns:
+            Sorted list of owner identifiers
+        """
+        if not self.data_dir.exists():
+            return []
+        
+        with os.scandir(self.data_dir) as entries:
+            return sorted(
+                entry.name for entry in entries
+                if entry.is_dir() and not entry.name.startswith(".")
+            )
+    
+    def list_owner_ids(self) -> List[str]:
+        """
+        List the owner identifiers that have data.
+        
+        Returns:
+            Sorted list of owner identifiers
+        """
+        owner_ids = set(self.list_flat_owner_ids())
+        
+        shards_root = self.data_dir / self.SHARDS_DIRNAME
+        if shards_root.exists():
+            for shard in shards_root.iterdir():
+                if not shard.is_dir():
+                    continue
+                for sub_shard in shard.iterdir():
+                    if not sub_shard.is_dir():
+                        continue
+                    with os.scandir(sub_shard) as entries:
+                        owner_ids.update(
+                            entry.name for entry in entries
+                            if entry.is_dir() and not entry.name.startswith(".")
+                        )
+        
+        return sorted(owner_ids)
+    
+    def list_soul_ids(self, owner_id: str) -> List[str]:
+        """
+        List the soul identifiers that have data for an owner.
+        
+        Args:
+            owner_id: Owner identifier
+        
+        Returns:
+            Sorted list of soul identifiers
+        """
+        owner_path = self.get_owner_path(owner_id)
+        if not owner_path.exists():
+            return []
+        
+        return sorted(
+            entry.name for entry in owner_path.iterdir()
+            if entry.is_dir() and not entry.name.startswith(".")
+        )
+    
     def ensure_paths_exist(self, owner_id: str, soul_id: str) -> None:
         """
         Create all necessary directories for a soul.
@@ -97,7 +301,17 @@ class ScopedPathBuilder:
 
 
 class ScopedStorage:
-    """Scoped file storage manager."""
+    """
+    Scoped file storage manager.
+    
+    Uploads and transcripts are recorded in a metadata catalog on every save
+    and delete; index files are owned by ScopedRAG and read from disk.
+    """
+    
+    CATALOGED_CATEGORIES = (
+        ScopedPathBuilder.CATEGORY_UPLOADS,
+        ScopedPathBuilder.CATEGORY_TRANSCRIPTS,
+    )
     
     def __init__(self, data_dir: str = None):
         """
@@ -108,6 +322,11 @@ class ScopedStorage:
         """
         self.path_builder = ScopedPathBuilder(data_dir)
         self.data_dir = self.path_builder.data_dir
+        self.blob_store = BlobStore(self.data_dir)
+        self.catalog = StorageCatalog(self.data_dir)
+        self.compression = StorageCompression()
+        # Trashed trees release their blob links, so collect after each one
+        self.trash = TrashBin(self.data_dir, on_reclaimed=self._collect_blobs)
         logger.info(f"Initialized ScopedStorage with data_dir: {self.data_dir}")
     
     def save_file(
@@ -134,34 +353,432 @@ class ScopedStorage:
         Raises:
             StorageError: If file save fails
         """
+        staged = None
         try:
-            # Ensure paths exist
-            self.path_builder.ensure_paths_exist(owner_id, soul_id)
-            
-            # Get target path
-            category_path = self.path_builder.get_category_path(owner_id, soul_id, category)
-            file_path = category_path / filename
+            # Write to a staging file while hashing, then commit atomically
+            staged = self.begin_write(owner_id, soul_id, filename, category)
+            for chunk in iter(lambda: file_content.read(1024 * 1024), b""):
+                staged.write(chunk)
+            file_info = staged.commit()
             
-            # Save file
-            with open(file_path, "wb") as f:
-                shutil.copyfileobj(file_content, f)
+            logger.info(f"Saved file: {staged.file_path} ({file_info.size} bytes)")
             
-            # Get file info
-            stats = file_path.stat()
-            
-            logger.info(f"Saved file: {file_path} ({stats.st_size} bytes)")
-            
-            return FileInfo(
-                filename=filename,
-                size=stats.st_size,
-                created_at=datetime.fromtimestamp(stats.st_ctime),
-                path=str(file_path),
-                category=category
-            )
+            return file_info
         except Exception as e:
+            if staged is not None:
+                staged.abort()
             logger.error(f"Failed to save file {filename}: {e}")
             raise StorageError(f"Failed to save file: {e}")
     
+    def begin_write(self, owner_id: str, soul_id: str, filename: str, category: str) -> StagedWrite:
+        """
+        Start writing new content for a scoped file.
+        
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            filename: Name of the file
+            category: Category for the file
+        
+        Returns:
+            StagedWrite to feed with chunks and commit
+        """
+        self.path_builder.ensure_paths_exist(owner_id, soul_id)
+        return StagedWrite(self, owner_id, soul_id, filename, category)
+    
+    def commit_all(self, writes: Sequence[StagedWrite]) -> List[FileInfo]:
+        """
+        Commit staged writes that belong together, all or none.
+        
+        Every write is finished before any is moved into place. If one
+        cannot be moved, those already moved get their previous content
+        back (or are removed if they are new), so a failure never leaves
+        some of the files updated and others not.
+        
+        Args:
+            writes: Staged writes of different files
+        
+        Returns:
+            FileInfo of each write, in order
+        
+        Raises:
+            ValueError: For uploads, whose content is linked from the blob store
+        """
+        if any(staged.category == ScopedPathBuilder.CATEGORY_UPLOADS for staged in writes):
+            raise ValueError("Uploads cannot be committed together")
+        
+        for staged in writes:
+            staged.finish()
+        
+        backups: List[Optional[Path]] = []
+        try:
+            for staged in writes:
+                backup = self.temp_path_for(staged.file_path)
+                try:
+                    os.link(staged.file_path, backup)
+                except FileNotFoundError:
+                    backup = None
+                backups.append(backup)
+                staged.move_into_place()
+        except BaseException:
+            for staged, backup in zip(writes, backups):
+                if backup is not None:
+                    os.replace(backup, staged.file_path)
+                else:
+                    staged.file_path.unlink(missing_ok=True)
+            raise
+        
+        for backup in backups:
+            if backup is not None:
+                backup.unlink(missing_ok=True)
+        return [staged.record() for staged in writes]
+    
+    def commit_file(
+        self,
+        owner_id: str,
+        soul_id: str,
+        source_path: Path,
+        filename: str,
+        category: str
+    ) -> FileInfo:
+        """
+        Store an already written file under a scoped name.
+        
+        The source must be on the data directory's filesystem. It is moved
+        into place without copying unless the category compresses it.
+        
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            source_path: Complete file with the original content
+            filename: Name of the file
+            category: Category for the file
+        
+        Returns:
+            FileInfo object with file details
+        """
+        if self.compression.codec_for(category, filename) is not None:
+            staged = self.begin_write(owner_id, soul_id, filename, category)
+            try:
+                with open(source_path, "rb") as f:
+                    for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                        staged.write(chunk)
+                file_info = staged.commit()
+            except Exception:
+                staged.abort()
+                raise
+            source_path.unlink(missing_ok=True)
+            return file_info
+        
+        self.path_builder.ensure_paths_exist(owner_id, soul_id)
+        file_path = self.path_builder.get_category_path(owner_id, soul_id, category) / filename
+        content_hash = hash_file(source_path)
+        self.commit_staged(
+            source_path, file_path, content_hash, category,
+            self.cataloged_blob_key(owner_id, soul_id, category, filename)
+        )
+        return self.record_file(owner_id, soul_id, category, file_path, content_hash)
+    
+    def get_file_info(
+        self,
+        owner_id: str,
+        soul_id: str,
+        filename: str,
+        category: str
+    ) -> Optional[FileInfo]:
+        """
+        Get details of a single scoped file.
+        
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            filename: Name of the file
+            category: Category of the file
+        
+        Returns:
+            FileInfo (with the cataloged hash and logical size when
+            available), or None if the file does not exist
+        """
+        file_path = self.path_builder.get_category_path(owner_id, soul_id, category) / filename
+        try:
+            stats = file_path.stat()
+        except FileNotFoundError:
+            return None
+        
+        entry = None
+        if category in self.CATALOGED_CATEGORIES:
+            entry = self.catalog.get(owner_id, soul_id, category, filename)
+        
+        return FileInfo(
+            filename=filename,
+            size=entry.size if entry else stats.st_size,
+            created_at=datetime.fromtimestamp(stats.st_ctime),
+            path=str(file_path),
+            category=category,
+            content_hash=entry.content_hash if entry else None,
+            references=self.references_for(
+                owner_id, category, entry.content_hash if entry else None, entry.codec if entry else None
+            ),
+            physical_size=stats.st_size,
+            codec=entry.codec if entry else None
+        )
+    
+    def open_file(self, owner_id: str, soul_id: str, filename: str, category: str) -> BinaryIO:
+        """
+        Open a scoped file for streaming reads of its original content.
+        
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            filename: Name of the file
+            category: Category of the file
+        
+        Returns:
+            Binary file object (decompressing if stored compressed)
+        
+        Raises:
+            FileNotFoundError: If the file does not exist
+        """
+        file_path = self.path_builder.get_category_path(owner_id, soul_id, category) / filename
+        entry = None
+        if category in self.CATALOGED_CATEGORIES:
+            entry = self.catalog.get(owner_id, soul_id, category, filename)
+        return open_stored_file(file_path, entry.codec if entry else None)
+    
+    def staging_path(self, file_path: Path, category: str) -> Path:
+        """
+        Get a temporary path to write new content for a scoped file.
+        
+        Uploads are staged inside the blob store so they can be renamed
+        into it; other categories are staged next to the target.
+        
+        Args:
+            file_path: Final scoped file path
+            category: Category of the file
+        
+        Returns:
+            Staging file path on the same filesystem as its destination
+        """
+        if category == ScopedPathBuilder.CATEGORY_UPLOADS:
+            return self.blob_store.temp_path()
+        return self.temp_path_for(file_path)
+    
+    def commit_staged(
+        self,
+        staging_path: Path,
+        file_path: Path,
+        content_hash: str,
+        category: str,
+        old_key: Optional[str] = None,
+        codec: Optional[str] = None
+    ) -> bool:
+        """
+        Atomically move a fully written staging file into place.
+        
+        Args:
+            staging_path: Path from staging_path()
+            file_path: Final scoped file path
+            content_hash: SHA-256 of the content
+            category: Category of the file
+            old_key: Cataloged blob key of the content being replaced
+            codec: Codec the staged bytes are compressed with
+        
+        Returns:
+            True if the content was deduplicated against an existing blob
+        """
+        if category == ScopedPathBuilder.CATEGORY_UPLOADS:
+            # Same content under another codec is different bytes: another blob
+            return self.blob_store.store(staging_path, blob_key(content_hash, codec), file_path, old_key)
+        
+        os.replace(staging_path, file_path)
+        return False
+    
+    def cataloged_blob_key(
+        self,
+        owner_id: str,
+        soul_id: str,
+        category: str,
+        filename: str
+    ) -> Optional[str]:
+        """Blob key recorded for an upload, if it is cataloged."""
+        if category != ScopedPathBuilder.CATEGORY_UPLOADS:
+            return None
+        entry = self.catalog.get(owner_id, soul_id, category, filename)
+        if entry is None or entry.content_hash is None:
+            return None
+        return blob_key(entry.content_hash, entry.codec)
+    
+    def references_for(
+        self,
+        owner_id: str,
+        category: str,
+        content_hash: Optional[str],
+        codec: Optional[str] = None
+    ) -> int:
+        """
+        Number of the owner's scoped paths sharing a file's blob.
+        
+        Blobs may also be linked by other owners; those links are never
+        counted, so the result reveals nothing about other tenants.
+        """
+        if category != ScopedPathBuilder.CATEGORY_UPLOADS or content_hash is None:
+            return 1
+        return self.catalog.count_references(owner_id, category, content_hash, codec)
+    
+    def record_file(
+        self,
+        owner_id: str,
+        soul_id: str,
+        category: str,
+        file_path: Path,
+        content_hash: Optional[str] = None,
+        size: Optional[int] = None,
+        codec: Optional[str] = None
+    ) -> FileInfo:
+        """
+        Record a committed file in the catalog.
+        
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            category: Category of the file
+            file_path: Scoped file path
+            content_hash: SHA-256 of the content if known
+            size: Logical (uncompressed) size if it differs from the file size
+            codec: Compression codec the file was written with
+        
+        Returns:
+            FileInfo object with file details
+        """
+        stats = file_path.stat()
+        size = stats.st_size if size is None else size
+        
+        if category in self.CATALOGED_CATEGORIES:
+            # Sidecars of the previous content are stale; unchanged content keeps its own
+            previous = self.catalog.get(owner_id, soul_id, category, file_path.name)
+            derived_size = 0
+            if previous is not None:
+                if content_hash is not None and previous.content_hash == content_hash:
+                    derived_size = previous.derived_size
+                else:
+                    self._remove_derived_files(file_path)
+            self.catalog.record(
+                owner_id, soul_id, category, file_path.name,
+                size, content_hash, stats.st_ctime, stats.st_mtime, stats.st_size, codec,
+                derived_size
+            )
+        
+        return FileInfo(
+            filename=file_path.name,
+            size=size,
+            created_at=datetime.fromtimestamp(stats.st_ctime),
+            path=str(file_path),
+            category=category,
+            content_hash=content_hash,
+            references=self.references_for(owner_id, category, content_hash, codec),
+            physical_size=stats.st_size,
+            codec=codec
+        )
+    
+    def record_derived_file(
+        self,
+        owner_id: str,
+        soul_id: str,
+        category: str,
+        filename: str,
+        content_hash: Optional[str],
+        derived_path: Path
+    ) -> bool:
+        """
+        Charge a sidecar derived from a file (e.g. decoded audio) to its owner.
+        
+        Sidecars count toward the quota and storage statistics along with
+        the file they belong to. A sidecar whose file was deleted or
+        replaced while it was being derived is removed instead.
+        
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            category: Category of the file
+            filename: Name of the file
+            content_hash: SHA-256 of the content the sidecar was derived from
+            derived_path: Sidecar path
+        
+        Returns:
+            True if the sidecar was recorded
+        """
+        try:
+            derived_size = derived_path.stat().st_size
+        except FileNotFoundError:
+            return False
+        if self.catalog.set_derived_size(owner_id, soul_id, category, filename, content_hash, derived_size):
+            return True
+        derived_path.unlink(missing_ok=True)
+        return False
+    
+    def remaining_quota(self, owner_id: str, quota_bytes: int) -> Optional[int]:
+        """
+        Get how many more bytes an owner may store.
+        
+        Args:
+            owner_id: Owner identifier
+            quota_bytes: Per-owner quota in bytes (0 disables the quota)
+        
+        Returns:
+            Remaining bytes, or None if there is no quota
+        """
+        if quota_bytes <= 0:
+            return None
+        return max(0, quota_bytes - self.catalog.get_owner_usage(owner_id))
+    
+    def write_text(
+        self,
+        owner_id: str,
+        soul_id: str,
+        filename: str,
+        text: str,
+        category: str
+    ) -> FileInfo:
+        """
+        Write a text file to scoped storage atomically.
+        
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            filename: Name of the file
+            text: Text content (written as UTF-8)
+            category: Category for the file
+        
+        Returns:
+            FileInfo object with file details
+        
+        Raises:
+            StorageError: If the write fails
+        """
+        staged = None
+        try:
+            staged = self.begin_write(owner_id, soul_id, filename, category)
+            staged.write(text.encode("utf-8"))
+            return staged.commit()
+        except Exception as e:
+            if staged is not None:
+                staged.abort()
+            logger.error(f"Failed to write file {filename}: {e}")
+            raise StorageError(f"Failed to write file: {e}")
+    
+    @staticmethod
+    def temp_path_for(file_path: Path) -> Path:
+        """
+        Get a unique hidden temporary path next to a target file.
+        
+        Args:
+            file_path: Final file path
+        
+        Returns:
+            Temporary path in the same directory (same filesystem for rename)
+        """
+        return file_path.parent / f".{file_path.name}.{uuid.uuid4().hex}.part"
+    
     def list_files(
         self,
         owner_id: str,
@@ -179,34 +796,195 @@ class ScopedStorage:
         Returns:
             List of FileInfo objects
         """
-        files = []
+        categories = self._categories(category)
         
-        if category:
-            categories = [category]
-        else:
-            categories = [
-                ScopedPathBuilder.CATEGORY_UPLOADS,
-                ScopedPathBuilder.CATEGORY_TRANSCRIPTS,
-                ScopedPathBuilder.CATEGORY_INDEX,
-            ]
+        cataloged = [cat for cat in categories if cat in self.CATALOGED_CATEGORIES]
+        entries = self.catalog.list_files(owner_id, soul_id, cataloged) if cataloged else []
         
         for cat in categories:
-            category_path = self.path_builder.get_category_path(owner_id, soul_id, cat)
-            if not category_path.exists():
-                continue
-            
-            for file_path in category_path.iterdir():
-                if file_path.is_file():
-                    stats = file_path.stat()
-                    files.append(FileInfo(
-                        filename=file_path.name,
-                        size=stats.st_size,
-                        created_at=datetime.fromtimestamp(stats.st_ctime),
-                        path=str(file_path),
-                        category=cat
-                    ))
-        
-        return files
+            if cat not in self.CATALOGED_CATEGORIES:
+                entries.extend(self._scan_category(owner_id, soul_id, cat))
+        
+        return [self._file_info_from_entry(entry) for entry in entries]
+    
+    def list_files_page(
+        self,
+        owner_id: str,
+        soul_id: str,
+        category: Optional[str] = None,
+        limit: Optional[int] = 100,
+        cursor: Optional[str] = None,
+        sort: str = "name",
+        descending: bool = False
+    ) -> Tuple[List[FileInfo], Optional[str]]:
+        """
+        List one page of files in scoped storage.
+        
+        Pages are keyset-based: the cursor encodes the sort key of the last
+        file returned, so each page costs one indexed catalog query plus a
+        bounded selection over disk-scanned categories, and memory stays
+        proportional to the page size.
+        
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            category: Optional category filter
+            limit: Maximum number of files (None lists every file after the cursor)
+            cursor: Cursor returned with the previous page
+            sort: 'name', 'size' or 'created_at'
+            descending: Reverse the sort order
+        
+        Returns:
+            Tuple of (files, cursor for the next page or None)
+        
+        Raises:
+            ValueError: If sort or cursor is invalid
+        """
+        if sort not in SORT_KEYS:
+            raise ValueError(f"Invalid sort: {sort}")
+        
+        columns = SORT_KEYS[sort]
+        after = decode_cursor(cursor, sort, descending) if cursor else None
+        
+        def sort_key(entry: CatalogEntry) -> Tuple:
+            return tuple(getattr(entry, column) for column in columns)
+        
+        def is_after(entry: CatalogEntry) -> bool:
+            if after is None:
+                return True
+            return sort_key(entry) < after if descending else sort_key(entry) > after
+        
+        categories = self._categories(category)
+        cataloged = [cat for cat in categories if cat in self.CATALOGED_CATEGORIES]
+        
+        # One extra entry tells whether another page exists
+        fetch = limit + 1 if limit is not None else None
+        sources = []
+        if cataloged:
+            sources.append(self.catalog.list_page(
+                owner_id, soul_id, cataloged, sort, descending, after, fetch
+            ))
+        select = heapq.nlargest if descending else heapq.nsmallest
+        for cat in categories:
+            if cat not in self.CATALOGED_CATEGORIES:
+                scanned = filter(is_after, self._scan_category(owner_id, soul_id, cat))
+                if fetch is None:
+                    sources.append(sorted(scanned, key=sort_key, reverse=descending))
+                else:
+                    sources.append(select(fetch, scanned, key=sort_key))
+        
+        merged = list(itertools.islice(
+            heapq.merge(*sources, key=sort_key, reverse=descending), fetch
+        ))
+        if limit is None or len(merged) <= limit:
+            page, next_cursor = merged, None
+        else:
+            page = merged[:limit]
+            next_cursor = encode_cursor(sort, descending, sort_key(page[-1]))
+        
+        return [self._file_info_from_entry(entry) for entry in page], next_cursor
+    
+    def count_files(self, owner_id: str, soul_id: str, category: Optional[str] = None) -> Tuple[int, int]:
+        """
+        Count the files a listing covers across all of its pages.
+        
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            category: Optional category filter
+        
+        Returns:
+            Tuple of (file count, total logical size in bytes)
+        """
+        count = total_size = 0
+        category_stats = self.catalog.get_category_stats(owner_id, soul_id)
+        for cat in self._categories(category):
+            if cat in self.CATALOGED_CATEGORIES:
+                stats = category_stats.get(cat, {"count": 0, "total_size": 0})
+                count += stats["count"]
+                total_size += stats["total_size"]
+            else:
+                for entry in self._scan_category(owner_id, soul_id, cat):
+                    count += 1
+                    total_size += entry.size
+        return count, total_size
+    
+    @staticmethod
+    def _categories(category: Optional[str]) -> List[str]:
+        """Categories selected by an optional filter."""
+        if category:
+            return [category]
+        return [
+            ScopedPathBuilder.CATEGORY_UPLOADS,
+            ScopedPathBuilder.CATEGORY_TRANSCRIPTS,
+            ScopedPathBuilder.CATEGORY_INDEX,
+        ]
+    
+    def _scan_category(self, owner_id: str, soul_id: str, category: str) -> Iterator[CatalogEntry]:
+        """
+        Enumerate a category directory that is not cataloged.
+        
+        Uses os.scandir so each entry's type comes from the directory read
+        and its stat result is cached on the DirEntry.
+        
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            category: Category to scan
+        
+        Yields:
+            Catalog-shaped entries for each visible file
+        """
+        category_path = self.path_builder.get_category_path(owner_id, soul_id, category)
+        try:
+            entries = os.scandir(category_path)
+        except FileNotFoundError:
+            return
+        
+        with entries:
+            for entry in entries:
+                # Skip in-progress writes and other hidden files
+                if entry.name.startswith(".") or not entry.is_file(follow_symlinks=False):
+                    continue
+                stats = entry.stat(follow_symlinks=False)
+                yield CatalogEntry(
+                    owner_id=owner_id,
+                    soul_id=soul_id,
+                    category=category,
+                    filename=entry.name,
+                    size=stats.st_size,
+                    content_hash=None,
+                    created_at=stats.st_ctime,
+                    modified_at=stats.st_mtime,
+                    physical_size=stats.st_size
+                )
+    
+    def _file_info_from_entry(self, entry: CatalogEntry) -> FileInfo:
+        """Build a FileInfo from a catalog entry."""
+        return FileInfo(
+            filename=entry.filename,
+            size=entry.size,
+            created_at=datetime.fromtimestamp(entry.created_at),
+            path=str(self.path_builder.get_category_path(
+                entry.owner_id, entry.soul_id, entry.category
+            ) / entry.filename),
+            category=entry.category,
+            content_hash=entry.content_hash,
+            references=entry.references,
+            physical_size=entry.physical_size,
+            codec=entry.codec
+        )
+    
+    @staticmethod
+    def _remove_derived_files(file_path: Path) -> None:
+        """
+        Remove hidden sidecars derived from a file (e.g. decoded audio).
+        
+        Only the file's own sidecars are matched; in-progress writes
+        (.part files) and sidecars of other files are left alone.
+        """
+        for derived in decoded_audio_files(file_path):
+            derived.unlink(missing_ok=True)
     
     def delete_file(
         self,
@@ -229,18 +1007,46 @@ class ScopedStorage:
         """
         file_path = self.path_builder.get_category_path(owner_id, soul_id, category) / filename
         
+        entry = self.catalog.remove(owner_id, soul_id, category, filename)
+        
         if file_path.exists():
-            file_path.unlink()
+            if category == ScopedPathBuilder.CATEGORY_UPLOADS:
+                self.blob_store.release(
+                    file_path,
+                    blob_key(entry.content_hash, entry.codec) if entry and entry.content_hash else None
+                )
+                self._remove_derived_files(file_path)
+            else:
+                file_path.unlink()
             logger.info(f"Deleted file: {file_path}")
             return True
         
         logger.warning(f"File not found for deletion: {file_path}")
         return False
     
+    def _collect_blobs(self, blob_keys: Optional[List[str]]) -> None:
+        """Collect the blobs a reclaimed tree linked to (all blobs if unknown)."""
+        if blob_keys is None:
+            self.blob_store.collect_garbage()
+        else:
+            self.blob_store.collect(blob_keys)
+    
+    def _upload_blob_keys(self, owner_id: str, soul_id: Optional[str] = None) -> List[str]:
+        """Keys of the blobs an owner's or a soul's uploads link to."""
+        return [
+            blob_key(content_hash, codec)
+            for content_hash, codec in self.catalog.get_stored_contents(
+                owner_id, soul_id, ScopedPathBuilder.CATEGORY_UPLOADS
+            )
+        ]
+    
     def delete_soul_data(self, owner_id: str, soul_id: str) -> bool:
         """
         Delete all data for a soul.
         
+        The soul directory is moved to the trash and reclaimed in the
+        background, so this returns immediately regardless of file count.
+        
         Args:
             owner_id: Owner identifier
             soul_id: Soul identifier
@@ -250,8 +1056,12 @@ class ScopedStorage:
         """
         soul_path = self.path_builder.get_soul_path(owner_id, soul_id)
         
+        blob_keys = self._upload_blob_keys(owner_id, soul_id)
+        self.catalog.remove_soul(owner_id, soul_id)
+        
         if soul_path.exists():
-            shutil.rmtree(soul_path)
+            self.trash.move(soul_path, blob_keys)
+            self.trash.schedule()
             logger.info(f"Deleted soul data: {soul_path}")
             return True
         
@@ -262,6 +1072,9 @@ class ScopedStorage:
         """
         Delete all data for an owner.
         
+        The owner directory is moved to the trash and reclaimed in the
+        background, so this returns immediately regardless of file count.
+        
         Args:
             owner_id: Owner identifier
         
@@ -270,8 +1083,12 @@ class ScopedStorage:
         """
         owner_path = self.path_builder.get_owner_path(owner_id)
         
+        blob_keys = self._upload_blob_keys(owner_id)
+        self.catalog.remove_owner(owner_id)
+        
         if owner_path.exists():
-            shutil.rmtree(owner_path)
+            self.trash.move(owner_path, blob_keys)
+            self.trash.schedule()
             logger.info(f"Deleted owner data: {owner_path}")
             return True
         
@@ -290,20 +1107,140 @@ class ScopedStorage:
             Dictionary with storage statistics
         """
         stats = {
-            "uploads": {"count": 0, "total_size": 0},
-            "transcripts": {"count": 0, "total_size": 0},
-            "index": {"count": 0, "total_size": 0},
+            "uploads": {"count": 0, "total_size": 0, "physical_size": 0, "derived_size": 0},
+            "transcripts": {"count": 0, "total_size": 0, "physical_size": 0, "derived_size": 0},
+            "index": {"count": 0, "total_size": 0, "physical_size": 0, "derived_size": 0},
         }
         
-        for category in [
-            ScopedPathBuilder.CATEGORY_UPLOADS,
-            ScopedPathBuilder.CATEGORY_TRANSCRIPTS,
-            ScopedPathBuilder.CATEGORY_INDEX,
-        ]:
-            files = self.list_files(owner_id, soul_id, category)
-            stats[category] = {
-                "count": len(files),
-                "total_size": sum(f.size for f in files)
-            }
+        # Cataloged categories are aggregated by the database
+        stats.update(self.catalog.get_category_stats(owner_id, soul_id))
+        
+        # Each of the owner's references accounts for an equal share of a
+        # shared blob, so summing this over the owner's souls gives the bytes
+        # deduplication saved them (sharing with other owners is not counted)
+        uploads = self.catalog.list_files(
+            owner_id, soul_id, [ScopedPathBuilder.CATEGORY_UPLOADS]
+        )
+        stats["uploads"]["deduplicated_bytes"] = int(sum(
+            physical - physical / f.references
+            for f in uploads
+            for physical in [f.physical_size if f.physical_size is not None else f.size]
+        ))
+        
+        index_files = self.list_files(owner_id, soul_id, ScopedPathBuilder.CATEGORY_INDEX)
+        index_size = sum(f.size for f in index_files)
+        stats["index"] = {
+            "count": len(index_files),
+            "total_size": index_size,
+            "physical_size": index_size,
+            "derived_size": 0
+        }
         
         return stats
+    
+    def reconcile_if_empty(self) -> Optional[int]:
+        """
+        Build the catalog from disk if it has no entries.
+        
+        Data directories from versions without a catalog would otherwise
+        look empty to listings, statistics and quota checks.
+        
+        Returns:
+            Number of cataloged files, or None if the catalog was in use
+        """
+        if not self.catalog.is_empty():
+            return None
+        if not self.path_builder.list_owner_ids():
+            return 0
+        
+        logger.info("Storage catalog is empty; building it from the files on disk")
+        return self.reconcile_catalog()
+    
+    def rekey_compressed_blobs(self) -> int:
+        """
+        Move compressed upload blobs to their codec-qualified keys.
+        
+        Earlier versions stored compressed uploads under the plain content
+        hash, where an identical upload stored as-is would be deduplicated
+        against the compressed bytes.
+        
+        Returns:
+            Number of blobs moved
+        """
+        moved = 0
+        for entry in self.catalog.list_compressed():
+            if entry.category != ScopedPathBuilder.CATEGORY_UPLOADS or entry.content_hash is None:
+                continue
+            file_path = self.path_builder.get_category_path(
+                entry.owner_id, entry.soul_id, entry.category
+            ) / entry.filename
+            moved += self.blob_store.rekey(
+                entry.content_hash, blob_key(entry.content_hash, entry.codec), file_path
+            )
+        if moved:
+            logger.info(f"Moved {moved} compressed upload blobs to codec-qualified keys")
+        return moved
+    
+    def reconcile_catalog(self, hash_contents: bool = True) -> int:
+        """
+        Rebuild the metadata catalog from the files on disk.
+        
+        Used after crashes, manual edits of DATA_DIR or upgrades from a
+        version without a catalog.
+        
+        Args:
+            hash_contents: Compute content hashes (slower, but keeps
+                deduplication statistics accurate)
+        
+        Returns:
+            Number of cataloged files
+        """
+        # Codecs are only known from the catalog: keep them for files that
+        # have not changed since they were recorded, and read the rest as-is
+        compressed = {
+            (entry.owner_id, entry.soul_id, entry.category, entry.filename): entry
+            for entry in self.catalog.list_compressed()
+        }
+        
+        def scan():
+            for owner_id in self.path_builder.list_owner_ids():
+                for soul_id in self.path_builder.list_soul_ids(owner_id):
+                    for category in self.CATALOGED_CATEGORIES:
+                        category_path = self.path_builder.get_category_path(
+                            owner_id, soul_id, category
+                        )
+                        if not category_path.exists():
+                            continue
+                        for file_path in category_path.iterdir():
+                            if not file_path.is_file() or file_path.name.startswith("."):
+                                continue
+                            stats = file_path.stat()
+                            previous = compressed.get((owner_id, soul_id, category, file_path.name))
+                            codec = None
+                            if (
+                                previous is not None
+                                and previous.physical_size == stats.st_size
+                                and previous.modified_at == stats.st_mtime
+                            ):
+                                codec = previous.codec
+                            size, content_hash = measure_stored_file(file_path, codec, hash_contents)
+                            yield CatalogEntry(
+                                owner_id=owner_id,
+                                soul_id=soul_id,
+                                category=category,
+                                filename=file_path.name,
+                                size=size,
+                                content_hash=content_hash,
+                                created_at=stats.st_ctime,
+                                modified_at=stats.st_mtime,
+                                physical_size=stats.st_size,
+                                codec=codec,
+                                derived_size=sum(
+                                    derived.stat().st_size
+                                    for derived in decoded_audio_files(file_path)
+                                )
+                            )
+        
+        count = self.catalog.replace_all(scan())
+        logger.info(f"Reconciled storage catalog: {count} files")
+        return count
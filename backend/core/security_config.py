@@ -20,6 +20,10 @@ class SecurityConfig(BaseModel):
     refresh_token_expire_days: int = Field(
         default_factory=lambda: int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "30"))
     )
+    # Verified access tokens kept in memory (0 = verify every request)
+    auth_token_cache_size: int = Field(
+        default_factory=lambda: int(os.getenv("AUTH_TOKEN_CACHE_SIZE", "4096"))
+    )
     
     # Request Limits
     max_request_size_mb: int = Field(
@@ -28,6 +32,9 @@ class SecurityConfig(BaseModel):
     max_upload_size_mb: int = Field(
         default_factory=lambda: int(os.getenv("MAX_UPLOAD_SIZE_MB", "100"))
     )
+    storage_quota_mb_per_owner: int = Field(
+        default_factory=lambda: int(os.getenv("STORAGE_QUOTA_MB_PER_OWNER", "0"))
+    )
     rate_limit_per_minute: int = Field(
         default_factory=lambda: int(os.getenv("RATE_LIMIT_PER_MINUTE", "120"))
     )
@@ -0,0 +1,217 @@
+"""
+Per-soul semantic answer cache for the chat pipeline.
+Reuses an answer when a new query embeds close to a previous one and the
+soul's RAG index has not been rebuilt since.
+"""
+
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+from backend.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    """A cached chat answer."""
+    query: str
+    query_vector: np.ndarray
+    index_version: int
+    variant: Hashable
+    response_text: str
+    used_docs: List[Dict[str, Any]] = field(default_factory=list)
+    created_at: float = field(default_factory=time.time)
+
+
+@dataclass
+class CacheHit:
+    """A cache lookup result."""
+    entry: CacheEntry
+    similarity: float
+
+
+class SemanticAnswerCache:
+    """
+    LRU cache of chat answers per soul, matched by query embedding similarity.
+
+    Entries are only reused for the index version they were generated
+    against and for the same request variant (model, retrieval settings).
+    Each soul holds at most max_entries answers; the least recently used
+    soul caches are dropped once more than max_souls are tracked.
+    """
+
+    def __init__(
+        self,
+        threshold: float = None,
+        max_entries: int = None,
+        max_souls: int = None,
+        enabled: bool = None
+    ):
+        """
+        Initialize semantic cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a hit
+            max_entries: Maximum cached answers per soul
+            max_souls: Maximum number of souls with cached answers
+            enabled: Whether the cache is used at all
+        """
+        self.threshold = threshold or float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92"))
+        self.max_entries = max_entries or int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "256"))
+        self.max_souls = max_souls or int(os.getenv("SEMANTIC_CACHE_MAX_SOULS", "1024"))
+        if enabled is None:
+            enabled = os.getenv("SEMANTIC_CACHE_ENABLED", "true").lower() == "true"
+        self.enabled = enabled
+
+        self._souls: "OrderedDict[Tuple[str, str], OrderedDict[int, CacheEntry]]" = OrderedDict()
+        self._next_id = 0
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(
+        self,
+        owner_id: str,
+        soul_id: str,
+        query_vector: np.ndarray,
+        index_version: int,
+        variant: Hashable = None
+    ) -> Optional[CacheHit]:
+        """
+        Find a cached answer for a semantically similar query.
+
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            query_vector: Normalized query embedding
+            index_version: Current RAG index version of the soul
+            variant: Request settings the answer must match
+
+        Returns:
+            Best matching CacheHit above the threshold, or None
+        """
+        if not self.enabled:
+            return None
+
+        entries = self._souls.get((owner_id, soul_id))
+        if not entries:
+            self.misses += 1
+            return None
+
+        # Answers generated against an older index are stale
+        stale = [key for key, entry in entries.items() if entry.index_version != index_version]
+        for key in stale:
+            del entries[key]
+
+        candidates = [
+            (key, entry) for key, entry in entries.items() if entry.variant == variant
+        ]
+        if not candidates:
+            self.misses += 1
+            return None
+
+        matrix = np.stack([entry.query_vector for _, entry in candidates])
+        similarities = matrix @ query_vector
+        best = int(np.argmax(similarities))
+        similarity = float(similarities[best])
+
+        if similarity < self.threshold:
+            self.misses += 1
+            return None
+
+        key, entry = candidates[best]
+        entries.move_to_end(key)
+        self._souls.move_to_end((owner_id, soul_id))
+        self.hits += 1
+
+        logger.debug(f"Semantic cache hit for {owner_id}/{soul_id} (similarity {similarity:.3f})")
+        return CacheHit(entry=entry, similarity=similarity)
+
+    def store(
+        self,
+        owner_id: str,
+        soul_id: str,
+        query: str,
+        query_vector: np.ndarray,
+        index_version: int,
+        response_text: str,
+        used_docs: List[Dict[str, Any]],
+        variant: Hashable = None
+    ) -> None:
+        """
+        Cache an answer for a query.
+
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            query: Original query text
+            query_vector: Normalized query embedding
+            index_version: RAG index version the answer was generated against
+            response_text: Generated answer
+            used_docs: Documents used for the answer
+            variant: Request settings the answer was generated with
+        """
+        if not self.enabled:
+            return
+
+        soul_key = (owner_id, soul_id)
+        entries = self._souls.get(soul_key)
+        if entries is None:
+            entries = OrderedDict()
+            self._souls[soul_key] = entries
+        self._souls.move_to_end(soul_key)
+
+        entries[self._next_id] = CacheEntry(
+            query=query,
+            query_vector=np.asarray(query_vector, dtype=np.float32),
+            index_version=index_version,
+            variant=variant,
+            response_text=response_text,
+            used_docs=used_docs
+        )
+        self._next_id += 1
+
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+        while len(self._souls) > self.max_souls:
+            self._souls.popitem(last=False)
+
+    def invalidate(self, owner_id: str, soul_id: Optional[str] = None) -> None:
+        """
+        Drop cached answers for a soul, or for all of an owner's souls.
+
+        Args:
+            owner_id: Owner identifier
+            soul_id: Optional soul identifier
+        """
+        if soul_id is not None:
+            self._souls.pop((owner_id, soul_id), None)
+            return
+
+        for key in [key for key in self._souls if key[0] == owner_id]:
+            del self._souls[key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with hit/miss counters and sizes
+        """
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "souls": len(self._souls),
+            "entries": sum(len(entries) for entries in self._souls.values()),
+            "threshold": self.threshold,
+        }
+
+
+# Global instance
+semantic_cache = SemanticAnswerCache()
@@ -0,0 +1,552 @@
+"""
+SQLite metadata catalog for scoped storage.
+Records every stored file so listings, statistics and quota checks are
+indexed queries instead of directory scans.
+"""
+
+import base64
+import json
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from backend.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    owner_id TEXT NOT NULL,
+    soul_id TEXT NOT NULL,
+    category TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    content_hash TEXT,
+    created_at REAL NOT NULL,
+    modified_at REAL NOT NULL,
+    physical_size INTEGER,
+    codec TEXT,
+    derived_size INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (owner_id, soul_id, category, filename)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS files_by_hash ON files (owner_id, content_hash, category);
+CREATE INDEX IF NOT EXISTS files_by_name ON files (owner_id, soul_id, filename, category);
+CREATE INDEX IF NOT EXISTS files_by_size ON files (owner_id, soul_id, size, category, filename);
+CREATE INDEX IF NOT EXISTS files_by_created ON files (owner_id, soul_id, created_at, category, filename);
+"""
+
+# Keyset columns per sort order; every key ends in a unique combination
+SORT_KEYS = {
+    "name": ("filename", "category"),
+    "size": ("size", "category", "filename"),
+    "created_at": ("created_at", "category", "filename"),
+}
+
+# Value types a cursor key may hold per column
+_KEY_TYPES = {
+    "filename": (str,),
+    "category": (str,),
+    "size": (int,),
+    "created_at": (int, float),
+}
+
+
+def encode_cursor(sort: str, descending: bool, key: Sequence[Any]) -> str:
+    """
+    Encode a pagination cursor.
+
+    Args:
+        sort: Sort order the key belongs to
+        descending: Whether the order is reversed
+        key: Sort key of the last entry on the page
+
+    Returns:
+        Opaque URL-safe cursor
+    """
+    payload = json.dumps({"s": sort, "d": descending, "k": list(key)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str, descending: bool) -> Tuple[Any, ...]:
+    """
+    Decode a pagination cursor.
+
+    Args:
+        cursor: Cursor from encode_cursor
+        sort: Sort order of the current request
+        descending: Whether the current order is reversed
+
+    Returns:
+        Sort key to continue after
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another order
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        key = tuple(payload["k"])
+        matches = payload["s"] == sort and payload["d"] is descending
+    except (ValueError, TypeError, KeyError):
+        raise ValueError("Invalid cursor")
+
+    columns = SORT_KEYS[sort]
+    if not matches or len(key) != len(columns):
+        raise ValueError("Cursor does not match the requested sort order")
+
+    # Keys are compared with catalog values, so each must have its column's type
+    for column, value in zip(columns, key):
+        if isinstance(value, bool) or not isinstance(value, _KEY_TYPES[column]):
+            raise ValueError("Invalid cursor")
+
+    return key
+
+
+# References are counted within the owner only: counting across owners
+# would reveal whether another tenant stores the same content. Files with
+# the same content but another codec are stored in a different blob.
+_REFERENCES_SQL = (
+    "(SELECT COUNT(*) FROM files g WHERE g.owner_id = f.owner_id "
+    "AND g.content_hash = f.content_hash AND g.category = f.category "
+    "AND g.codec IS f.codec)"
+)
+
+
+@dataclass
+class CatalogEntry:
+    """A cataloged file."""
+    owner_id: str
+    soul_id: str
+    category: str
+    filename: str
+    size: int
+    content_hash: Optional[str]
+    created_at: float
+    modified_at: float
+    # Bytes on disk when stored compressed (None = same as size)
+    physical_size: Optional[int] = None
+    # Compression codec the file was written with (None = stored as-is)
+    codec: Optional[str] = None
+    # Bytes of hidden sidecars derived from the file (e.g. decoded audio)
+    derived_size: int = 0
+    references: int = 1
+
+
+class StorageCatalog:
+    """File metadata catalog backed by SQLite in WAL mode."""
+
+    DB_FILENAME = ".catalog.db"
+
+    def __init__(self, data_dir: Path):
+        """
+        Initialize storage catalog.
+
+        Args:
+            data_dir: Root data directory; the database lives inside it
+        """
+        self.db_path = Path(data_dir) / self.DB_FILENAME
+        self._local = threading.local()
+        self._initialized = False
+        self._init_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's connection, creating the schema on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+
+        with self._init_lock:
+            if not self._initialized:
+                conn.executescript(_SCHEMA)
+                self._migrate(conn)
+                self._initialized = True
+
+        self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection) -> None:
+        """Add columns introduced after a catalog was created."""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(files)")}
+        if "physical_size" not in columns:
+            conn.execute("ALTER TABLE files ADD COLUMN physical_size INTEGER")
+        if "codec" not in columns:
+            conn.execute("ALTER TABLE files ADD COLUMN codec TEXT")
+        if "derived_size" not in columns:
+            conn.execute("ALTER TABLE files ADD COLUMN derived_size INTEGER NOT NULL DEFAULT 0")
+        # Superseded by the owner-scoped files_by_hash
+        conn.execute("DROP INDEX IF EXISTS files_content_hash")
+
+    def record(
+        self,
+        owner_id: str,
+        soul_id: str,
+        category: str,
+        filename: str,
+        size: int,
+        content_hash: Optional[str],
+        created_at: float,
+        modified_at: float,
+        physical_size: Optional[int] = None,
+        codec: Optional[str] = None,
+        derived_size: int = 0
+    ) -> None:
+        """
+        Insert or update a file entry.
+
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            category: File category
+            filename: File name
+            size: Logical size in bytes
+            content_hash: SHA-256 of the content if known
+            created_at: Creation timestamp (epoch seconds)
+            modified_at: Modification timestamp (epoch seconds)
+            physical_size: Size on disk if stored compressed
+            codec: Compression codec the file was written with
+            derived_size: Bytes of sidecars derived from the file
+        """
+        self._connect().execute(
+            "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (owner_id, soul_id, category, filename, size, content_hash,
+             created_at, modified_at, physical_size, codec, derived_size)
+        )
+
+    def set_derived_size(
+        self,
+        owner_id: str,
+        soul_id: str,
+        category: str,
+        filename: str,
+        content_hash: Optional[str],
+        derived_size: int
+    ) -> bool:
+        """
+        Record the sidecar bytes derived from a file's current content.
+
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            category: File category
+            filename: File name
+            content_hash: SHA-256 of the content the sidecars were derived from
+            derived_size: Bytes of the sidecars
+
+        Returns:
+            False if the file is gone or its content has changed since
+        """
+        cursor = self._connect().execute(
+            "UPDATE files SET derived_size = ? WHERE owner_id = ? AND soul_id = ? "
+            "AND category = ? AND filename = ? AND content_hash IS ?",
+            (derived_size, owner_id, soul_id, category, filename, content_hash)
+        )
+        return cursor.rowcount > 0
+
+    def get(
+        self,
+        owner_id: str,
+        soul_id: str,
+        category: str,
+        filename: str
+    ) -> Optional[CatalogEntry]:
+        """
+        Look up a single file entry.
+
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            category: File category
+            filename: File name
+
+        Returns:
+            CatalogEntry or None
+        """
+        row = self._connect().execute(
+            "SELECT * FROM files WHERE owner_id = ? AND soul_id = ? AND category = ? AND filename = ?",
+            (owner_id, soul_id, category, filename)
+        ).fetchone()
+        return CatalogEntry(*row) if row else None
+
+    def remove(
+        self,
+        owner_id: str,
+        soul_id: str,
+        category: str,
+        filename: str
+    ) -> Optional[CatalogEntry]:
+        """
+        Remove a file entry.
+
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            category: File category
+            filename: File name
+
+        Returns:
+            The removed entry, or None if it was not cataloged
+        """
+        entry = self.get(owner_id, soul_id, category, filename)
+        if entry is not None:
+            self._connect().execute(
+                "DELETE FROM files WHERE owner_id = ? AND soul_id = ? AND category = ? AND filename = ?",
+                (owner_id, soul_id, category, filename)
+            )
+        return entry
+
+    def remove_soul(self, owner_id: str, soul_id: str) -> int:
+        """
+        Remove all entries of a soul.
+
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+
+        Returns:
+            Number of removed entries
+        """
+        cursor = self._connect().execute(
+            "DELETE FROM files WHERE owner_id = ? AND soul_id = ?", (owner_id, soul_id)
+        )
+        return cursor.rowcount
+
+    def remove_owner(self, owner_id: str) -> int:
+        """
+        Remove all entries of an owner.
+
+        Args:
+            owner_id: Owner identifier
+
+        Returns:
+            Number of removed entries
+        """
+        cursor = self._connect().execute("DELETE FROM files WHERE owner_id = ?", (owner_id,))
+        return cursor.rowcount
+
+    def count_references(
+        self,
+        owner_id: str,
+        category: str,
+        content_hash: str,
+        codec: Optional[str] = None
+    ) -> int:
+        """
+        Count an owner's entries in a category that share a content hash and codec.
+
+        Args:
+            owner_id: Owner identifier
+            category: File category
+            content_hash: SHA-256 of the content
+            codec: Compression codec the content is stored with
+
+        Returns:
+            Number of entries (at least 1)
+        """
+        row = self._connect().execute(
+            "SELECT COUNT(*) FROM files WHERE owner_id = ? AND content_hash = ? AND category = ? "
+            "AND codec IS ?",
+            (owner_id, content_hash, category, codec)
+        ).fetchone()
+        return max(1, row[0])
+
+    def get_stored_contents(
+        self,
+        owner_id: str,
+        soul_id: Optional[str] = None,
+        category: Optional[str] = None
+    ) -> List[Tuple[str, Optional[str]]]:
+        """
+        Get the distinct contents stored by an owner or one soul.
+
+        Args:
+            owner_id: Owner identifier
+            soul_id: Optional soul identifier
+            category: Optional category filter
+
+        Returns:
+            (content hash, codec) pairs
+        """
+        query = (
+            "SELECT DISTINCT content_hash, codec FROM files "
+            "WHERE owner_id = ? AND content_hash IS NOT NULL"
+        )
+        params: List[Any] = [owner_id]
+        if soul_id is not None:
+            query += " AND soul_id = ?"
+            params.append(soul_id)
+        if category is not None:
+            query += " AND category = ?"
+            params.append(category)
+        return [(row[0], row[1]) for row in self._connect().execute(query, params)]
+
+    def list_files(
+        self,
+        owner_id: str,
+        soul_id: str,
+        categories: Iterable[str]
+    ) -> List[CatalogEntry]:
+        """
+        List file entries of a soul.
+
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            categories: Categories to include
+
+        Returns:
+            Entries ordered by category and filename, with the number of
+            the owner's entries in the same category sharing their content hash
+        """
+        categories = list(categories)
+        placeholders = ", ".join("?" for _ in categories)
+        rows = self._connect().execute(
+            f"SELECT f.*, {_REFERENCES_SQL} "
+            f"FROM files f WHERE f.owner_id = ? AND f.soul_id = ? AND f.category IN ({placeholders}) "
+            "ORDER BY f.category, f.filename",
+            (owner_id, soul_id, *categories)
+        ).fetchall()
+        return [CatalogEntry(*row[:-1], references=max(1, row[-1])) for row in rows]
+
+    def list_page(
+        self,
+        owner_id: str,
+        soul_id: str,
+        categories: Iterable[str],
+        sort: str = "name",
+        descending: bool = False,
+        after: Optional[Sequence[Any]] = None,
+        limit: Optional[int] = 100
+    ) -> List[CatalogEntry]:
+        """
+        List one page of a soul's entries using keyset pagination.
+
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            categories: Categories to include
+            sort: Sort order, one of SORT_KEYS
+            descending: Reverse the sort order
+            after: Sort key of the last entry of the previous page
+            limit: Maximum number of entries (None for all)
+
+        Returns:
+            Entries in sort order, with reference counts as in list_files
+        """
+        categories = list(categories)
+        columns = SORT_KEYS[sort]
+        direction = "DESC" if descending else "ASC"
+        placeholders = ", ".join("?" for _ in categories)
+
+        query = (
+            f"SELECT f.*, {_REFERENCES_SQL} FROM files f "
+            f"WHERE f.owner_id = ? AND f.soul_id = ? AND f.category IN ({placeholders})"
+        )
+        params: List[Any] = [owner_id, soul_id, *categories]
+
+        if after is not None:
+            key = ", ".join(f"f.{column}" for column in columns)
+            marks = ", ".join("?" for _ in columns)
+            query += f" AND ({key}) {'<' if descending else '>'} ({marks})"
+            params.extend(after)
+
+        query += " ORDER BY " + ", ".join(f"f.{column} {direction}" for column in columns)
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        rows = self._connect().execute(query, params).fetchall()
+        return [CatalogEntry(*row[:-1], references=max(1, row[-1])) for row in rows]
+
+    def get_category_stats(self, owner_id: str, soul_id: str) -> Dict[str, Dict[str, int]]:
+        """
+        Get file count, logical and physical size per category for a soul.
+
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+
+        Returns:
+            Mapping of category to {"count", "total_size", "physical_size",
+            "derived_size"}
+        """
+        rows = self._connect().execute(
+            "SELECT category, COUNT(*), COALESCE(SUM(size), 0), "
+            "COALESCE(SUM(COALESCE(physical_size, size)), 0), COALESCE(SUM(derived_size), 0) "
+            "FROM files WHERE owner_id = ? AND soul_id = ? GROUP BY category",
+            (owner_id, soul_id)
+        ).fetchall()
+        return {
+            category: {
+                "count": count,
+                "total_size": total,
+                "physical_size": physical,
+                "derived_size": derived,
+            }
+            for category, count, total, physical, derived in rows
+        }
+
+    def is_empty(self) -> bool:
+        """Check whether the catalog has no entries (new or never filled)."""
+        return self._connect().execute("SELECT 1 FROM files LIMIT 1").fetchone() is None
+
+    def get_owner_usage(self, owner_id: str) -> int:
+        """
+        Get the total logical bytes stored by an owner, derived sidecars included.
+
+        Args:
+            owner_id: Owner identifier
+
+        Returns:
+            Total size in bytes
+        """
+        row = self._connect().execute(
+            "SELECT COALESCE(SUM(size + derived_size), 0) FROM files WHERE owner_id = ?", (owner_id,)
+        ).fetchone()
+        return row[0]
+
+    def list_compressed(self) -> List[CatalogEntry]:
+        """
+        List all entries stored with a compression codec.
+
+        Returns:
+            Entries whose codec is set
+        """
+        rows = self._connect().execute("SELECT * FROM files WHERE codec IS NOT NULL").fetchall()
+        return [CatalogEntry(*row) for row in rows]
+
+    def replace_all(self, entries: Iterable[CatalogEntry]) -> int:
+        """
+        Replace the whole catalog in one transaction.
+
+        Args:
+            entries: Entries to store
+
+        Returns:
+            Number of entries written
+        """
+        conn = self._connect()
+        count = 0
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM files")
+            for entry in entries:
+                conn.execute(
+                    "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (entry.owner_id, entry.soul_id, entry.category, entry.filename,
+                     entry.size, entry.content_hash, entry.created_at, entry.modified_at,
+                     entry.physical_size, entry.codec, entry.derived_size)
+                )
+                count += 1
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return count
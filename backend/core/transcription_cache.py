@@ -0,0 +1,182 @@
+"""
+Content-addressed transcription result cache.
+
+Transcriptions are cached under DATA_DIR/.transcription-cache keyed by the
+audio's SHA-256, the model size and the language, so re-uploads of the
+same recording to any soul and client retries are answered without
+running the model again. Entries are JSON files; the least recently used
+ones are evicted once the cache exceeds its size budget.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from backend.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class TranscriptionCache:
+    """Size-bounded LRU cache of transcription results on disk."""
+
+    CACHE_DIRNAME = ".transcription-cache"
+
+    def __init__(self, data_dir: Path, max_bytes: int = None, enabled: bool = None):
+        """
+        Initialize transcription cache.
+
+        Args:
+            data_dir: Root data directory; entries live in data_dir/.transcription-cache
+            max_bytes: Size budget (TRANSCRIPTION_CACHE_MAX_MB)
+            enabled: Whether the cache is used at all (TRANSCRIPTION_CACHE_ENABLED)
+        """
+        self.root = Path(data_dir) / self.CACHE_DIRNAME
+        self.max_bytes = max_bytes or int(os.getenv("TRANSCRIPTION_CACHE_MAX_MB", "256")) * 1024 * 1024
+        if enabled is None:
+            enabled = os.getenv("TRANSCRIPTION_CACHE_ENABLED", "true").lower() == "true"
+        self.enabled = enabled
+
+        # key -> entry size, least recently used first; loaded on first use
+        self._entries: Optional["OrderedDict[str, int]"] = None
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(content_hash: str, model: str, language: str) -> str:
+        """
+        Build the cache key of a transcription.
+
+        Args:
+            content_hash: SHA-256 of the audio content
+            model: Whisper model size
+            language: Language code
+
+        Returns:
+            Hex key
+        """
+        return hashlib.sha256(f"{content_hash}:{model}:{language}".encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        """File holding an entry."""
+        return self.root / key[:2] / f"{key}.json"
+
+    def _load_index(self) -> "OrderedDict[str, int]":
+        """Scan the cache directory, ordering entries by last use (mtime)."""
+        if self._entries is not None:
+            return self._entries
+
+        found = []
+        if self.root.exists():
+            for path in self.root.glob("*/*.json"):
+                try:
+                    stats = path.stat()
+                except FileNotFoundError:
+                    continue
+                found.append((stats.st_mtime, path.stem, stats.st_size))
+
+        self._entries = OrderedDict((key, size) for _, key, size in sorted(found))
+        self._total_bytes = sum(self._entries.values())
+        return self._entries
+
+    def get(self, content_hash: str, model: str, language: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached transcription.
+
+        Args:
+            content_hash: SHA-256 of the audio content
+            model: Whisper model size
+            language: Language code
+
+        Returns:
+            Transcription result (text, segments, language, duration) or None
+        """
+        if not self.enabled:
+            return None
+
+        key = self.make_key(content_hash, model, language)
+        with self._lock:
+            entries = self._load_index()
+            if key not in entries:
+                self.misses += 1
+                return None
+            path = self._entry_path(key)
+            try:
+                result = json.loads(path.read_text(encoding="utf-8"))
+                # mtime records last use, so the order survives restarts
+                os.utime(path)
+            except (FileNotFoundError, ValueError):
+                self._total_bytes -= entries.pop(key)
+                self.misses += 1
+                return None
+            entries.move_to_end(key)
+            self.hits += 1
+
+        logger.info(f"Transcription cache hit for {content_hash[:12]} ({model}, {language})")
+        return result
+
+    def put(self, content_hash: str, model: str, language: str, result: Dict[str, Any]) -> None:
+        """
+        Store a transcription, evicting least recently used entries as needed.
+
+        Args:
+            content_hash: SHA-256 of the audio content
+            model: Whisper model size
+            language: Language code
+            result: Transcription result to cache
+        """
+        if not self.enabled:
+            return
+
+        key = self.make_key(content_hash, model, language)
+        payload = json.dumps({
+            "text": result["text"],
+            "segments": result["segments"],
+            "language": result.get("language", language),
+            "duration": result.get("duration"),
+            "skipped_fraction": result.get("skipped_fraction"),
+            "cached_at": time.time()
+        }, separators=(",", ":")).encode("utf-8")
+        if len(payload) > self.max_bytes:
+            return
+
+        path = self._entry_path(key)
+        with self._lock:
+            entries = self._load_index()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = path.with_suffix(".tmp")
+            temp_path.write_bytes(payload)
+            os.replace(temp_path, path)
+
+            self._total_bytes += len(payload) - entries.pop(key, 0)
+            entries[key] = len(payload)
+
+            while self._total_bytes > self.max_bytes and entries:
+                evicted, size = entries.popitem(last=False)
+                self._entry_path(evicted).unlink(missing_ok=True)
+                self._total_bytes -= size
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with entry count, size, budget, hits and misses
+        """
+        with self._lock:
+            entries = self._load_index()
+            return {
+                "enabled": self.enabled,
+                "entries": len(entries),
+                "size_bytes": self._total_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses
+            }
@@ -0,0 +1,257 @@
+"""
+Synchronous transcription engine.
+
+Runs inside transcription worker processes, so everything here is plain
+blocking code that must stay importable without the web app. A recording
+is decoded once (and kept for later runs), planned into silence-aligned
+overlapping chunks, each chunk's speech is transcribed on its own, and
+the chunk segments are stitched back together. Whisper is loaded lazily and its models are cached per process.
+"""
+
+import importlib.util
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from backend.core.audio import (
+    SAMPLE_RATE,
+    AudioChunk,
+    detect_speech,
+    frame_energy,
+    load_decoded_audio,
+    plan_chunks,
+    restrict_to_speech,
+)
+from backend.core.lazy_init import whisper_lazy
+from backend.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Loaded Whisper models of this process, by model size
+_models: Dict[str, Any] = {}
+
+
+def placeholder_transcription(file_path: str, model: str, language: str) -> Dict[str, Any]:
+    """
+    Build the placeholder result used while Whisper is not installed.
+
+    Args:
+        file_path: Path to audio file
+        model: Whisper model size
+        language: Language code
+
+    Returns:
+        Transcription result with text and segments
+    """
+    return {
+        "text": (
+            "[Phase 1 Placeholder Transcription]\n\n"
+            f"This is a placeholder transcription result for: {file_path}\n"
+            f"Model: {model}, Language: {language}\n\n"
+            "In Phase 2, this will be replaced with actual Whisper transcription."
+        ),
+        "segments": [
+            {
+                "id": 0,
+                "start": 0.0,
+                "end": 5.0,
+                "text": "Placeholder transcription segment"
+            }
+        ],
+        "language": language,
+        "duration": 5.0,
+        "skipped_fraction": 0.0
+    }
+
+
+def whisper_available() -> bool:
+    """Whether the Whisper package is installed (without importing it)."""
+    return importlib.util.find_spec("whisper") is not None
+
+
+def load_model(model: str) -> Any:
+    """
+    Load a Whisper model, reusing it for later jobs of this process.
+
+    Args:
+        model: Whisper model size
+
+    Returns:
+        Loaded Whisper model
+    """
+    if model not in _models:
+        logger.info(f"Loading Whisper model '{model}'")
+        _models[model] = whisper_lazy.load_model(model)
+    return _models[model]
+
+
+def prepare_audio(
+    file_path: str,
+    samples_path: str,
+    chunk_seconds: float,
+    overlap_seconds: float,
+    vad_min_silence: Optional[float] = None
+) -> Tuple[float, float, List[AudioChunk]]:
+    """
+    Make sure an audio file is decoded and plan its chunks.
+
+    Decoding is skipped when samples_path already holds the samples, so
+    chunk workers and repeated transcriptions share one decode. With voice
+    activity detection, chunks are limited to their speech regions; chunks
+    where none is found but that are not near-silent are kept whole.
+
+    Args:
+        file_path: Audio file
+        samples_path: Decoded samples (.npy), created if missing
+        chunk_seconds: Target chunk length
+        overlap_seconds: Audio shared between neighbouring chunks
+        vad_min_silence: Shortest pause that is skipped; None disables
+            voice activity detection
+
+    Returns:
+        Tuple of (duration in seconds, speech seconds, chunks)
+
+    Raises:
+        TranscriptionError: If the file cannot be decoded
+    """
+    samples = load_decoded_audio(Path(file_path), Path(samples_path))
+    duration = len(samples) / SAMPLE_RATE
+    chunks = plan_chunks(samples, chunk_seconds, overlap_seconds)
+    if vad_min_silence is None:
+        return duration, duration, chunks
+
+    regions = detect_speech(samples, vad_min_silence)
+    chunks = restrict_to_speech(chunks, regions, frame_energy(samples))
+    speech_seconds = sum(end - start for start, end in regions) + sum(
+        chunk.core_end - chunk.core_start for chunk in chunks if chunk.regions is None
+    )
+    return duration, speech_seconds, chunks
+
+
+def read_chunk(samples_path: str, chunk: AudioChunk) -> np.ndarray:
+    """
+    Get the samples of a chunk's speech regions, back to back.
+
+    A chunk without skipped silence is a view of the memory-mapped decoded
+    audio; otherwise its regions are concatenated.
+    """
+    samples = np.load(samples_path, mmap_mode="r")
+    parts = [
+        samples[int(start * SAMPLE_RATE):int(end * SAMPLE_RATE)]
+        for start, end in chunk.speech_regions()
+    ]
+    if len(parts) == 1:
+        return np.ascontiguousarray(parts[0], dtype=np.float32)
+    if not parts:
+        return np.zeros(0, dtype=np.float32)
+    return np.concatenate(parts).astype(np.float32, copy=False)
+
+
+def transcribe_chunk(
+    samples_path: str,
+    chunk: AudioChunk,
+    model: str,
+    language: str
+) -> List[Dict[str, Any]]:
+    """
+    Transcribe one chunk with Whisper; entry point of worker processes.
+
+    Args:
+        samples_path: Decoded samples from prepare_audio
+        chunk: Chunk to transcribe
+        model: Whisper model size
+        language: Language code
+
+    Returns:
+        Segments with timestamps relative to the whole recording
+    """
+    raw = load_model(model).transcribe(read_chunk(samples_path, chunk), language=language, verbose=None)
+    return [
+        {
+            "start": chunk.source_time(float(segment["start"])),
+            "end": chunk.source_time(float(segment["end"])),
+            "text": segment["text"].strip()
+        }
+        for segment in raw.get("segments", [])
+    ]
+
+
+def _overlapping_words(previous: List[str], current: List[str], max_words: int) -> int:
+    """Length of the longest suffix of previous that is a prefix of current."""
+    def normalize(word: str) -> str:
+        return word.strip(".,!?;:\"'").lower()
+
+    for count in range(min(max_words, len(previous), len(current)), 0, -1):
+        if [normalize(w) for w in previous[-count:]] == [normalize(w) for w in current[:count]]:
+            return count
+    return 0
+
+
+class SegmentStitcher:
+    """
+    Merge per-chunk segments into one transcript, chunk by chunk.
+
+    Segments are kept only by the chunk whose core contains their
+    midpoint, which removes most of the overlap. Words a chunk repeats
+    from the end of the previous kept segment (a sentence straddling the
+    cut) are dropped as well. Ids are renumbered. Chunks must be added in
+    order; the segments returned for a chunk are final, so they can be
+    streamed as soon as the chunk is stitched.
+    """
+
+    def __init__(self, chunk_count: int, max_overlap_words: int = 8):
+        """
+        Initialize stitcher.
+
+        Args:
+            chunk_count: Total number of chunks
+            max_overlap_words: Longest repeated word run that is removed
+        """
+        self.last_chunk = chunk_count - 1
+        self.max_overlap_words = max_overlap_words
+        self.segments: List[Dict[str, Any]] = []
+
+    def add(self, chunk: AudioChunk, segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Stitch the next chunk.
+
+        Args:
+            chunk: Chunk the segments belong to
+            segments: Its segments, with absolute timestamps
+
+        Returns:
+            The segments this chunk contributes, with id, start, end and text
+        """
+        added = []
+        first_of_chunk = True
+        for segment in segments:
+            midpoint = (segment["start"] + segment["end"]) / 2
+            inside = chunk.core_start <= midpoint < chunk.core_end or (
+                chunk.index == self.last_chunk and midpoint >= chunk.core_end
+            )
+            if not inside or not segment["text"]:
+                continue
+
+            text = segment["text"]
+            if first_of_chunk and self.segments:
+                words = text.split()
+                repeated = _overlapping_words(
+                    self.segments[-1]["text"].split(), words, self.max_overlap_words
+                )
+                text = " ".join(words[repeated:])
+            first_of_chunk = False
+            if not text:
+                continue
+
+            previous_end = self.segments[-1]["end"] if self.segments else 0.0
+            stitched = {
+                "id": len(self.segments),
+                "start": round(max(segment["start"], previous_end), 3),
+                "end": round(segment["end"], 3),
+                "text": text
+            }
+            self.segments.append(stitched)
+            added.append(stitched)
+
+        return added
@@ -0,0 +1,845 @@
+"""
+Persistent transcription job queue.
+
+Submitting a transcription records a job in a SQLite queue inside the data
+directory and returns immediately. A dispatcher task on the event loop
+hands queued jobs to the transcription runner, whose worker processes do
+the CPU-bound Whisper inference off the event loop. Progress is recorded
+in the same database as chunks complete, and cancellation takes effect at
+the next chunk boundary. Segments are appended to the staged transcript
+(plain text plus a JSONL segment file with timestamps) and published to
+live subscribers as soon as they are stitched. Results
+are cached by audio content hash, so repeated transcriptions of the same
+recording complete at submission, and decoded audio is kept next to the
+upload, so a re-run with another model skips decoding. Jobs that were
+queued or running when the server stopped are picked up again on the
+next start.
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from backend.core.async_operations import AsyncTranscriptionRunner
+from backend.core.async_storage import AsyncScopedStorage
+from backend.core.audio import decoded_audio_path
+from backend.core.exceptions import TranscriptionCancelledError, TranscriptionJobNotFoundError
+from backend.core.logging_config import get_logger
+from backend.core.scoped_storage import ScopedPathBuilder
+from backend.core.transcription_cache import TranscriptionCache
+
+logger = get_logger(__name__)
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+STATUS_CANCELLED = "cancelled"
+FINISHED_STATUSES = (STATUS_COMPLETED, STATUS_FAILED, STATUS_CANCELLED)
+
+# Transcripts are stored as plain text plus one JSON line per segment
+SEGMENTS_SUFFIX = ".jsonl"
+
+
+def segment_lines(segments: List[Dict[str, Any]]) -> str:
+    """Serialize segments as compact JSONL (id, start, end, text)."""
+    return "".join(
+        json.dumps(
+            {"id": s["id"], "start": s["start"], "end": s["end"], "text": s["text"]},
+            ensure_ascii=False, separators=(",", ":")
+        ) + "\n"
+        for s in segments
+    )
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    owner_id TEXT NOT NULL,
+    soul_id TEXT NOT NULL,
+    file_path TEXT NOT NULL,
+    model TEXT NOT NULL,
+    language TEXT NOT NULL,
+    status TEXT NOT NULL,
+    progress REAL NOT NULL DEFAULT 0,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    result TEXT,
+    transcript_path TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    content_hash TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_by_status ON jobs (status, created_at);
+CREATE INDEX IF NOT EXISTS jobs_by_soul ON jobs (owner_id, soul_id, created_at);
+"""
+
+_COLUMNS = (
+    "job_id, owner_id, soul_id, file_path, model, language, status, progress, "
+    "cancel_requested, error, result, transcript_path, created_at, started_at, finished_at, "
+    "content_hash"
+)
+
+
+@dataclass
+class TranscriptionJob:
+    """State of a transcription job."""
+    job_id: str
+    owner_id: str
+    soul_id: str
+    # Filename of the audio in the soul's uploads
+    file_path: str
+    model: str
+    language: str
+    status: str
+    progress: float
+    cancel_requested: bool
+    error: Optional[str]
+    # JSON-encoded transcription result once completed
+    result: Optional[str]
+    # Filename of the transcript in the soul's transcripts once completed
+    transcript_path: Optional[str]
+    created_at: float
+    started_at: Optional[float]
+    finished_at: Optional[float]
+    # SHA-256 of the audio, the transcription cache key
+    content_hash: Optional[str] = None
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job reached a final state."""
+        return self.status in FINISHED_STATUSES
+
+    def result_data(self) -> Optional[Dict[str, Any]]:
+        """Decoded transcription result, or None until completed."""
+        return json.loads(self.result) if self.result else None
+
+
+class TranscriptionJobStore:
+    """Transcription jobs table backed by SQLite in WAL mode."""
+
+    DB_FILENAME = ".transcription-jobs.db"
+
+    def __init__(self, data_dir: Path):
+        """
+        Initialize job store.
+
+        Args:
+            data_dir: Root data directory; the database lives inside it
+        """
+        self.db_path = Path(data_dir) / self.DB_FILENAME
+        self._local = threading.local()
+        self._initialized = False
+        self._init_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's connection, creating the schema on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+
+        with self._init_lock:
+            if not self._initialized:
+                conn.executescript(_SCHEMA)
+                self._migrate(conn)
+                self._initialized = True
+
+        self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection) -> None:
+        """Add columns introduced after a job table was created."""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+        if "content_hash" not in columns:
+            conn.execute("ALTER TABLE jobs ADD COLUMN content_hash TEXT")
+
+    @staticmethod
+    def _job(row: Optional[tuple]) -> Optional[TranscriptionJob]:
+        """Build a job from a row."""
+        if row is None:
+            return None
+        job = TranscriptionJob(*row)
+        job.cancel_requested = bool(job.cancel_requested)
+        # Jobs created by earlier versions stored absolute paths, which
+        # break once the owner moves to the sharded layout
+        job.file_path = Path(job.file_path).name
+        if job.transcript_path is not None:
+            job.transcript_path = Path(job.transcript_path).name
+        return job
+
+    def create(
+        self,
+        owner_id: str,
+        soul_id: str,
+        file_path: str,
+        model: str,
+        language: str,
+        content_hash: Optional[str] = None,
+        status: str = STATUS_QUEUED
+    ) -> TranscriptionJob:
+        """
+        Enqueue a new job.
+
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            file_path: Filename of the audio in the soul's uploads
+            model: Whisper model size
+            language: Language code
+            content_hash: SHA-256 of the audio, if known
+            status: Initial status (running for jobs the caller completes itself)
+
+        Returns:
+            The new job
+        """
+        job = TranscriptionJob(
+            job_id=uuid.uuid4().hex,
+            owner_id=owner_id,
+            soul_id=soul_id,
+            file_path=file_path,
+            model=model,
+            language=language,
+            status=status,
+            progress=0.0,
+            cancel_requested=False,
+            error=None,
+            result=None,
+            transcript_path=None,
+            created_at=time.time(),
+            started_at=None,
+            finished_at=None,
+            content_hash=content_hash
+        )
+        self._connect().execute(
+            f"INSERT INTO jobs ({_COLUMNS}) VALUES ({', '.join('?' for _ in range(16))})",
+            (job.job_id, owner_id, soul_id, file_path, model, language, job.status,
+             job.progress, 0, None, None, None, job.created_at, None, None, content_hash)
+        )
+        return job
+
+    def get(self, job_id: str) -> Optional[TranscriptionJob]:
+        """
+        Look up a job.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            TranscriptionJob or None
+        """
+        row = self._connect().execute(
+            f"SELECT {_COLUMNS} FROM jobs WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        return self._job(row)
+
+    def list_soul_jobs(self, owner_id: str, soul_id: str, limit: int = 50) -> List[TranscriptionJob]:
+        """
+        List a soul's most recent jobs.
+
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            limit: Maximum number of jobs
+
+        Returns:
+            Jobs, newest first
+        """
+        rows = self._connect().execute(
+            f"SELECT {_COLUMNS} FROM jobs WHERE owner_id = ? AND soul_id = ? "
+            "ORDER BY created_at DESC LIMIT ?",
+            (owner_id, soul_id, limit)
+        ).fetchall()
+        return [self._job(row) for row in rows]
+
+    def claim_next(self) -> Optional[TranscriptionJob]:
+        """
+        Atomically move the oldest queued job to running.
+
+        Returns:
+            The claimed job, or None if the queue is empty
+        """
+        row = self._connect().execute(
+            "UPDATE jobs SET status = ?, started_at = ? WHERE job_id = ("
+            "SELECT job_id FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1"
+            f") RETURNING {_COLUMNS}",
+            (STATUS_RUNNING, time.time(), STATUS_QUEUED)
+        ).fetchone()
+        return self._job(row)
+
+    def set_progress(self, job_id: str, progress: float) -> bool:
+        """
+        Record progress of a running job.
+
+        Args:
+            job_id: Job identifier
+            progress: Completed fraction (0.0-1.0)
+
+        Returns:
+            True if the job was cancelled or removed
+        """
+        row = self._connect().execute(
+            "UPDATE jobs SET progress = ? WHERE job_id = ? RETURNING cancel_requested",
+            (max(0.0, min(1.0, progress)), job_id)
+        ).fetchone()
+        return row is None or bool(row[0])
+
+    def request_cancel(self, job_id: str) -> Optional[TranscriptionJob]:
+        """
+        Cancel a job.
+
+        Queued jobs are cancelled immediately; running jobs are flagged and
+        stop at their next progress report. Finished jobs are left as-is.
+
+        Args:
+            job_id: Job identifier
+
+        Returns:
+            The updated job, or None if it does not exist
+        """
+        conn = self._connect()
+        conn.execute(
+            "UPDATE jobs SET status = ?, finished_at = ? WHERE job_id = ? AND status = ?",
+            (STATUS_CANCELLED, time.time(), job_id, STATUS_QUEUED)
+        )
+        conn.execute(
+            "UPDATE jobs SET cancel_requested = 1 WHERE job_id = ? AND status = ?",
+            (job_id, STATUS_RUNNING)
+        )
+        return self.get(job_id)
+
+    def finish(
+        self,
+        job_id: str,
+        status: str,
+        error: Optional[str] = None,
+        result: Optional[Dict[str, Any]] = None,
+        transcript_path: Optional[str] = None
+    ) -> None:
+        """
+        Move a running job to a final state.
+
+        Args:
+            job_id: Job identifier
+            status: completed, failed or cancelled
+            error: Failure message
+            result: Transcription result
+            transcript_path: Filename of the stored transcript
+        """
+        self._connect().execute(
+            "UPDATE jobs SET status = ?, error = ?, result = ?, transcript_path = ?, "
+            "progress = CASE WHEN ? = ? THEN 1.0 ELSE progress END, finished_at = ? "
+            "WHERE job_id = ?",
+            (status, error, json.dumps(result) if result is not None else None, transcript_path,
+             status, STATUS_COMPLETED, time.time(), job_id)
+        )
+
+    def requeue_interrupted(self) -> int:
+        """
+        Requeue jobs left running by a previous process.
+
+        Jobs whose cancellation had been requested are cancelled instead.
+
+        Returns:
+            Number of requeued jobs
+        """
+        conn = self._connect()
+        conn.execute(
+            "UPDATE jobs SET status = ?, finished_at = ? WHERE status = ? AND cancel_requested = 1",
+            (STATUS_CANCELLED, time.time(), STATUS_RUNNING)
+        )
+        cursor = conn.execute(
+            "UPDATE jobs SET status = ?, progress = 0, started_at = NULL WHERE status = ?",
+            (STATUS_QUEUED, STATUS_RUNNING)
+        )
+        return cursor.rowcount
+
+    def remove(self, owner_id: str, soul_id: Optional[str] = None) -> int:
+        """
+        Remove the jobs of a soul, or of every soul of an owner.
+
+        Workers of running jobs stop at their next progress report.
+
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier (None for the whole owner)
+
+        Returns:
+            Number of removed jobs
+        """
+        if soul_id is None:
+            cursor = self._connect().execute("DELETE FROM jobs WHERE owner_id = ?", (owner_id,))
+        else:
+            cursor = self._connect().execute(
+                "DELETE FROM jobs WHERE owner_id = ? AND soul_id = ?", (owner_id, soul_id)
+            )
+        return cursor.rowcount
+
+
+def job_summary(job: TranscriptionJob) -> Dict[str, Any]:
+    """
+    Summary of a finished job for its final stream event.
+
+    Args:
+        job: Finished job
+
+    Returns:
+        Dictionary with status, transcript path, error and result totals
+    """
+    result = job.result_data() or {}
+    return {
+        "job_id": job.job_id,
+        "status": job.status,
+        "text_path": job.transcript_path,
+        "error": job.error,
+        "segments": len(result.get("segments", [])),
+        "duration": result.get("duration"),
+        "language": result.get("language"),
+    }
+
+
+class JobStream:
+    """Segments produced so far by a running job, and its live subscribers."""
+
+    def __init__(self):
+        self.segments: List[Dict[str, Any]] = []
+        self._subscribers: Set[asyncio.Queue] = set()
+
+    def subscribe(self) -> asyncio.Queue:
+        """Register a subscriber queue of (event, data) tuples."""
+        events: asyncio.Queue = asyncio.Queue()
+        self._subscribers.add(events)
+        return events
+
+    def unsubscribe(self, events: asyncio.Queue) -> None:
+        """Remove a subscriber queue."""
+        self._subscribers.discard(events)
+
+    def publish(self, event: str, data: Dict[str, Any]) -> None:
+        """Deliver an event to every subscriber."""
+        if event == "segment":
+            self.segments.append(data)
+        for events in self._subscribers:
+            events.put_nowait((event, data))
+
+
+class TranscriptionJobQueue:
+    """Dispatch persisted transcription jobs to the transcription runner."""
+
+    def __init__(
+        self,
+        storage: AsyncScopedStorage,
+        runner: AsyncTranscriptionRunner,
+        cache: Optional[TranscriptionCache] = None,
+        poll_interval: float = 5.0
+    ):
+        """
+        Initialize transcription job queue.
+
+        Args:
+            storage: Async scoped storage that transcripts are written to
+            runner: Runner whose worker processes execute the jobs
+            cache: Transcription result cache (default: inside the data directory)
+            poll_interval: Seconds between queue checks when idle
+        """
+        self.storage = storage
+        self.runner = runner
+        self.cache = cache or TranscriptionCache(storage.data_dir)
+        self.store = TranscriptionJobStore(storage.data_dir)
+        # Enough concurrent jobs to keep every worker busy with short files
+        self.max_running = runner.workers
+        self.poll_interval = poll_interval
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._running: Set[asyncio.Task] = set()
+        # Live event streams of running (or watched queued) jobs
+        self._streams: Dict[str, JobStream] = {}
+
+    def _notify(self) -> None:
+        """Wake the dispatcher."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def audio_path(self, job: TranscriptionJob) -> Path:
+        """
+        Resolve a job's audio file in the soul's uploads.
+
+        Jobs store only the filename, so queued jobs keep working when
+        their owner is moved to another layout.
+
+        Args:
+            job: Transcription job
+
+        Returns:
+            Current path of the audio file
+        """
+        return self.storage.path_builder.get_category_path(
+            job.owner_id, job.soul_id, ScopedPathBuilder.CATEGORY_UPLOADS
+        ) / job.file_path
+
+    @staticmethod
+    def _transcript_filename(file_path: str) -> str:
+        """Name of the transcript of an audio file in the soul's transcripts."""
+        return Path(file_path).stem + "_transcript.txt"
+
+    @staticmethod
+    def _segments_filename(file_path: str) -> str:
+        """Name of the segment file (JSONL) stored next to the transcript."""
+        return Path(file_path).stem + "_transcript" + SEGMENTS_SUFFIX
+
+    async def submit(
+        self,
+        owner_id: str,
+        soul_id: str,
+        file_path: str,
+        model: str,
+        language: str,
+        content_hash: Optional[str] = None
+    ) -> TranscriptionJob:
+        """
+        Enqueue a transcription.
+
+        If the same audio was already transcribed with this model and
+        language, the cached result is written to the soul's transcripts
+        and the job is returned already completed.
+
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            file_path: Filename of the audio in the soul's uploads
+            model: Whisper model size
+            language: Language code
+            content_hash: SHA-256 of the audio (enables the result cache)
+
+        Returns:
+            The queued or completed job
+        """
+        cached = None
+        if content_hash and self.runner.available:
+            cached = await self.storage.run(self.cache.get, content_hash, model, language)
+        if cached is not None:
+            writes = []
+            try:
+                for filename, text in (
+                    (self._transcript_filename(file_path), cached["text"]),
+                    (self._segments_filename(file_path), segment_lines(cached["segments"]))
+                ):
+                    staged = await self.storage.run(
+                        self.storage.storage.begin_write,
+                        owner_id, soul_id, filename, ScopedPathBuilder.CATEGORY_TRANSCRIPTS
+                    )
+                    writes.append(staged)
+                    await self.storage.run(staged.write, text.encode("utf-8"))
+                # The transcript and its segments are replaced together or not at all
+                transcript_info, _ = await self.storage.run(self.storage.storage.commit_all, writes)
+            except Exception as e:
+                for staged in writes:
+                    await self.storage.run(staged.abort)
+                # Fall back to transcribing
+                logger.error(f"Failed to serve cached transcription of {file_path}: {e}")
+            else:
+                # Created as running so the dispatcher never claims it
+                job = await self.storage.run(
+                    self.store.create, owner_id, soul_id, file_path, model, language,
+                    content_hash, STATUS_RUNNING
+                )
+                await self.storage.run(
+                    self.store.finish, job.job_id, STATUS_COMPLETED,
+                    None, cached, transcript_info.filename
+                )
+                logger.info(f"Served transcription job {job.job_id} from cache: {transcript_info.path}")
+                return await self.storage.run(self.store.get, job.job_id)
+
+        job = await self.storage.run(
+            self.store.create, owner_id, soul_id, file_path, model, language, content_hash
+        )
+        logger.info(f"Queued transcription job {job.job_id} for {owner_id}/{soul_id}: {file_path}")
+        self._notify()
+        return job
+
+    async def get_job(self, owner_id: str, soul_id: str, job_id: str) -> TranscriptionJob:
+        """
+        Get a job of a soul.
+
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            job_id: Job identifier
+
+        Returns:
+            The job
+
+        Raises:
+            TranscriptionJobNotFoundError: If the soul has no such job
+        """
+        job = await self.storage.run(self.store.get, job_id)
+        if job is None or job.owner_id != owner_id or job.soul_id != soul_id:
+            raise TranscriptionJobNotFoundError(f"Transcription job {job_id} not found")
+        return job
+
+    async def list_jobs(self, owner_id: str, soul_id: str, limit: int = 50) -> List[TranscriptionJob]:
+        """List a soul's most recent jobs, newest first."""
+        return await self.storage.run(self.store.list_soul_jobs, owner_id, soul_id, limit)
+
+    async def cancel(self, owner_id: str, soul_id: str, job_id: str) -> TranscriptionJob:
+        """
+        Cancel a job of a soul.
+
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            job_id: Job identifier
+
+        Returns:
+            The job; running jobs keep their status until the worker stops
+
+        Raises:
+            TranscriptionJobNotFoundError: If the soul has no such job
+        """
+        await self.get_job(owner_id, soul_id, job_id)
+        job = await self.storage.run(self.store.request_cancel, job_id)
+        logger.info(f"Cancellation requested for transcription job {job_id} ({job.status})")
+
+        # Queued jobs are final now; tell anyone already watching them
+        stream = self._streams.pop(job_id, None) if job.finished else None
+        if stream is not None:
+            stream.publish("done", job_summary(job))
+        return job
+
+    async def forget(self, owner_id: str, soul_id: Optional[str] = None) -> int:
+        """
+        Cancel and remove the jobs of deleted data.
+
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier (None for the whole owner)
+
+        Returns:
+            Number of removed jobs
+        """
+        return await self.storage.run(self.store.remove, owner_id, soul_id)
+
+    async def _finish(self, job: TranscriptionJob, status: str, *args) -> None:
+        """Record a job's final state and close its event stream."""
+        await self.storage.run(self.store.finish, job.job_id, status, *args)
+        finished = await self.storage.run(self.store.get, job.job_id)
+        stream = self._streams.pop(job.job_id, None)
+        if stream is not None and finished is not None:
+            stream.publish("done", job_summary(finished))
+
+    async def _record_decoded_audio(self, job: TranscriptionJob, samples_path: Path) -> None:
+        """Charge the decoded samples of a job's audio to the upload's owner."""
+        try:
+            await self.storage.run(
+                self.storage.storage.record_derived_file,
+                job.owner_id, job.soul_id, ScopedPathBuilder.CATEGORY_UPLOADS,
+                job.file_path, job.content_hash, samples_path
+            )
+        except (OSError, sqlite3.Error) as e:
+            logger.error(f"Failed to record decoded audio of job {job.job_id}: {e}")
+
+    async def _execute(self, job: TranscriptionJob) -> None:
+        """Run a claimed job in the pool and record its outcome."""
+        stream = self._streams.setdefault(job.job_id, JobStream())
+        writes = []
+
+        async def report(fraction: float) -> None:
+            if await self.storage.run(self.store.set_progress, job.job_id, fraction):
+                raise TranscriptionCancelledError(f"Transcription job {job.job_id} was cancelled")
+            stream.publish("progress", {"status": STATUS_RUNNING, "progress": fraction})
+
+        async def begin_writes() -> None:
+            for filename in (
+                self._transcript_filename(job.file_path),
+                self._segments_filename(job.file_path)
+            ):
+                writes.append(await self.storage.run(
+                    self.storage.storage.begin_write,
+                    job.owner_id, job.soul_id, filename, ScopedPathBuilder.CATEGORY_TRANSCRIPTS
+                ))
+
+        async def write_segments(segments: List[Dict[str, Any]]) -> None:
+            if not writes:
+                await begin_writes()
+            transcript, segment_file = writes
+            text = " ".join(segment["text"] for segment in segments)
+            if transcript.size:
+                text = " " + text
+            await self.storage.run(transcript.write, text.encode("utf-8"))
+            await self.storage.run(segment_file.write, segment_lines(segments).encode("utf-8"))
+            for segment in segments:
+                stream.publish("segment", segment)
+
+        async def abort_writes() -> None:
+            for staged in writes:
+                await self.storage.run(staged.abort)
+
+        audio_path = await self.storage.run(self.audio_path, job)
+        samples_path = decoded_audio_path(audio_path, job.content_hash)
+        try:
+            try:
+                result = await self.runner.transcribe(
+                    str(audio_path), job.model, job.language,
+                    progress=report, on_segments=write_segments,
+                    samples_path=str(samples_path)
+                )
+            finally:
+                await self._record_decoded_audio(job, samples_path)
+            current = await self.storage.run(self.store.get, job.job_id)
+            if current is None or current.cancel_requested:
+                # Cancelled late, or soul or owner deleted while the job ran
+                raise TranscriptionCancelledError(f"Transcription job {job.job_id} was cancelled")
+            if not writes:
+                # Nothing was said: store an empty transcript
+                await begin_writes()
+            # The transcript and its segments are replaced together or not at all
+            transcript_info, _ = await self.storage.run(self.storage.storage.commit_all, writes)
+        except TranscriptionCancelledError:
+            await abort_writes()
+            # No-op if the job was removed along with its soul
+            await self._finish(job, STATUS_CANCELLED)
+            logger.info(f"Cancelled transcription job {job.job_id}")
+            return
+        except Exception as e:
+            await abort_writes()
+            logger.error(f"Transcription job {job.job_id} failed: {e}")
+            await self._finish(job, STATUS_FAILED, str(e))
+            return
+        except BaseException:
+            # Task cancelled by stop(): the job is requeued on the next start,
+            # so only the staged files are discarded, without awaiting
+            for staged in writes:
+                staged.abort()
+            raise
+
+        await self._finish(job, STATUS_COMPLETED, None, result, transcript_info.filename)
+        if job.content_hash and self.runner.available:
+            try:
+                await self.storage.run(self.cache.put, job.content_hash, job.model, job.language, result)
+            except OSError as e:
+                logger.error(f"Failed to cache transcription of job {job.job_id}: {e}")
+        logger.info(f"Completed transcription job {job.job_id}: {transcript_info.path}")
+
+    async def stream_events(
+        self,
+        owner_id: str,
+        soul_id: str,
+        job_id: str,
+        keepalive_seconds: float = 15.0
+    ) -> AsyncIterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Follow a job's events.
+
+        Segments already produced are replayed first, so subscribers may
+        connect at any time, including after the job finished. The stream
+        ends with a done event carrying the job summary.
+
+        Args:
+            owner_id: Owner identifier
+            soul_id: Soul identifier
+            job_id: Job identifier
+            keepalive_seconds: Idle time after which a keepalive event is sent
+
+        Yields:
+            (event, data) tuples: progress, segment, keepalive (no data) and done
+
+        Raises:
+            TranscriptionJobNotFoundError: If the soul has no such job
+        """
+        job = await self.get_job(owner_id, soul_id, job_id)
+        if job.finished:
+            for segment in (job.result_data() or {}).get("segments", []):
+                yield "segment", segment
+            yield "done", job_summary(job)
+            return
+
+        # No awaits between snapshot and subscribe: nothing can be missed
+        stream = self._streams.setdefault(job_id, JobStream())
+        replay = list(stream.segments)
+        events = stream.subscribe()
+        try:
+            yield "progress", {"status": job.status, "progress": job.progress}
+            for segment in replay:
+                yield "segment", segment
+
+            while True:
+                try:
+                    event, data = await asyncio.wait_for(events.get(), keepalive_seconds)
+                except asyncio.TimeoutError:
+                    # Jobs cancelled while queued or removed never publish done
+                    current = await self.storage.run(self.store.get, job_id)
+                    if current is None or current.finished:
+                        if current is not None:
+                            yield "done", job_summary(current)
+                        self._streams.pop(job_id, None)
+                        return
+                    yield "keepalive", None
+                    continue
+
+                yield event, data
+                if event == "done":
+                    return
+        finally:
+            stream.unsubscribe(events)
+
+    async def _dispatch_loop(self) -> None:
+        """Keep up to max_running jobs running."""
+        while True:
+            self._wakeup.clear()
+            try:
+                while len(self._running) < self.max_running:
+                    job = await self.storage.run(self.store.claim_next)
+                    if job is None:
+                        break
+                    task = asyncio.get_running_loop().create_task(self._execute(job))
+                    self._running.add(task)
+                    task.add_done_callback(self._job_done)
+            except Exception as e:
+                logger.error(f"Transcription dispatch failed: {e}")
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def _job_done(self, task: asyncio.Task) -> None:
+        """Free a worker slot."""
+        self._running.discard(task)
+        self._notify()
+
+    async def start(self) -> None:
+        """Requeue interrupted jobs and start dispatching on the running loop."""
+        if self._dispatcher is not None:
+            return
+        requeued = await self.storage.run(self.store.requeue_interrupted)
+        if requeued:
+            logger.info(f"Requeued {requeued} interrupted transcription jobs")
+        self._wakeup = asyncio.Event()
+        self._dispatcher = asyncio.get_running_loop().create_task(self._dispatch_loop())
+
+    async def stop(self) -> None:
+        """
+        Stop dispatching.
+
+        Jobs still running stay marked as running and are requeued by the
+        next start(); the runner's pool is shut down by its owner.
+        """
+        if self._dispatcher is None:
+            return
+        self._dispatcher.cancel()
+        for task in list(self._running):
+            task.cancel()
+        await asyncio.gather(self._dispatcher, *self._running, return_exceptions=True)
+        self._dispatcher = None
+        self._running.clear()
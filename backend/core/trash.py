@@ -0,0 +1,203 @@
+"""
+Deferred deletion for scoped storage.
+
+Deleting a soul or owner renames its directory into DATA_DIR/.trash, which
+is atomic and instant regardless of how many files it holds. A background
+thread then removes the trashed trees in throttled batches so reclamation
+does not saturate the disk. Anything left in the trash (for example after a
+crash) is reclaimed again on the next start.
+
+A trashed directory may carry a list of references (for scoped storage,
+the keys of the blobs its uploads link to). They are written into the directory
+before it is renamed, so they travel with it atomically, and are passed to
+on_reclaimed once the tree is gone so only those references need checking.
+"""
+
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional
+
+from backend.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class TrashBin:
+    """Rename-then-reclaim deletion area inside the data directory."""
+
+    TRASH_DIRNAME = ".trash"
+    REFERENCES_FILENAME = ".trash-references"
+
+    def __init__(
+        self,
+        data_dir: Path,
+        on_reclaimed: Optional[Callable[[Optional[List[str]]], object]] = None,
+        batch_size: int = None,
+        pause_seconds: float = None
+    ):
+        """
+        Initialize trash bin.
+
+        Args:
+            data_dir: Root data directory; trash lives in data_dir/.trash
+            on_reclaimed: Called after each trashed tree has been removed, with
+                the references it was trashed with (None if unknown)
+            batch_size: Filesystem entries removed between pauses
+            pause_seconds: Pause between batches (I/O throttling)
+        """
+        self.root = Path(data_dir) / self.TRASH_DIRNAME
+        self.on_reclaimed = on_reclaimed
+        self.batch_size = batch_size or int(os.getenv("TRASH_RECLAIM_BATCH_SIZE", "500"))
+        self.pause_seconds = pause_seconds if pause_seconds is not None else float(
+            os.getenv("TRASH_RECLAIM_PAUSE_SECONDS", "0.05")
+        )
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+
+    def move(self, path: Path, references: Optional[Iterable[str]] = None) -> Path:
+        """
+        Atomically move a file or directory into the trash.
+
+        Args:
+            path: Path inside the data directory
+            references: References held by a directory's contents
+
+        Returns:
+            Location of the trashed entry
+        """
+        if references is not None and path.is_dir():
+            (path / self.REFERENCES_FILENAME).write_text(
+                "".join(f"{reference}\n" for reference in references), encoding="utf-8"
+            )
+        self.root.mkdir(parents=True, exist_ok=True)
+        trashed = self.root / f"{uuid.uuid4().hex}-{path.name}"
+        os.rename(path, trashed)
+        logger.debug(f"Moved {path} to trash as {trashed.name}")
+        return trashed
+
+    def pending(self) -> int:
+        """Number of trashed entries waiting to be reclaimed."""
+        if not self.root.exists():
+            return 0
+        with os.scandir(self.root) as entries:
+            return sum(1 for _ in entries)
+
+    def _read_references(self, path: Path) -> Optional[List[str]]:
+        """References a trashed directory was moved with, or None if unknown."""
+        try:
+            text = (path / self.REFERENCES_FILENAME).read_text(encoding="utf-8")
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        return [line for line in text.splitlines() if line]
+
+    def _remove_tree(self, path: Path) -> int:
+        """
+        Remove a trashed tree bottom-up in throttled batches.
+
+        Args:
+            path: Trashed file or directory
+
+        Returns:
+            Number of filesystem entries removed
+        """
+        if not path.is_dir() or path.is_symlink():
+            path.unlink(missing_ok=True)
+            return 1
+
+        removed = 0
+        for dirpath, dirnames, filenames in os.walk(path, topdown=False):
+            for name in filenames:
+                try:
+                    os.unlink(os.path.join(dirpath, name))
+                except FileNotFoundError:
+                    pass
+                removed += 1
+                if removed % self.batch_size == 0:
+                    if self._stopping.is_set():
+                        return removed
+                    time.sleep(self.pause_seconds)
+            for name in dirnames:
+                dir_path = os.path.join(dirpath, name)
+                if os.path.islink(dir_path):
+                    os.unlink(dir_path)
+                else:
+                    os.rmdir(dir_path)
+                removed += 1
+        os.rmdir(path)
+        return removed + 1
+
+    def reclaim(self) -> int:
+        """
+        Remove everything currently in the trash.
+
+        Returns:
+            Number of filesystem entries removed
+        """
+        if not self.root.exists():
+            return 0
+
+        total = 0
+        for trashed in sorted(self.root.iterdir()):
+            if self._stopping.is_set():
+                break
+            try:
+                references = self._read_references(trashed)
+                total += self._remove_tree(trashed)
+            except OSError as e:
+                logger.error(f"Failed to reclaim {trashed.name}: {e}")
+                continue
+            if trashed.exists():
+                # Stopped mid-tree; the rest is reclaimed on the next run
+                break
+            if self.on_reclaimed is not None:
+                self.on_reclaimed(references)
+            logger.info(f"Reclaimed trashed entry {trashed.name}")
+
+        return total
+
+    def _run(self) -> None:
+        """Reclamation thread: reclaim whenever new trash is scheduled."""
+        while not self._stopping.is_set():
+            self._wakeup.wait()
+            self._wakeup.clear()
+            if self._stopping.is_set():
+                break
+            try:
+                self.reclaim()
+            except Exception as e:
+                logger.error(f"Trash reclamation failed: {e}")
+
+    def schedule(self) -> None:
+        """Wake the reclamation thread, starting it if needed."""
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stopping.clear()
+                self._thread = threading.Thread(
+                    target=self._run, name="trash-reclaimer", daemon=True
+                )
+                self._thread.start()
+        self._wakeup.set()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        Stop the reclamation thread.
+
+        Unfinished work stays in the trash and is reclaimed after the next
+        schedule() (the app schedules on startup).
+
+        Args:
+            timeout: Seconds to wait for the current batch to finish
+        """
+        with self._thread_lock:
+            thread = self._thread
+            self._thread = None
+        if thread is None:
+            return
+        self._stopping.set()
+        self._wakeup.set()
+        thread.join(timeout)
@@ -0,0 +1,242 @@
+"""
+Vector index implementations for RAG retrieval.
+All vectors are expected to be L2-normalized float32, so inner product
+equals cosine similarity.
+"""
+
+from pathlib import Path
+from typing import Dict, Tuple, Type
+
+import numpy as np
+
+from backend.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """
+    L2-normalize each row of a matrix.
+
+    Args:
+        vectors: 2D array of vectors
+
+    Returns:
+        float32 array with unit-length rows (zero rows stay zero)
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def top_k_indices(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """
+    Get indices of the top_k highest scores in descending order.
+
+    Args:
+        scores: 1D array of scores
+        top_k: Number of indices to return
+
+    Returns:
+        Array of indices into scores
+    """
+    if top_k >= len(scores):
+        return np.argsort(-scores)
+
+    candidates = np.argpartition(-scores, top_k)[:top_k]
+    return candidates[np.argsort(-scores[candidates])]
+
+
+class FlatIndex:
+    """Exact inner-product search over all vectors."""
+
+    INDEX_TYPE = "flat"
+    VECTORS_FILENAME = "vectors.npy"
+
+    def __init__(self):
+        """Initialize an empty flat index."""
+        self.vectors = np.zeros((0, 0), dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self.vectors)
+
+    def build(self, vectors: np.ndarray) -> None:
+        """
+        Build the index from vectors.
+
+        Args:
+            vectors: 2D array of normalized vectors, one row per chunk
+        """
+        self.vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+
+    def search(self, query_vector: np.ndarray, top_k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Search for the vectors most similar to a query.
+
+        Args:
+            query_vector: Normalized 1D query vector
+            top_k: Number of results
+
+        Returns:
+            Tuple of (row ids, scores) in descending score order
+        """
+        if len(self.vectors) == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+
+        scores = self.vectors @ query_vector
+        ids = top_k_indices(scores, top_k)
+        return ids, scores[ids]
+
+    def save(self, index_path: Path) -> None:
+        """
+        Save the index to a directory.
+
+        Args:
+            index_path: Index directory
+        """
+        np.save(index_path / self.VECTORS_FILENAME, self.vectors)
+
+    def load(self, index_path: Path) -> None:
+        """
+        Load the index from a directory.
+
+        Args:
+            index_path: Index directory
+        """
+        self.vectors = np.load(index_path / self.VECTORS_FILENAME)
+
+
+class IVFIndex(FlatIndex):
+    """
+    Approximate search with an inverted file over k-means clusters.
+
+    Vectors are grouped by their nearest centroid; a query only scans the
+    lists of its nprobe nearest centroids.
+    """
+
+    INDEX_TYPE = "ivf"
+    IVF_FILENAME = "ivf.npz"
+
+    def __init__(self, nprobe: int = 8, kmeans_iterations: int = 10, seed: int = 0):
+        """
+        Initialize an empty IVF index.
+
+        Args:
+            nprobe: Number of clusters scanned per query
+            kmeans_iterations: Number of k-means refinement passes
+            seed: Seed for centroid initialization
+        """
+        super().__init__()
+        self.nprobe = nprobe
+        self.kmeans_iterations = kmeans_iterations
+        self.seed = seed
+        self.centroids = np.zeros((0, 0), dtype=np.float32)
+        self.order = np.zeros(0, dtype=np.int64)
+        self.offsets = np.zeros(1, dtype=np.int64)
+
+    def build(self, vectors: np.ndarray) -> None:
+        """
+        Build the index, clustering vectors with spherical k-means.
+
+        Args:
+            vectors: 2D array of normalized vectors, one row per chunk
+        """
+        super().build(vectors)
+        count = len(self.vectors)
+        if count == 0:
+            return
+
+        nlist = max(1, int(np.sqrt(count)))
+        rng = np.random.default_rng(self.seed)
+        centroids = self.vectors[rng.choice(count, size=nlist, replace=False)]
+
+        for _ in range(self.kmeans_iterations):
+            assignments = np.argmax(self.vectors @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignments, self.vectors)
+            empty = ~np.any(sums, axis=1)
+            sums[empty] = centroids[empty]
+            centroids = normalize_rows(sums)
+
+        assignments = np.argmax(self.vectors @ centroids.T, axis=1)
+        self.centroids = centroids
+        self.order = np.argsort(assignments, kind="stable")
+        self.offsets = np.concatenate(
+            ([0], np.cumsum(np.bincount(assignments, minlength=nlist)))
+        ).astype(np.int64)
+
+    def search(self, query_vector: np.ndarray, top_k: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Search the nprobe nearest clusters for similar vectors.
+
+        Args:
+            query_vector: Normalized 1D query vector
+            top_k: Number of results
+
+        Returns:
+            Tuple of (row ids, scores) in descending score order
+        """
+        if len(self.vectors) == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+
+        probes = top_k_indices(self.centroids @ query_vector, self.nprobe)
+        candidates = np.concatenate([
+            self.order[self.offsets[probe]:self.offsets[probe + 1]] for probe in probes
+        ])
+        scores = self.vectors[candidates] @ query_vector
+        best = top_k_indices(scores, top_k)
+        return candidates[best], scores[best]
+
+    def save(self, index_path: Path) -> None:
+        """
+        Save the index to a directory.
+
+        Args:
+            index_path: Index directory
+        """
+        super().save(index_path)
+        np.savez(
+            index_path / self.IVF_FILENAME,
+            centroids=self.centroids,
+            order=self.order,
+            offsets=self.offsets
+        )
+
+    def load(self, index_path: Path) -> None:
+        """
+        Load the index from a directory.
+
+        Args:
+            index_path: Index directory
+        """
+        super().load(index_path)
+        with np.load(index_path / self.IVF_FILENAME) as data:
+            self.centroids = data["centroids"]
+            self.order = data["order"]
+            self.offsets = data["offsets"]
+
+
+# Registry of available index types
+INDEX_TYPES: Dict[str, Type[FlatIndex]] = {
+    FlatIndex.INDEX_TYPE: FlatIndex,
+    IVFIndex.INDEX_TYPE: IVFIndex,
+}
+
+
+def create_index(index_type: str) -> FlatIndex:
+    """
+    Create an empty index of the given type.
+
+    Args:
+        index_type: Registered index type name
+
+    Returns:
+        Index instance
+
+    Raises:
+        ValueError: If index_type is unknown
+    """
+    if index_type not in INDEX_TYPES:
+        raise ValueError(f"Unknown index type: {index_type}. Available: {list(INDEX_TYPES.keys())}")
+    return INDEX_TYPES[index_type]()
@@ -0,0 +1,64 @@
+"""
+Maintenance commands for the CyberSeed backend.
+
+Usage:
+    python -m backend.manage reconcile-catalog [--no-hash]
+    python -m backend.manage migrate-layout [--dry-run]
+"""
+
+import argparse
+import json
+import sys
+from typing import List
+
+from backend.core.layout_migration import migrate_to_sharded
+from backend.core.scoped_storage import ScopedStorage
+
+
+def reconcile_catalog(args: argparse.Namespace) -> dict:
+    """Rebuild the storage metadata catalog from DATA_DIR."""
+    storage = ScopedStorage(args.data_dir)
+    files = storage.reconcile_catalog(hash_contents=not args.no_hash)
+    return {"command": "reconcile-catalog", "files": files}
+
+
+def migrate_layout(args: argparse.Namespace) -> dict:
+    """Move flat-layout owner directories into the sharded layout."""
+    result = migrate_to_sharded(args.data_dir, dry_run=args.dry_run)
+    return {"command": "migrate-layout", "dry_run": args.dry_run, **result}
+
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="CyberSeed backend maintenance")
+    parser.add_argument("--data-dir", type=str, default=None, help="Data directory (default: DATA_DIR)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    reconcile = subparsers.add_parser(
+        "reconcile-catalog", help="Rebuild the storage metadata catalog from disk"
+    )
+    reconcile.add_argument(
+        "--no-hash", action="store_true", help="Skip content hashing for a faster rebuild"
+    )
+    reconcile.set_defaults(handler=reconcile_catalog)
+
+    migrate = subparsers.add_parser(
+        "migrate-layout", help="Move owners from the flat into the sharded data layout"
+    )
+    migrate.add_argument(
+        "--dry-run", action="store_true", help="Only report how many owners would move"
+    )
+    migrate.set_defaults(handler=migrate_layout)
+
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str] = None) -> None:
+    """Run a maintenance command and print its JSON result."""
+    args = parse_args(argv)
+    result = args.handler(args)
+    sys.stdout.write(json.dumps(result, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -39,6 +39,12 @@ class TrainRequest(BaseModel):
     include_transcripts: bool = Field(default=True, description="Include transcript files")
 
 
+class UploadSessionRequest(BaseModel):
+    """Resumable upload creation payload."""
+    filename: str = Field(..., description="Name of the file once finalized")
+    size: int = Field(..., ge=1, description="Total file size in bytes")
+
+
 class RefreshTokenRequest(BaseModel):
     """Refresh token request payload."""
     refresh_token: str = Field(..., description="Refresh token")
@@ -66,13 +72,46 @@ class ChatResponse(BaseModel):
     used_docs: List[Dict[str, Any]] = Field(default_factory=list, description="Documents used for context")
     has_knowledge_base: bool = Field(..., description="Whether knowledge base exists")
     total_indexed_documents: int = Field(..., description="Total documents in index")
+    cached: bool = Field(default=False, description="Whether the answer was served from the semantic cache")
+    cache_similarity: Optional[float] = Field(default=None, description="Similarity to the cached query on a cache hit")
+
+
+class OwnerChatResponse(ChatResponse):
+    """Chat response for a query across all of an owner's souls."""
+    searched_souls: List[str] = Field(default_factory=list, description="Souls whose indexes were searched")
+    timed_out_souls: List[str] = Field(default_factory=list, description="Souls that missed the query deadline")
 
 
 class TranscribeResponse(BaseModel):
     """Transcription response."""
     text: str = Field(..., description="Transcribed text")
     segments: List[Dict[str, Any]] = Field(default_factory=list, description="Transcription segments")
-    text_path: str = Field(..., description="Path to saved transcript file")
+    text_path: str = Field(..., description="Filename of the saved transcript in the soul's transcripts")
+    duration: Optional[float] = Field(default=None, description="Audio length in seconds")
+    skipped_fraction: Optional[float] = Field(
+        default=None, description="Fraction of the audio skipped as silence (0.0-1.0)"
+    )
+
+
+class TranscriptionJobResponse(BaseModel):
+    """Transcription job state."""
+    job_id: str = Field(..., description="Transcription job identifier")
+    status: str = Field(..., description="queued, running, completed, failed or cancelled")
+    progress: float = Field(..., description="Completed fraction (0.0-1.0)")
+    file_path: str = Field(..., description="Filename of the audio in the soul's uploads")
+    model: str = Field(..., description="Whisper model size")
+    language: str = Field(..., description="Language code")
+    cancel_requested: bool = Field(default=False, description="Whether cancellation is pending")
+    error: Optional[str] = Field(default=None, description="Failure message")
+    text_path: Optional[str] = Field(default=None, description="Filename of the saved transcript once completed")
+    created_at: str = Field(..., description="When the job was submitted")
+    started_at: Optional[str] = Field(default=None, description="When a worker picked the job up")
+    finished_at: Optional[str] = Field(default=None, description="When the job reached a final state")
+
+
+class TranscriptionJobListResponse(BaseModel):
+    """Transcription job list response."""
+    jobs: List[TranscriptionJobResponse] = Field(..., description="Jobs, newest first")
 
 
 class FileInfoResponse(BaseModel):
@@ -81,6 +120,17 @@ class FileInfoResponse(BaseModel):
     size: int
     created_at: str
     category: str
+    content_hash: Optional[str] = None
+    physical_size: Optional[int] = None
+
+
+class UploadSessionResponse(BaseModel):
+    """Resumable upload session state."""
+    upload_id: str = Field(..., description="Upload session identifier")
+    filename: str = Field(..., description="Name of the file once finalized")
+    size: int = Field(..., description="Total file size in bytes")
+    offset: int = Field(..., description="Bytes received; the next chunk must start here")
+    expires_at: str = Field(..., description="When the session expires if left idle")
 
 
 class UploadResponse(BaseModel):
@@ -93,8 +143,9 @@ class UploadResponse(BaseModel):
 class FileListResponse(BaseModel):
     """File list response."""
     files: List[FileInfoResponse] = Field(..., description="List of files")
-    count: int = Field(..., description="Total number of files")
-    total_size: int = Field(..., description="Total size in bytes")
+    count: int = Field(..., description="Total number of matching files, across all pages")
+    total_size: int = Field(..., description="Total size in bytes of all matching files")
+    next_cursor: Optional[str] = Field(default=None, description="Cursor for the next page, if any")
 
 
 class DeleteResponse(BaseModel):
@@ -127,6 +178,17 @@ class TranscriptionStatus(BaseModel):
     message: str = Field(..., description="Status message")
 
 
+class InferenceQueueStatus(BaseModel):
+    """Fair inference scheduler metrics."""
+    max_concurrent: int = Field(..., description="Requests sent to the model at once")
+    running: int = Field(..., description="Requests currently at the model")
+    queued: int = Field(..., description="Requests waiting for a slot")
+    role_weights: Dict[str, float] = Field(..., description="Fair share weight per role")
+    owners: Dict[str, Dict[str, Any]] = Field(
+        default_factory=dict, description="Per-owner queue length and queue-wait statistics"
+    )
+
+
 class SystemStatus(BaseModel):
     """Overall system status."""
     status: str = Field(..., description="Overall status")
@@ -139,6 +201,8 @@ class TrainResponse(BaseModel):
     """RAG training response."""
     success: bool = Field(..., description="Whether training was successful")
     indexed_documents: int = Field(..., description="Number of documents indexed")
+    duplicate_chunks: int = Field(default=0, description="Near-duplicate chunks folded into existing ones")
+    dedup_ratio: float = Field(default=0.0, description="Fraction of chunks removed as near-duplicates")
     message: str = Field(..., description="Result message")
 
 
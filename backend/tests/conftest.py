@@ -0,0 +1,13 @@
+"""Shared fixtures for backend tests."""
+
+import pytest
+
+from backend.core.scoped_storage import ScopedStorage
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """Scoped storage in a fresh data directory."""
+    storage = ScopedStorage(str(tmp_path))
+    yield storage
+    storage.trash.stop()
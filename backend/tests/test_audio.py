@@ -0,0 +1,52 @@
+"""Tests for voice activity detection and chunk planning."""
+
+import wave
+
+import numpy as np
+
+from backend.core.audio import SAMPLE_RATE, detect_speech, frame_energy, plan_chunks, restrict_to_speech
+from backend.core.transcription_engine import prepare_audio
+
+
+def continuous_speech(seconds: float, level: float) -> np.ndarray:
+    """A voiced signal without any pause, modulated like syllables."""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    envelope = 0.75 + 0.25 * np.sin(2 * np.pi * 4 * t)
+    return (level * envelope * np.sin(2 * np.pi * 180 * t)).astype(np.float32)
+
+
+def write_wav(path, samples):
+    with wave.open(str(path), "wb") as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(SAMPLE_RATE)
+        f.writeframes((np.clip(samples, -1, 1) * 32767).astype("<i2").tobytes())
+
+
+def test_continuous_speech_is_detected():
+    """A recording without pauses is speech from start to end."""
+    samples = continuous_speech(30, 0.3)
+    assert detect_speech(samples) == [(0.0, 30.0)]
+
+
+def test_chunks_without_detected_speech_are_kept_unless_silent(tmp_path):
+    """Steady sound VAD cannot tell from its own floor is transcribed, not skipped."""
+    audio_path = tmp_path / "talk.wav"
+    write_wav(audio_path, continuous_speech(30, 0.03))
+
+    duration, speech_seconds, chunks = prepare_audio(
+        str(audio_path), str(tmp_path / "talk.npy"),
+        chunk_seconds=10, overlap_seconds=1, vad_min_silence=1.0
+    )
+
+    assert duration == 30
+    assert len(chunks) == 3
+    assert all(chunk.speech_regions() for chunk in chunks)
+    assert speech_seconds == 30
+
+
+def test_silent_chunks_are_still_skipped():
+    """Chunks that are quiet in absolute terms keep no regions."""
+    samples = np.zeros(30 * SAMPLE_RATE, dtype=np.float32)
+    chunks = restrict_to_speech(plan_chunks(samples, 10, 1), detect_speech(samples), frame_energy(samples))
+    assert [chunk.speech_regions() for chunk in chunks] == [[], [], []]
@@ -0,0 +1,113 @@
+"""Tests for the content-addressed blob store and its garbage collection."""
+
+import io
+
+import pytest
+
+OWNER_ID = "owner-1"
+
+
+@pytest.fixture
+def storage(storage, monkeypatch):
+    """Storage whose trash is reclaimed explicitly by the test."""
+    monkeypatch.setattr(storage.trash, "schedule", lambda: None)
+    return storage
+
+
+def upload(storage, soul_id, filename, content, owner_id=OWNER_ID):
+    return storage.save_file(owner_id, soul_id, io.BytesIO(content), filename, "uploads")
+
+
+def blob_count(storage):
+    return storage.blob_store.get_stats()["blobs"]
+
+
+def test_identical_uploads_share_one_blob(storage):
+    """Identical content is stored once and linked twice."""
+    first = upload(storage, "soul-1", "a.bin", b"same bytes")
+    second = upload(storage, "soul-2", "b.bin", b"same bytes")
+
+    assert first.content_hash == second.content_hash
+    assert blob_count(storage) == 1
+    assert storage.get_file_info(OWNER_ID, "soul-2", "b.bin", "uploads").references == 2
+
+
+def test_deleting_last_reference_removes_blob(storage):
+    """A blob lives until its last scoped file is deleted."""
+    upload(storage, "soul-1", "a.bin", b"same bytes")
+    upload(storage, "soul-2", "b.bin", b"same bytes")
+
+    storage.delete_file(OWNER_ID, "soul-1", "a.bin", "uploads")
+    assert blob_count(storage) == 1
+
+    storage.delete_file(OWNER_ID, "soul-2", "b.bin", "uploads")
+    assert blob_count(storage) == 0
+
+
+def test_replacing_an_upload_releases_the_old_blob(storage):
+    """Overwriting an upload drops the blob it pointed to."""
+    upload(storage, "soul-1", "a.bin", b"old bytes")
+    upload(storage, "soul-1", "a.bin", b"new bytes")
+
+    assert blob_count(storage) == 1
+
+
+def test_reclaimed_soul_collects_only_its_blobs(storage):
+    """Reclaiming a soul checks only the blobs its uploads linked to."""
+    upload(storage, "soul-1", "shared.bin", b"shared")
+    upload(storage, "soul-1", "own.bin", b"only in soul-1")
+    upload(storage, "soul-2", "shared.bin", b"shared")
+    # An orphan the reclaim of soul-1 has no reason to look at
+    orphan = upload(storage, "soul-3", "orphan.bin", b"orphan")
+    storage.catalog.remove(OWNER_ID, "soul-3", "uploads", "orphan.bin")
+    orphan_path = storage.path_builder.get_category_path(OWNER_ID, "soul-3", "uploads") / "orphan.bin"
+    orphan_path.unlink()
+
+    storage.delete_soul_data(OWNER_ID, "soul-1")
+    storage.trash.reclaim()
+
+    assert blob_count(storage) == 2  # shared (still in soul-2) and the orphan
+    assert storage.blob_store.blob_path(orphan.content_hash).exists()
+
+    assert storage.blob_store.collect_garbage() == 1
+    assert blob_count(storage) == 1
+
+
+def test_reclaimed_owner_collects_its_blobs(storage):
+    """Reclaiming an owner collects the blobs of all their souls."""
+    upload(storage, "soul-1", "a.bin", b"first")
+    upload(storage, "soul-2", "b.bin", b"second")
+    upload(storage, "soul-1", "c.bin", b"kept", owner_id="owner-2")
+
+    storage.delete_owner_data(OWNER_ID)
+    storage.trash.reclaim()
+
+    assert blob_count(storage) == 1
+
+
+def test_trash_without_references_falls_back_to_full_collection(storage):
+    """Trees trashed without references trigger a full collection."""
+    upload(storage, "soul-1", "a.bin", b"first")
+    soul_path = storage.path_builder.get_soul_path(OWNER_ID, "soul-1")
+    storage.catalog.remove_soul(OWNER_ID, "soul-1")
+    storage.trash.move(soul_path)
+
+    storage.trash.reclaim()
+
+    assert blob_count(storage) == 0
+
+
+def test_references_and_savings_are_scoped_to_the_owner(storage):
+    """Content shared with another owner is invisible in counts and stats."""
+    upload(storage, "soul-1", "a.bin", b"x" * 1000)
+    upload(storage, "soul-1", "a.bin", b"x" * 1000, owner_id="owner-2")
+
+    assert blob_count(storage) == 1
+    info = storage.get_file_info("owner-2", "soul-1", "a.bin", "uploads")
+    assert info.references == 1
+    (listed,) = storage.list_files("owner-2", "soul-1")
+    assert listed.references == 1
+    assert storage.get_storage_stats("owner-2", "soul-1")["uploads"]["deduplicated_bytes"] == 0
+
+    upload(storage, "soul-2", "b.bin", b"x" * 1000)
+    assert storage.get_storage_stats(OWNER_ID, "soul-1")["uploads"]["deduplicated_bytes"] == 500
@@ -0,0 +1,89 @@
+"""Tests for compression at rest."""
+
+import gzip
+import io
+
+from backend.core.compression import StorageCompression
+from backend.core.scoped_rag import ScopedRAG
+
+OWNER_ID = "owner-1"
+SOUL_ID = "soul-1"
+
+
+def test_upload_with_gzip_magic_is_not_decompressed(storage, tmp_path):
+    """Raw uploads that happen to look compressed are read byte for byte."""
+    payload = gzip.compress(b"not what the user uploaded")
+    storage.save_file(OWNER_ID, SOUL_ID, io.BytesIO(payload), "notes.txt", "uploads")
+
+    info = storage.get_file_info(OWNER_ID, SOUL_ID, "notes.txt", "uploads")
+    assert info.codec is None
+    assert info.size == len(payload)
+    with storage.open_file(OWNER_ID, SOUL_ID, "notes.txt", "uploads") as f:
+        assert f.read() == payload
+
+    rag = ScopedRAG(str(tmp_path))
+    ((_, path, codec),) = rag._collect_documents(OWNER_ID, SOUL_ID, True, False)
+    assert codec is None
+    with open(path, "rb") as f:
+        assert f.read() == payload
+
+
+def test_codec_is_recorded_and_survives_reconcile(storage):
+    """Compressed writes record their codec, which reconcile keeps."""
+    storage.compression = StorageCompression(categories=["transcripts"], codec="gzip")
+    text = "hello world " * 100
+    info = storage.write_text(OWNER_ID, SOUL_ID, "a_transcript.txt", text, "transcripts")
+
+    assert info.codec == "gzip"
+    assert info.size == len(text)
+    assert info.physical_size < info.size
+
+    storage.reconcile_catalog()
+    entry = storage.catalog.get(OWNER_ID, SOUL_ID, "transcripts", "a_transcript.txt")
+    assert entry.codec == "gzip"
+    assert entry.size == len(text)
+    with storage.open_file(OWNER_ID, SOUL_ID, "a_transcript.txt", "transcripts") as f:
+        assert f.read().decode("utf-8") == text
+
+
+def test_disabled_category_writes_as_is(storage):
+    """Categories without compression store text unchanged."""
+    storage.compression = StorageCompression(categories=["transcripts"], codec="gzip")
+    info = storage.write_text(OWNER_ID, SOUL_ID, "notes.txt", "plain", "uploads")
+
+    assert info.codec is None
+    assert info.physical_size == info.size == 5
+
+
+def test_same_upload_content_under_two_codecs(storage):
+    """Identical content stored compressed and as-is never shares a blob."""
+    storage.compression = StorageCompression(["uploads"], "gzip")
+    content = b"the same words " * 100
+
+    storage.save_file(OWNER_ID, SOUL_ID, io.BytesIO(content), "notes.txt", "uploads")
+    storage.save_file(OWNER_ID, SOUL_ID, io.BytesIO(content), "notes.bin", "uploads")
+    storage.compression = StorageCompression([], "gzip")
+    storage.save_file(OWNER_ID, SOUL_ID, io.BytesIO(content), "later.txt", "uploads")
+
+    assert storage.get_file_info(OWNER_ID, SOUL_ID, "notes.txt", "uploads").codec == "gzip"
+    for filename in ("notes.txt", "notes.bin", "later.txt"):
+        with storage.open_file(OWNER_ID, SOUL_ID, filename, "uploads") as f:
+            assert f.read() == content
+    assert storage.blob_store.get_stats()["blobs"] == 2
+    assert storage.get_file_info(OWNER_ID, SOUL_ID, "notes.bin", "uploads").references == 2
+
+    storage.delete_file(OWNER_ID, SOUL_ID, "notes.txt", "uploads")
+    assert storage.blob_store.get_stats()["blobs"] == 1
+
+
+def test_compressed_blobs_from_plain_hash_keys_are_moved(storage):
+    """Compressed upload blobs stored under the bare hash are rekeyed."""
+    storage.compression = StorageCompression(["uploads"], "gzip")
+    info = storage.save_file(OWNER_ID, SOUL_ID, io.BytesIO(b"old layout " * 50), "notes.txt", "uploads")
+    keyed = storage.blob_store.blob_path(f"{info.content_hash}.gzip")
+    plain = storage.blob_store.blob_path(info.content_hash)
+    keyed.rename(plain)
+
+    assert storage.rekey_compressed_blobs() == 1
+    assert keyed.exists() and not plain.exists()
+    assert storage.rekey_compressed_blobs() == 0
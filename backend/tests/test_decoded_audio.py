@@ -0,0 +1,73 @@
+"""Tests for decoded-audio sidecars of uploads."""
+
+import io
+
+import numpy as np
+
+from backend.core.audio import decoded_audio_files, decoded_audio_path
+
+OWNER_ID = "owner-1"
+SOUL_ID = "soul-1"
+
+
+def upload(storage, filename, content):
+    return storage.save_file(OWNER_ID, SOUL_ID, io.BytesIO(content), filename, "uploads")
+
+
+def write_sidecar(info, samples=1000):
+    path = decoded_audio_path(info.path, info.content_hash)
+    np.save(path, np.zeros(samples, dtype=np.float32))
+    return path
+
+
+def test_sidecars_of_uploads_sharing_a_name_prefix_are_kept_apart(storage):
+    """Deleting an upload leaves the sidecars of similarly named uploads."""
+    short = upload(storage, "a.wav", b"short")
+    longer = upload(storage, "a.wav.bak", b"longer")
+    short_sidecar = write_sidecar(short)
+    longer_sidecar = write_sidecar(longer)
+
+    assert decoded_audio_files(short.path) == [short_sidecar]
+
+    storage.delete_file(OWNER_ID, SOUL_ID, "a.wav", "uploads")
+    assert not short_sidecar.exists()
+    assert longer_sidecar.exists()
+
+
+def test_sidecars_count_toward_quota_and_stats(storage):
+    """Recorded sidecars are charged to the upload's owner."""
+    info = upload(storage, "talk.wav", b"x" * 100)
+    sidecar = write_sidecar(info)
+    sidecar_size = sidecar.stat().st_size
+
+    assert storage.record_derived_file(OWNER_ID, SOUL_ID, "uploads", "talk.wav", info.content_hash, sidecar)
+    assert storage.remaining_quota(OWNER_ID, 10**6) == 10**6 - 100 - sidecar_size
+    assert storage.get_storage_stats(OWNER_ID, SOUL_ID)["uploads"]["derived_size"] == sidecar_size
+
+    # Rebuilding the catalog finds the sidecar on disk
+    storage.reconcile_catalog()
+    assert storage.get_storage_stats(OWNER_ID, SOUL_ID)["uploads"]["derived_size"] == sidecar_size
+
+    storage.delete_file(OWNER_ID, SOUL_ID, "talk.wav", "uploads")
+    assert storage.remaining_quota(OWNER_ID, 10**6) == 10**6
+
+
+def test_replacing_an_upload_drops_its_sidecars(storage):
+    """Sidecars of previous content are removed and no longer charged."""
+    info = upload(storage, "talk.wav", b"old audio")
+    sidecar = write_sidecar(info)
+    storage.record_derived_file(OWNER_ID, SOUL_ID, "uploads", "talk.wav", info.content_hash, sidecar)
+
+    upload(storage, "talk.wav", b"new audio")
+    assert not sidecar.exists()
+    assert storage.get_storage_stats(OWNER_ID, SOUL_ID)["uploads"]["derived_size"] == 0
+
+
+def test_sidecar_of_replaced_content_is_not_recorded(storage):
+    """A sidecar finished after its upload changed is removed instead."""
+    old = upload(storage, "talk.wav", b"old audio")
+    upload(storage, "talk.wav", b"new audio")
+    stale = write_sidecar(old)
+
+    assert not storage.record_derived_file(OWNER_ID, SOUL_ID, "uploads", "talk.wav", old.content_hash, stale)
+    assert not stale.exists()
@@ -0,0 +1,66 @@
+"""Tests for download responses."""
+
+import gzip
+import io
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from backend.core.compression import StorageCompression
+from backend.core.downloads import build_download_response
+
+OWNER_ID = "owner-1"
+SOUL_ID = "soul-1"
+
+
+@pytest.fixture
+def client(storage):
+    """Client for a minimal app serving storage downloads."""
+    app = FastAPI()
+
+    @app.get("/{category}/{filename}")
+    def download(category: str, filename: str, request: Request):
+        file_info = storage.get_file_info(OWNER_ID, SOUL_ID, filename, category)
+        return build_download_response(request, file_info)
+
+    return TestClient(app)
+
+
+def test_raw_upload_is_never_content_encoded(storage, client):
+    """Uploads that look gzip-compressed are served as stored."""
+    payload = gzip.compress(b"user bytes")
+    storage.save_file(OWNER_ID, SOUL_ID, io.BytesIO(payload), "notes.txt", "uploads")
+
+    response = client.get("/uploads/notes.txt", headers={"accept-encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.headers["content-length"] == str(len(payload))
+    assert response.content == payload
+
+
+def test_compressed_file_is_decoded_with_logical_length(storage, client):
+    """Clients without gzip support get the decoded bytes and their length."""
+    storage.compression = StorageCompression(categories=["transcripts"], codec="gzip")
+    text = "segment text " * 200
+    storage.write_text(OWNER_ID, SOUL_ID, "a_transcript.txt", text, "transcripts")
+
+    response = client.get("/transcripts/a_transcript.txt", headers={"accept-encoding": "identity"})
+
+    assert response.status_code == 200
+    assert response.headers["content-length"] == str(len(text))
+    assert response.text == text
+
+
+def test_compressed_file_is_passed_through(storage, client):
+    """Clients accepting gzip get the stored bytes with Content-Encoding."""
+    storage.compression = StorageCompression(categories=["transcripts"], codec="gzip")
+    text = "segment text " * 200
+    info = storage.write_text(OWNER_ID, SOUL_ID, "a_transcript.txt", text, "transcripts")
+
+    response = client.get("/transcripts/a_transcript.txt", headers={"accept-encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["content-length"] == str(info.physical_size)
+    assert response.text == text
@@ -0,0 +1,76 @@
+"""Tests for cursor pagination of file listings."""
+
+import io
+
+import pytest
+
+from backend.core.storage_catalog import decode_cursor, encode_cursor
+
+OWNER_ID = "owner-1"
+SOUL_ID = "soul-1"
+
+
+@pytest.fixture
+def populated(storage):
+    """Storage with uploads, transcripts and index files of varied sizes."""
+    for i in range(7):
+        storage.save_file(OWNER_ID, SOUL_ID, io.BytesIO(b"u" * (i * 3 % 5 + 1)), f"upload-{i}.txt", "uploads")
+    for i in range(4):
+        storage.save_file(OWNER_ID, SOUL_ID, io.BytesIO(b"t" * (i + 2)), f"transcript-{i}.txt", "transcripts")
+    index_dir = storage.path_builder.get_category_path(OWNER_ID, SOUL_ID, "index")
+    index_dir.mkdir(parents=True, exist_ok=True)
+    for i in range(3):
+        (index_dir / f"index-{i}.json").write_bytes(b"i" * (i + 1))
+    return storage
+
+
+def follow_cursors(storage, limit, sort, descending):
+    """Collect every page of a listing."""
+    names, cursor = [], None
+    while True:
+        page, cursor = storage.list_files_page(OWNER_ID, SOUL_ID, None, limit, cursor, sort, descending)
+        assert len(page) <= limit
+        names.extend((f.category, f.filename) for f in page)
+        if cursor is None:
+            return names
+
+
+@pytest.mark.parametrize("sort", ["name", "size", "created_at"])
+@pytest.mark.parametrize("descending", [False, True])
+@pytest.mark.parametrize("limit", [1, 4, 100])
+def test_pages_cover_every_file_once_in_order(populated, sort, descending, limit):
+    """Following cursors yields the unbounded listing, without gaps or duplicates."""
+    everything, cursor = populated.list_files_page(OWNER_ID, SOUL_ID, None, None, None, sort, descending)
+    assert cursor is None
+    assert len(everything) == 14
+
+    assert follow_cursors(populated, limit, sort, descending) == [(f.category, f.filename) for f in everything]
+
+
+def test_count_files_covers_all_pages(populated):
+    """Totals are those of the whole listing, not of one page."""
+    everything, _ = populated.list_files_page(OWNER_ID, SOUL_ID, limit=None)
+    assert populated.count_files(OWNER_ID, SOUL_ID) == (len(everything), sum(f.size for f in everything))
+    assert populated.count_files(OWNER_ID, SOUL_ID, "index")[0] == 3
+
+
+@pytest.mark.parametrize("key", [
+    [False, "uploads", "a.txt"],
+    ["12", "uploads", "a.txt"],
+    [3, 4, "a.txt"],
+    [3, "uploads"],
+])
+def test_cursor_with_wrong_value_types_is_rejected(populated, key):
+    """A well-formed cursor carrying the wrong types is invalid, not a crash."""
+    cursor = encode_cursor("size", False, key)
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, "size", False)
+    with pytest.raises(ValueError):
+        populated.list_files_page(OWNER_ID, SOUL_ID, None, 5, cursor, "size", False)
+
+
+def test_cursor_for_another_order_is_rejected(populated):
+    """A cursor only continues the listing it came from."""
+    _, cursor = populated.list_files_page(OWNER_ID, SOUL_ID, None, 2, None, "size", False)
+    with pytest.raises(ValueError):
+        populated.list_files_page(OWNER_ID, SOUL_ID, None, 2, cursor, "size", True)
@@ -0,0 +1,132 @@
+"""Tests for the token bucket rate limiter."""
+
+import asyncio
+
+import pytest
+
+from backend.core.rate_limiter import RateLimiter, RateLimitMiddleware
+
+
+def limiter(**kwargs):
+    kwargs.setdefault("per_minute", 10)
+    kwargs.setdefault("backend", "memory")
+    return RateLimiter(**kwargs)
+
+
+def test_bucket_admits_its_capacity_then_rejects():
+    """A full bucket admits one minute's worth of tokens."""
+    rate_limiter = limiter()
+    decisions = [rate_limiter.check("owner-1", None, 1) for _ in range(11)]
+
+    assert all(d.allowed for d in decisions[:10])
+    assert decisions[9].remaining == 0
+    assert not decisions[10].allowed
+    assert decisions[10].retry_after == pytest.approx(6.0, abs=0.5)
+
+
+def test_owners_have_separate_buckets():
+    """One owner running out does not limit another."""
+    rate_limiter = limiter()
+    assert rate_limiter.check("owner-1", None, 10).allowed
+    assert not rate_limiter.check("owner-1", None, 1).allowed
+    assert rate_limiter.check("owner-2", None, 1).allowed
+
+
+def test_request_needs_tokens_in_both_buckets():
+    """An exhausted IP bucket rejects every owner behind it, charging neither."""
+    rate_limiter = limiter(ip_per_minute=5)
+    assert rate_limiter.check("owner-1", "1.2.3.4", 5).allowed
+    assert not rate_limiter.check("owner-2", "1.2.3.4", 1).allowed
+    # The rejected request took nothing from owner-2
+    assert rate_limiter.check("owner-2", "5.6.7.8", 5).allowed
+    assert rate_limiter.check("owner-2", "9.9.9.9", 5).allowed
+
+
+def test_route_costs():
+    """Expensive routes cost more tokens."""
+    rate_limiter = limiter(route_costs={"chat": 10, "upload": 2, "default": 1})
+    assert rate_limiter.route_cost("POST", "/souls/o/s/chat") == 10
+    assert rate_limiter.route_cost("PUT", "/souls/o/s/uploads/abc") == 2
+    assert rate_limiter.route_cost("GET", "/souls/o/s/files") == 1
+
+
+def test_forwarded_for_is_only_trusted_from_proxies():
+    """Clients behind a trusted proxy get their own address; others cannot spoof one."""
+    rate_limiter = limiter(trusted_proxies=["10.0.0.0/8"])
+
+    assert rate_limiter.client_ip("10.0.0.1", "203.0.113.7") == "203.0.113.7"
+    assert rate_limiter.client_ip("10.0.0.1", "198.51.100.1, 203.0.113.7, 10.0.0.2") == "203.0.113.7"
+    assert rate_limiter.client_ip("203.0.113.7", "198.51.100.1") == "203.0.113.7"
+    assert rate_limiter.client_ip("10.0.0.1", None) == "10.0.0.1"
+    assert limiter().client_ip("10.0.0.1", "203.0.113.7") == "10.0.0.1"
+
+
+def test_ip_buckets_can_be_disabled():
+    """With no IP limit only owners are limited."""
+    rate_limiter = limiter(ip_per_minute=0)
+    for i in range(20):
+        assert rate_limiter.check(f"owner-{i}", "1.2.3.4", 5).allowed
+
+
+def test_sqlite_buckets_are_shared_between_limiters(tmp_path):
+    """Processes using the sqlite backend share one set of buckets."""
+    first = limiter(backend="sqlite", data_dir=str(tmp_path))
+    second = limiter(backend="sqlite", data_dir=str(tmp_path))
+
+    assert first.check("owner-1", None, 10).allowed
+    assert not second.check("owner-1", None, 1).allowed
+
+
+def call(middleware, peer, headers=()):
+    """Send one GET through the middleware and return (status, headers)."""
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/souls/o/s/files",
+        "headers": [(name.encode(), value.encode()) for name, value in headers],
+        "client": (peer, 40000),
+    }
+    asyncio.run(middleware(scope, receive, send))
+    start = messages[0]
+    return start["status"], dict(start["headers"])
+
+
+async def ok_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+def test_middleware_limits_clients_behind_a_proxy_separately():
+    """Each forwarded client has its own IP bucket and gets 429 with Retry-After."""
+    middleware = RateLimitMiddleware(ok_app, limiter(ip_per_minute=2, trusted_proxies=["127.0.0.1"]))
+    first = [("x-forwarded-for", "203.0.113.7")]
+    second = [("x-forwarded-for", "198.51.100.1")]
+
+    assert call(middleware, "127.0.0.1", first)[0] == 200
+    assert call(middleware, "127.0.0.1", first)[0] == 200
+    status, headers = call(middleware, "127.0.0.1", first)
+    assert status == 429
+    assert int(headers[b"retry-after"]) >= 1
+
+    status, headers = call(middleware, "127.0.0.1", second)
+    assert status == 200
+    assert headers[b"ratelimit-limit"] == b"2"
+
+
+def test_route_cost_above_capacity_is_capped():
+    """A limit below a route's cost still admits an idle client once per refill."""
+    rate_limiter = limiter(per_minute=5, route_costs={"train": 20, "default": 1})
+    cost = rate_limiter.route_cost("POST", "/souls/o/s/train")
+
+    first = rate_limiter.check("owner-1", "1.2.3.4", cost)
+    assert first.allowed
+    assert first.remaining == 0
+    assert not rate_limiter.check("owner-1", "1.2.3.4", cost).allowed
@@ -0,0 +1,133 @@
+"""Tests for resumable upload sessions."""
+
+import asyncio
+import dataclasses
+import gc
+
+import pytest
+
+from backend.core.async_storage import AsyncScopedStorage
+from backend.core.exceptions import FileTooLargeError, UploadSessionNotFoundError
+from backend.core.resumable_uploads import ResumableUploadManager
+
+OWNER_ID = "owner-1"
+SOUL_ID = "soul-1"
+
+
+@pytest.fixture
+def uploads(storage):
+    async_storage = AsyncScopedStorage(storage, max_workers=2)
+    yield ResumableUploadManager(async_storage, session_ttl_seconds=60)
+    async_storage.shutdown()
+
+
+async def body(*chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def test_upload_round_trip(uploads, storage):
+    """Chunks appended in order are committed as one file."""
+    async def scenario():
+        session = await uploads.create_session(OWNER_ID, SOUL_ID, "a.bin", 6)
+        await uploads.append_chunk(OWNER_ID, SOUL_ID, session.upload_id, 0, body(b"abc"))
+        await uploads.append_chunk(OWNER_ID, SOUL_ID, session.upload_id, 3, body(b"def"))
+        return await uploads.finalize(OWNER_ID, SOUL_ID, session.upload_id)
+
+    info = asyncio.run(scenario())
+
+    assert info.size == 6
+    with storage.open_file(OWNER_ID, SOUL_ID, "a.bin", "uploads") as f:
+        assert f.read() == b"abcdef"
+    assert not list(uploads.sessions_path.iterdir())
+    assert not uploads._locks
+
+
+def test_sessions_reserve_quota(uploads):
+    """Declared sizes of live sessions count against the quota."""
+    async def scenario():
+        first = await uploads.create_session(OWNER_ID, SOUL_ID, "a.bin", 60, quota_bytes=100)
+        assert await uploads.reserved_bytes(OWNER_ID) == 60
+        assert await uploads.reserved_bytes(OWNER_ID, first.upload_id) == 0
+        with pytest.raises(FileTooLargeError):
+            await uploads.create_session(OWNER_ID, SOUL_ID, "b.bin", 50, quota_bytes=100)
+
+        await uploads.abort(OWNER_ID, SOUL_ID, first.upload_id)
+        await uploads.create_session(OWNER_ID, SOUL_ID, "b.bin", 50, quota_bytes=100)
+
+    asyncio.run(scenario())
+
+
+def test_sessions_are_scoped_to_their_soul(uploads):
+    """Another soul cannot see or abort a session."""
+    async def scenario():
+        session = await uploads.create_session(OWNER_ID, SOUL_ID, "a.bin", 6)
+        with pytest.raises(UploadSessionNotFoundError):
+            await uploads.get_session(OWNER_ID, "soul-2", session.upload_id)
+        assert not await uploads.abort("owner-2", SOUL_ID, session.upload_id)
+        assert await uploads.get_session(OWNER_ID, SOUL_ID, session.upload_id)
+
+    asyncio.run(scenario())
+
+
+def test_sweep_removes_expired_sessions_and_orphans(uploads):
+    """Expired sessions and staging files without state are swept."""
+    async def scenario():
+        expired = await uploads.create_session(OWNER_ID, SOUL_ID, "a.bin", 6)
+        live = await uploads.create_session(OWNER_ID, SOUL_ID, "b.bin", 6)
+        expired.expires_at = 0
+        uploads.store.update(expired)
+        orphan = uploads.sessions_path / ("0" * 32 + ".part")
+        orphan.touch()
+
+        assert await uploads.sweep_expired() == 1
+
+        assert not uploads._staging_path(expired.upload_id).exists()
+        assert not orphan.exists()
+        assert uploads._staging_path(live.upload_id).exists()
+        assert await uploads.reserved_bytes(OWNER_ID) == 6
+
+    asyncio.run(scenario())
+    gc.collect()
+    assert not uploads._locks
+
+
+def test_sweep_waits_for_an_in_flight_append(uploads):
+    """A session whose chunk is being appended is not swept from under it."""
+    async def scenario():
+        session = await uploads.create_session(OWNER_ID, SOUL_ID, "a.bin", 6)
+        release = asyncio.Event()
+
+        async def slow_body():
+            yield b"abc"
+            await release.wait()
+            yield b"def"
+
+        append = asyncio.create_task(
+            uploads.append_chunk(OWNER_ID, SOUL_ID, session.upload_id, 0, slow_body())
+        )
+        await asyncio.sleep(0.05)
+        # Expires while the chunk is still arriving
+        uploads.store.update(dataclasses.replace(session, expires_at=0))
+        sweep = asyncio.create_task(uploads.sweep_expired())
+        await asyncio.sleep(0.05)
+        release.set()
+
+        assert (await append).offset == 6
+        assert await sweep == 0
+        assert (await uploads.finalize(OWNER_ID, SOUL_ID, session.upload_id)).size == 6
+
+    asyncio.run(scenario())
+
+
+def test_forget_removes_sessions_of_deleted_souls(uploads):
+    """Deleting a soul drops its sessions and their reservations."""
+    async def scenario():
+        session = await uploads.create_session(OWNER_ID, SOUL_ID, "a.bin", 6)
+        await uploads.create_session(OWNER_ID, "soul-2", "a.bin", 6)
+
+        assert await uploads.forget(OWNER_ID, SOUL_ID) == 1
+        assert not uploads._staging_path(session.upload_id).exists()
+        assert await uploads.reserved_bytes(OWNER_ID) == 6
+
+    asyncio.run(scenario())
@@ -0,0 +1,136 @@
+"""Tests for the fair inference scheduler."""
+
+import asyncio
+
+import pytest
+
+from backend.core.llm.scheduler import FairInferenceScheduler
+
+
+def scheduler(**kwargs):
+    kwargs.setdefault("max_concurrent", 1)
+    kwargs.setdefault("quantum", 1000)
+    return FairInferenceScheduler(**kwargs)
+
+
+async def hold(scheduler, owner_id, release, started=None, log=None):
+    """Take a slot for an owner and keep it until release is set."""
+    async with scheduler.slot(owner_id, "owner", "prompt"):
+        if log is not None:
+            log.append(owner_id)
+        if started is not None:
+            started.set()
+        await release.wait()
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_cancelled_queued_request_is_withdrawn():
+    """A request cancelled while queued leaves the queue and takes no slot."""
+    async def scenario():
+        fair = scheduler()
+        release = asyncio.Event()
+        log = []
+        holder = asyncio.create_task(hold(fair, "owner-1", release, log=log))
+        await settle()
+        withdrawn = asyncio.create_task(hold(fair, "owner-2", release, log=log))
+        waiting = asyncio.create_task(hold(fair, "owner-3", release, log=log))
+        await settle()
+        assert fair.get_stats()["queued"] == 2
+
+        withdrawn.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await withdrawn
+        assert fair.get_stats()["queued"] == 1
+
+        release.set()
+        await asyncio.gather(holder, waiting)
+        return fair, log
+
+    fair, log = asyncio.run(scenario())
+
+    assert log == ["owner-1", "owner-3"]
+    stats = fair.get_stats()
+    assert (stats["running"], stats["queued"]) == (0, 0)
+    assert stats["owners"]["owner-2"]["cancelled"] == 1
+    assert stats["owners"]["owner-2"]["requests"] == 0
+
+
+def test_slot_granted_to_a_cancelled_request_is_passed_on():
+    """A request cancelled right after being granted a slot hands it to the next one."""
+    async def scenario():
+        fair = scheduler()
+        release, done = asyncio.Event(), asyncio.Event()
+        log = []
+
+        async def first():
+            async with fair.slot("owner-1", "owner", "prompt"):
+                await release.wait()
+            # The slot was just granted to owner-2, which has not resumed yet
+            granted.cancel()
+
+        holder = asyncio.create_task(first())
+        await settle()
+        granted = asyncio.create_task(hold(fair, "owner-2", done, log=log))
+        successor = asyncio.create_task(hold(fair, "owner-3", done, log=log))
+        await settle()
+
+        release.set()
+        await holder
+        with pytest.raises(asyncio.CancelledError):
+            await granted
+        await settle()
+        assert fair.get_stats()["running"] == 1
+        done.set()
+        await successor
+        return fair, log
+
+    fair, log = asyncio.run(scenario())
+
+    assert log == ["owner-3"]
+    stats = fair.get_stats()
+    assert (stats["running"], stats["queued"]) == (0, 0)
+    assert stats["owners"]["owner-2"]["cancelled"] == 1
+
+
+def test_metrics_of_idle_owners_are_capped():
+    """Only the most recently active idle owners keep their metrics."""
+    async def scenario():
+        fair = scheduler(max_concurrent=4, max_tracked_owners=3)
+        release = asyncio.Event()
+        release.set()
+        for i in range(10):
+            await hold(fair, f"owner-{i}", release)
+        return fair
+
+    fair = asyncio.run(scenario())
+
+    assert list(fair.get_stats()["owners"]) == ["owner-7", "owner-8", "owner-9"]
+
+
+def test_active_owners_are_never_forgotten():
+    """An owner holding a slot keeps its metrics however many owners come by."""
+    async def scenario():
+        fair = scheduler(max_concurrent=2, max_tracked_owners=2)
+        release, started = asyncio.Event(), asyncio.Event()
+        holder = asyncio.create_task(hold(fair, "busy", release, started))
+        await started.wait()
+
+        done = asyncio.Event()
+        done.set()
+        for i in range(5):
+            await hold(fair, f"owner-{i}", done)
+        owners = list(fair.get_stats()["owners"])
+
+        release.set()
+        await holder
+        return fair, owners
+
+    fair, owners = asyncio.run(scenario())
+
+    assert "busy" in owners
+    assert len(owners) == 2
+    assert fair.get_stats()["owners"]["busy"]["running"] == 0
@@ -0,0 +1,73 @@
+"""Tests for the loaded RAG index cache and owner-wide queries."""
+
+import asyncio
+import io
+import threading
+
+import pytest
+
+from backend.benchmarks.synthetic import HashingEmbedder
+from backend.core.scoped_rag import ScopedRAG
+
+OWNER_ID = "owner-1"
+SOUL_ID = "soul-1"
+
+
+@pytest.fixture
+def rag(tmp_path):
+    """RAG manager over the storage fixture's data directory."""
+    return ScopedRAG(str(tmp_path), embedder=HashingEmbedder())
+
+
+def upload(storage, text):
+    storage.save_file(OWNER_ID, SOUL_ID, io.BytesIO(text.encode("utf-8")), "doc.txt", "uploads")
+
+
+def search(rag, query):
+    docs = asyncio.run(rag.query(OWNER_ID, SOUL_ID, query, top_k=1))
+    return docs[0]["text"]
+
+
+def test_rebuilt_index_after_soul_delete_is_not_served_stale(storage, rag):
+    """A rebuild that restarts at version 1 replaces the loaded index."""
+    upload(storage, "apples and pears from the old orchard")
+    assert asyncio.run(rag.build_index(OWNER_ID, SOUL_ID))["index_version"] == 1
+    assert "apples" in search(rag, "apples")
+
+    storage.delete_soul_data(OWNER_ID, SOUL_ID)
+    upload(storage, "submarines and harbours in the new port")
+    assert asyncio.run(rag.build_index(OWNER_ID, SOUL_ID))["index_version"] == 1
+
+    assert "submarines" in search(rag, "apples")
+
+
+def test_invalidate_drops_loaded_indexes(storage, rag):
+    """Deleting an owner's data evicts their loaded indexes."""
+    upload(storage, "apples and pears from the old orchard")
+    asyncio.run(rag.build_index(OWNER_ID, SOUL_ID))
+    search(rag, "apples")
+    assert (OWNER_ID, SOUL_ID) in rag._loaded_indexes
+
+    rag.invalidate(OWNER_ID)
+
+    assert not rag._loaded_indexes
+
+
+def test_owner_query_reads_manifests_off_the_event_loop(storage, rag, monkeypatch):
+    """Index status checks run in the executor, not on the loop thread."""
+    upload(storage, "apples and pears from the old orchard")
+    asyncio.run(rag.build_index(OWNER_ID, SOUL_ID))
+    load_manifest = rag._load_manifest
+    threads = []
+
+    def recording_load_manifest(index_path):
+        threads.append(threading.current_thread())
+        return load_manifest(index_path)
+
+    monkeypatch.setattr(rag, "_load_manifest", recording_load_manifest)
+
+    result = asyncio.run(rag.query_owner(OWNER_ID, "apples", top_k=1))
+
+    assert result["searched_souls"] == [SOUL_ID]
+    assert threads
+    assert threading.main_thread() not in threads
@@ -0,0 +1,23 @@
+"""Tests for the storage metadata catalog."""
+
+from backend.core.scoped_storage import ScopedStorage
+
+OWNER_ID = "owner-1"
+SOUL_ID = "soul-1"
+
+
+def test_files_from_before_the_catalog_are_cataloged_on_startup(tmp_path):
+    """An empty catalog is rebuilt from the data directory."""
+    legacy = tmp_path / OWNER_ID / SOUL_ID / "uploads"
+    legacy.mkdir(parents=True)
+    (legacy / "old.txt").write_bytes(b"written before the catalog")
+
+    storage = ScopedStorage(str(tmp_path))
+    assert storage.list_files(OWNER_ID, SOUL_ID) == []
+
+    assert storage.reconcile_if_empty() == 1
+    (info,) = storage.list_files(OWNER_ID, SOUL_ID)
+    assert info.filename == "old.txt"
+    assert storage.remaining_quota(OWNER_ID, 100) == 100 - len(b"written before the catalog")
+
+    assert storage.reconcile_if_empty() is None
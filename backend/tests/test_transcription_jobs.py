@@ -0,0 +1,175 @@
+"""Tests for transcription jobs writing their transcripts."""
+
+import asyncio
+import io
+
+import pytest
+
+from backend.core.async_storage import AsyncScopedStorage
+from backend.core.layout_migration import migrate_to_sharded
+from backend.core.scoped_storage import ScopedPathBuilder
+from backend.core.transcription_jobs import (
+    STATUS_COMPLETED,
+    STATUS_FAILED,
+    STATUS_QUEUED,
+    TranscriptionJobQueue,
+)
+
+OWNER_ID = "owner-1"
+SOUL_ID = "soul-1"
+SEGMENTS = [{"id": 0, "start": 0.0, "end": 1.0, "text": "hello"}]
+
+
+class FakeRunner:
+    """Runner that reports one batch of segments, then optionally hangs."""
+
+    workers = 1
+    available = True
+
+    def __init__(self, hang: bool = False):
+        self.hang = hang
+        self.segments_written = asyncio.Event()
+        self.read = []
+
+    async def transcribe(self, file_path, model, language, progress, on_segments, samples_path):
+        with open(file_path, "rb") as f:
+            self.read.append(f.read())
+        await on_segments(SEGMENTS)
+        self.segments_written.set()
+        if self.hang:
+            await asyncio.Event().wait()
+        return {"text": "hello", "segments": SEGMENTS, "language": language}
+
+
+class FakeCache:
+    """Cache holding one result for every audio."""
+
+    def get(self, content_hash, model, language):
+        return {"text": "hello", "segments": SEGMENTS, "language": language}
+
+
+@pytest.fixture
+def async_storage(storage):
+    async_storage = AsyncScopedStorage(storage, max_workers=2)
+    yield async_storage
+    async_storage.shutdown()
+
+
+def claimed_job(queue, storage):
+    info = storage.save_file(OWNER_ID, SOUL_ID, io.BytesIO(b"audio"), "talk.wav", "uploads")
+    queue.store.create(OWNER_ID, SOUL_ID, info.filename, "base", "en", info.content_hash)
+    return queue.store.claim_next()
+
+
+def transcript_dir_names(storage):
+    path = storage.path_builder.get_category_path(OWNER_ID, SOUL_ID, "transcripts")
+    return sorted(p.name for p in path.iterdir())
+
+
+def test_transcript_and_segments_are_committed_together(async_storage, storage):
+    """A completed job leaves both files and nothing staged."""
+    async def scenario():
+        queue = TranscriptionJobQueue(async_storage, FakeRunner())
+        job = claimed_job(queue, storage)
+        await queue._execute(job)
+        return queue.store.get(job.job_id)
+
+    job = asyncio.run(scenario())
+
+    assert job.status == STATUS_COMPLETED
+    assert transcript_dir_names(storage) == ["talk_transcript.jsonl", "talk_transcript.txt"]
+
+
+def test_failed_second_commit_rolls_back_the_first(async_storage, storage, monkeypatch):
+    """A failure while committing never leaves a transcript without its segments."""
+    storage.write_text(OWNER_ID, SOUL_ID, "talk_transcript.txt", "previous", "transcripts")
+    commit_staged = storage.commit_staged
+    calls = []
+
+    def failing_commit_staged(staging_path, file_path, *args):
+        if file_path.parent.name == "transcripts":
+            calls.append(file_path.name)
+        if file_path.name.endswith(".jsonl"):
+            raise OSError("disk full")
+        return commit_staged(staging_path, file_path, *args)
+
+    monkeypatch.setattr(storage, "commit_staged", failing_commit_staged)
+
+    async def scenario():
+        queue = TranscriptionJobQueue(async_storage, FakeRunner())
+        job = claimed_job(queue, storage)
+        await queue._execute(job)
+        return queue.store.get(job.job_id)
+
+    job = asyncio.run(scenario())
+
+    assert calls == ["talk_transcript.txt", "talk_transcript.jsonl"]
+    assert job.status == STATUS_FAILED
+    assert transcript_dir_names(storage) == ["talk_transcript.txt"]
+    with storage.open_file(OWNER_ID, SOUL_ID, "talk_transcript.txt", "transcripts") as f:
+        assert f.read() == b"previous"
+
+
+def test_cancelled_job_discards_staged_files(async_storage, storage):
+    """Stopping the queue mid-job removes the partially written transcript."""
+    async def scenario():
+        runner = FakeRunner(hang=True)
+        queue = TranscriptionJobQueue(async_storage, runner)
+        job = claimed_job(queue, storage)
+        task = asyncio.get_running_loop().create_task(queue._execute(job))
+        await asyncio.wait_for(runner.segments_written.wait(), 10)
+        assert any(name.endswith(".part") for name in transcript_dir_names(storage))
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(scenario())
+
+    assert transcript_dir_names(storage) == []
+
+
+def test_queued_job_survives_layout_migration(async_storage, storage):
+    """Jobs resolve their audio when they run, not when they are queued."""
+    async def scenario():
+        runner = FakeRunner()
+        queue = TranscriptionJobQueue(async_storage, runner)
+        job = claimed_job(queue, storage)
+
+        migrate_to_sharded(str(storage.data_dir))
+        storage.path_builder.layout = ScopedPathBuilder.LAYOUT_SHARDED
+        assert not storage.path_builder.flat_owner_path(OWNER_ID).exists()
+
+        await queue._execute(job)
+        return runner, queue.store.get(job.job_id)
+
+    runner, job = asyncio.run(scenario())
+
+    assert runner.read == [b"audio"]
+    assert job.status == STATUS_COMPLETED
+    assert job.transcript_path == "talk_transcript.txt"
+    assert "talk_transcript.txt" in transcript_dir_names(storage)
+
+
+def test_cached_result_is_committed_together(async_storage, storage, monkeypatch):
+    """A cache hit that fails to store its segments falls back to a queued job."""
+    storage.write_text(OWNER_ID, SOUL_ID, "talk_transcript.txt", "previous", "transcripts")
+    commit_staged = storage.commit_staged
+
+    def failing_commit_staged(staging_path, file_path, *args):
+        if file_path.name.endswith(".jsonl"):
+            raise OSError("disk full")
+        return commit_staged(staging_path, file_path, *args)
+
+    monkeypatch.setattr(storage, "commit_staged", failing_commit_staged)
+
+    async def scenario():
+        queue = TranscriptionJobQueue(async_storage, FakeRunner(), cache=FakeCache())
+        return await queue.submit(OWNER_ID, SOUL_ID, "talk.wav", "base", "en", "abc")
+
+    job = asyncio.run(scenario())
+
+    assert job.status == STATUS_QUEUED
+    assert transcript_dir_names(storage) == ["talk_transcript.txt"]
+    with storage.open_file(OWNER_ID, SOUL_ID, "talk_transcript.txt", "transcripts") as f:
+        assert f.read() == b"previous"
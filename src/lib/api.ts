@@ -1,4 +1,4 @@
-import type { TokenResponse, HealthResponse, ChatRequest, ChatResponse, FileInfo, UploadResponse, SoulStatus, TrainResponse, TranscribeRequest, TranscribeResponse } from './types';
+import type { TokenResponse, HealthResponse, ChatRequest, ChatResponse, FileInfo, UploadResponse, SoulStatus, TrainResponse, TranscribeRequest, TranscribeResponse, TranscriptionJob } from './types';
 import type { ModelsResponse } from './models';
 
 const API_BASE_URL = import.meta.env.VITE_API_BASE_URL ?? 'http://127.0.0.1:8000';
@@ -112,13 +112,25 @@ export async function trainSoul(ownerId: string, soulId: string): Promise<TrainR
   return apiFetch<TrainResponse>(`/souls/${ownerId}/${soulId}/train`, { method: 'POST' });
 }
 
-export async function transcribe(ownerId: string, soulId: string, request: TranscribeRequest): Promise<TranscribeResponse> {
-  return apiFetch<TranscribeResponse>(`/souls/${ownerId}/${soulId}/transcribe`, {
+export async function transcribe(ownerId: string, soulId: string, request: TranscribeRequest): Promise<TranscriptionJob> {
+  return apiFetch<TranscriptionJob>(`/souls/${ownerId}/${soulId}/transcribe`, {
     method: 'POST',
     body: JSON.stringify(request),
   });
 }
 
+export async function getTranscriptionJob(ownerId: string, soulId: string, jobId: string): Promise<TranscriptionJob> {
+  return apiFetch<TranscriptionJob>(`/souls/${ownerId}/${soulId}/transcriptions/${jobId}`);
+}
+
+export async function cancelTranscriptionJob(ownerId: string, soulId: string, jobId: string): Promise<TranscriptionJob> {
+  return apiFetch<TranscriptionJob>(`/souls/${ownerId}/${soulId}/transcriptions/${jobId}/cancel`, { method: 'POST' });
+}
+
+export async function getTranscriptionResult(ownerId: string, soulId: string, jobId: string): Promise<TranscribeResponse> {
+  return apiFetch<TranscribeResponse>(`/souls/${ownerId}/${soulId}/transcriptions/${jobId}/result`);
+}
+
 export const api = {
   login,
   logout,
@@ -132,6 +144,9 @@ export const api = {
   deleteFile,
   trainSoul,
   transcribe,
+  getTranscriptionJob,
+  cancelTranscriptionJob,
+  getTranscriptionResult,
   getToken,
   setTokens,
   clearToken,
@@ -67,4 +67,21 @@ export interface TranscribeResponse {
   text: string;
   segments: Array<{ start: number; end: number; text: string }>;
   text_path: string;
-}
\ No newline at end of file
+  duration?: number;
+  skipped_fraction?: number;
+}
+
+export interface TranscriptionJob {
+  job_id: string;
+  status: 'queued' | 'running' | 'completed' | 'failed' | 'cancelled';
+  progress: number;
+  file_path: string;
+  model: string;
+  language: string;
+  cancel_requested: boolean;
+  error: string | null;
+  text_path: string | null;
+  created_at: string;
+  started_at: string | null;
+  finished_at: string | null;
+}